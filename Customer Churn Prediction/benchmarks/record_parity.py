@@ -0,0 +1,112 @@
+import argparse
+import os
+import sys
+import warnings
+
+import numpy as np
+
+# Make `helper_functions` importable the same way app.py sees it
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'customer_churn_app'))
+
+from helper_functions.encode_record import encode_record  # noqa: E402
+from helper_functions.load_customers import load_customers  # noqa: E402
+from helper_functions.preprocess_data import preprocess_data  # noqa: E402
+from synthetic_data import make_customers  # noqa: E402
+
+#  python benchmarks/record_parity.py
+#  python benchmarks/record_parity.py --rows 1000000 --seed 7
+
+DATA_PATH = os.path.join(PROJECT_DIR, 'data', 'telco_customer_churn.csv')
+
+
+def with_edge_cases(data, seed=42):
+    """
+    Corrupts a share of the rows with the inputs that make `preprocess_data` drop rows or produce odd values:
+    out-of-range tenure, unknown contracts and labels, negative or tiny charges, and missing fields.
+
+    Args:
+        data (pd.DataFrame): Raw customer data
+        seed (int): Random seed
+
+    Returns:
+        pd.DataFrame: A corrupted copy
+    """
+    rng = np.random.default_rng(seed)
+    data = data.copy()
+    n_rows = len(data)
+
+    def some():
+        return rng.choice(n_rows, size=max(1, n_rows // 100))
+
+    data.loc[some(), 'tenure'] = rng.choice([-1, 0, 73, 80], size=len(some()))
+    data.loc[some(), 'Contract'] = 'Three year'
+    data.loc[some(), 'gender'] = 'Unknown'
+    data.loc[some(), 'TotalCharges'] = rng.uniform(-5, 5, size=len(some()))
+    data.loc[some(), 'MonthlyCharges'] = rng.uniform(-3, 3, size=len(some()))
+    data.loc[some(), 'Partner'] = None
+    return data
+
+
+def compare(data):
+    """
+    Checks `encode_record` against `preprocess_data` on every row.
+
+    Args:
+        data (pd.DataFrame): Raw customer data with numeric TotalCharges
+
+    Returns:
+        tuple: (rows compared, rows kept, mismatch descriptions)
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = preprocess_data(data.copy())
+
+    vectors = [encode_record(record) for record in data.to_dict('records')]
+    kept = [i for i, vector in enumerate(vectors) if vector is not None]
+
+    mismatches = []
+    if kept != list(expected.index):
+        disputed = sorted(set(kept) ^ set(expected.index))
+        mismatches.append(f"{len(disputed)} rows kept by only one path, e.g. {disputed[:5]}")
+        return len(data), len(kept), mismatches
+
+    actual = np.array([vectors[i] for i in kept]).reshape(len(kept), -1)
+    reference = expected.to_numpy()
+
+    # Bit-identical, with NaN equal to NaN
+    same = (actual == reference) | (np.isnan(actual) & np.isnan(reference))
+    for row, col in zip(*np.nonzero(~same)):
+        mismatches.append(f"row {kept[row]} feature {col}: {actual[row, col]!r} != {reference[row, col]!r}")
+
+    return len(data), len(kept), mismatches
+
+
+def main():
+    """
+    Command-line entry point: exit code 1 if the single-record path differs from `preprocess_data` anywhere.
+    """
+    parser = argparse.ArgumentParser(description="Check encode_record is bit-identical to preprocess_data.")
+    parser.add_argument('--rows', type=int, default=200000, help="synthetic rows to check (default: 200000)")
+    parser.add_argument('--seed', type=int, default=42, help="seed for the synthetic data (default: 42)")
+    args = parser.parse_args()
+
+    datasets = [('synthetic', with_edge_cases(make_customers(args.rows, seed=args.seed), seed=args.seed))]
+    if os.path.exists(DATA_PATH):
+        telco = load_customers(DATA_PATH, categorical=False)
+        datasets.insert(0, ('telco', telco))
+
+    failed = False
+    for name, data in datasets:
+        rows, kept, mismatches = compare(data)
+        print(f"{name:<10} {rows:>10,} rows  {kept:>10,} scored  {len(mismatches)} mismatches")
+        for mismatch in mismatches[:10]:
+            print(f"    {mismatch}")
+        failed |= bool(mismatches)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Make `helper_functions` importable the same way app.py sees it
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'customer_churn_app'))
+
+from helper_functions import feature_engineering as fe  # noqa: E402
+from helper_functions.create_feature_matrix import create_feature_matrix  # noqa: E402
+from helper_functions.encoder import encode_features  # noqa: E402
+from helper_functions.preprocess_data import preprocess_data  # noqa: E402
+from helper_functions.encode_record import encode_record  # noqa: E402
+from helper_functions.model_registry import MODEL_PATH, COMPILED_MODEL_PATH  # noqa: E402
+from synthetic_data import make_customers  # noqa: E402
+
+#  python benchmarks/run_benchmarks.py --output benchmarks/results/$(git rev-parse --short HEAD).json
+#  python benchmarks/run_benchmarks.py --sizes 10000 1000000 10000000 --stages monthly_plans billing_flag contract_progress
+#  python benchmarks/run_benchmarks.py --compare benchmarks/results/old.json --output new.json
+
+# One row (the app's per-submission latency) up to a million. The feature functions are also tracked at 10k, 1M and
+# 10M rows (the second usage line above); 10M is not a default because the whole-pipeline and per-record stages
+# need tens of GB at that size (e.g. 10M record dicts for `encode_record`).
+DEFAULT_SIZES = [1, 1000, 100000, 1000000]
+
+# The feature engineering steps in the order `create_feature_matrix` applies them
+FEATURE_STEPS = [
+    ('reduce_labels', fe.reduce_labels),
+    ('bin_tenure', fe.bin_tenure),
+    ('monthly_plans', fe.monthly_plans),
+    ('charge_diff', fe.charge_diff),
+    ('billing_flag', fe.billing_flag),
+    ('average_charges_per_month', fe.average_charges_per_month),
+    ('contract_loyalty', fe.contract_loyalty),
+    ('contract_progress', fe.contract_progress),
+    ('service_count', fe.service_count),
+    ('charge_tenure_ratio', fe.charge_tenure_ratio),
+    ('address_skewness', fe.address_skewness),
+    ('high_engagement_loyalty', fe.high_engagement_loyalty),
+    ('additional_features', fe.additional_features),
+]
+
+
+def time_call(func, make_input, repeats):
+    """
+    Times `func` on fresh inputs, excluding the time spent building each input.
+
+    Args:
+        func: Callable taking the input produced by `make_input`
+        make_input: Zero-argument callable returning a new input for every run
+        repeats (int): Number of timed runs
+
+    Returns:
+        list[float]: Wall time of each run, in seconds
+    """
+    timings = []
+    for _ in range(repeats):
+        arg = make_input()
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def repeats_for(n_rows):
+    """
+    Picks a number of timed runs that keeps small sizes statistically stable and large sizes affordable.
+    """
+    if n_rows <= 1000:
+        return 50
+    if n_rows <= 100000:
+        return 10
+    return 3
+
+
+def stage_benchmarks(raw, stage_filter=None):
+    """
+    Yields the (stage name, function, input factory) triples to time for one dataset, one stage at a time.
+
+    Stages are filtered before anything is built, and each stage's input (feature matrix, record list, ...) is only
+    built when that stage is reached and released when the next one is drawn, so a filtered run at large sizes only
+    materialises what it times. An input factory is therefore only valid until the next stage is drawn.
+
+    Each feature engineering step is timed on the output of the steps before it, exactly as it runs inside
+    `create_feature_matrix`.
+
+    Args:
+        raw (pd.DataFrame): Synthetic raw customer data
+        stage_filter (list[str] | None): Only yield stages whose name ends with one of these
+
+    Yields:
+        tuple: (stage, func, make_input)
+    """
+    def selected(stage):
+        return not stage_filter or any(stage.endswith(name) for name in stage_filter)
+
+    # Individual feature engineering steps, advancing the chain only as far as the last selected step. The timed
+    # runs work on copies, so the chain itself moves on only after the stage has been timed.
+    wanted = [i for i, (name, _) in enumerate(FEATURE_STEPS) if selected(f'feature_engineering.{name}')]
+    if wanted:
+        dataset = raw.copy()
+        for i, (name, step) in enumerate(FEATURE_STEPS[:wanted[-1] + 1]):
+            if i in wanted:
+                yield f'feature_engineering.{name}', step, lambda d=dataset: d.copy()
+            dataset = step(dataset)
+        del dataset
+
+    # Whole stages
+    if selected('create_feature_matrix'):
+        yield 'create_feature_matrix', create_feature_matrix, lambda: raw.copy()
+    if selected('encode_features'):
+        features = create_feature_matrix(raw.copy())
+        yield 'encode_features', encode_features, lambda: features.copy()
+        del features
+    if selected('preprocess_data'):
+        yield 'preprocess_data', preprocess_data, lambda: raw.copy()
+    if selected('preprocess_data[feature_plan]'):
+        yield 'preprocess_data[feature_plan]', lambda d: preprocess_data(d, feature_plan=True), lambda: raw.copy()
+    if selected('preprocess_data[low_memory]'):
+        yield 'preprocess_data[low_memory]', lambda d: preprocess_data(d, low_memory=True), lambda: raw.copy()
+
+    # The pandas-free single-record path, one record at a time
+    if selected('encode_record'):
+        records = raw.to_dict('records')
+        yield 'encode_record', lambda rs: [encode_record(r) for r in rs], lambda: records
+        del records
+
+    # End to end, only when the trained model (pickled or exported by src/tree_export.py) is available
+    if selected('predict_churn') and (os.path.exists(MODEL_PATH) or os.path.exists(COMPILED_MODEL_PATH)):
+        from helper_functions.predict_churn import predict_churn
+        yield 'predict_churn', predict_churn, lambda: raw.copy()
+
+
+def git_commit():
+    """
+    Returns the current commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_DIR, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, stage_filter=None, seed=42):
+    """
+    Runs every benchmark at every size.
+
+    Args:
+        sizes (list[int]): Row counts to benchmark
+        stage_filter (list[str] | None): Only run stages whose name ends with one of these
+        seed (int): Seed for the synthetic data
+
+    Returns:
+        dict: Machine-readable results, including environment metadata
+    """
+    results = []
+
+    # `create_feature_matrix` assigns to a filtered frame, which would flood the output with pandas warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', pd.errors.SettingWithCopyWarning)
+        for n_rows in sizes:
+            raw = make_customers(n_rows, seed=seed)
+            repeats = repeats_for(n_rows)
+
+            for stage, func, make_input in stage_benchmarks(raw, stage_filter):
+                timings = time_call(func, make_input, repeats)
+                result = {
+                    'stage': stage,
+                    'rows': n_rows,
+                    'repeats': repeats,
+                    'best_s': min(timings),
+                    'median_s': statistics.median(timings),
+                    'rows_per_s': n_rows / min(timings) if min(timings) > 0 else None,
+                }
+                results.append(result)
+                print(f"{stage:<50} {n_rows:>10,} rows  best {result['best_s'] * 1000:>10.3f} ms  "
+                      f"median {result['median_s'] * 1000:>10.3f} ms")
+
+    return {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compare(baseline, current):
+    """
+    Prints the median-time ratio of every stage/size present in both result files.
+
+    Args:
+        baseline (dict): Earlier results
+        current (dict): New results
+    """
+    before = {(r['stage'], r['rows']): r['median_s'] for r in baseline['results']}
+
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} (ratio > 1 = slower):")
+    for r in current['results']:
+        key = (r['stage'], r['rows'])
+        if key in before and before[key] > 0:
+            print(f"{r['stage']:<50} {r['rows']:>10,} rows  x{r['median_s'] / before[key]:.2f}")
+
+
+def main():
+    """
+    Command-line entry point for the benchmark suite.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark every stage of the churn inference pipeline.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"row counts to benchmark (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--stages', nargs='+', help="only run stages whose name ends with one of these")
+    parser.add_argument('--seed', type=int, default=42, help="seed for the synthetic data (default: 42)")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    report = run(args.sizes, stage_filter=args.stages, seed=args.seed)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(PROJECT_DIR, 'customer_churn_app')
+APP_PATH = os.path.join(APP_DIR, 'app.py')
+
+#  python benchmarks/startup_budget.py                      # imports app.py runs before its first render
+#  python benchmarks/startup_budget.py --budget-ms 800 --top 15
+#  python benchmarks/startup_budget.py --deferred            # also show what the first prediction imports
+
+# Modules app.py imports lazily, on the first prediction or in the background warm-up
+DEFERRED_MODULES = ['helper_functions.create_df', 'helper_functions.customer_store',
+                    'helper_functions.predict_record', 'helper_functions.prediction_log']
+
+
+def top_level_imports(path=APP_PATH):
+    """
+    Extracts the import statements a script runs at module level, i.e. before anything is rendered.
+
+    Args:
+        path (str): Python script to inspect
+
+    Returns:
+        list[str]: The import statements, as source code
+    """
+    with open(path) as f:
+        source = f.read()
+    return [ast.get_source_segment(source, node) for node in ast.parse(source).body
+            if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def import_times(statements, already_imported=()):
+    """
+    Runs import statements in a fresh interpreter with `-X importtime` and parses the report.
+
+    Args:
+        statements (list[str]): Import statements to time
+        already_imported (list[str]): Statements run first and excluded from the report (e.g. the startup imports,
+            when measuring what is deferred)
+
+    Returns:
+        list[tuple]: (module, nesting depth, self seconds, cumulative seconds) for every module imported, in
+            import order
+    """
+    # Only the imports after the marker are reported
+    marker = 'import sys; sys.stderr.write("--- measured ---\\n"); sys.stderr.flush()'
+    code = '\n'.join(list(already_imported) + [marker] + list(statements))
+
+    # `helper_functions` resolves the same way it does under `streamlit run`
+    python_path = os.pathsep.join(filter(None, [APP_DIR, os.environ.get('PYTHONPATH')]))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=PROJECT_DIR,
+                            env={**os.environ, 'PYTHONPATH': python_path}, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr[-2000:]}")
+
+    modules = []
+    for line in result.stderr.split('--- measured ---\n', 1)[-1].splitlines():
+        # import time:       self [us] |   cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), depth, int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return modules
+
+
+def report(title, modules, top):
+    """
+    Prints the total import time and the most expensive top-level modules.
+
+    Args:
+        title (str): Heading
+        modules (list[tuple]): Output of `import_times`
+        top (int): Number of modules to list
+
+    Returns:
+        float: Total import time in seconds
+    """
+    # Modules imported directly (no indentation) add up to the total; nested ones are already in their parents
+    roots = [(name, cumulative) for name, depth, _, cumulative in modules if depth == 0]
+    total = sum(cumulative for _, cumulative in roots)
+
+    print(f"\n{title}: {total * 1000:.1f} ms ({len(modules)} modules)")
+    for name, cumulative in sorted(roots, key=lambda item: -item[1])[:top]:
+        print(f"  {cumulative * 1000:>9.1f} ms  {name}")
+    return total
+
+
+def main():
+    """
+    Command-line entry point: report app.py's cold-start import time and check it against a budget.
+    """
+    parser = argparse.ArgumentParser(description="Measure the import time app.py pays before its first render.")
+    parser.add_argument('--budget-ms', type=float, default=1500.0,
+                        help="fail (exit code 1) if startup imports take longer than this (default: 1500)")
+    parser.add_argument('--top', type=int, default=10, help="number of modules to list (default: 10)")
+    parser.add_argument('--deferred', action='store_true',
+                        help="also report the imports deferred to the first prediction")
+    args = parser.parse_args()
+
+    startup = top_level_imports()
+    total = report("Imports before first render", import_times(startup), args.top)
+
+    if args.deferred:
+        deferred = [f"import {module}" for module in DEFERRED_MODULES]
+        report("Deferred to first prediction / warm-up", import_times(deferred, already_imported=startup), args.top)
+
+    if total * 1000 > args.budget_ms:
+        sys.exit(f"\nStartup imports exceed the {args.budget_ms:.0f} ms budget")
+    print(f"\nWithin the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+
+def make_customers(n_rows, seed=42):
+    """
+    Generates synthetic raw customer data shaped like `data/telco_customer_churn.csv`.
+
+    Values follow the real schema and label sets, including the dependencies between fields ('No phone service'
+    when there is no phone line, 'No internet service' when there is no internet) and a missing TotalCharges for
+    brand-new customers, so every branch of the feature pipeline is exercised.
+
+    Args:
+        n_rows (int): Number of customers to generate
+        seed (int): Random seed, so every run benchmarks the same data
+
+    Returns:
+        pd.DataFrame: Raw customer data with numeric TotalCharges (already coerced, as in the app)
+    """
+    rng = np.random.default_rng(seed)
+
+    def pick(values, p=None):
+        return rng.choice(np.array(values, dtype=object), size=n_rows, p=p)
+
+    tenure = rng.integers(0, 73, size=n_rows)
+    phone_service = pick(['Yes', 'No'], p=[0.9, 0.1])
+    internet_service = pick(['DSL', 'Fiber optic', 'No'], p=[0.34, 0.44, 0.22])
+
+    # Internet add-ons only exist for customers with internet
+    has_internet = internet_service != 'No'
+
+    def internet_addon():
+        return np.where(has_internet, pick(['Yes', 'No']), 'No internet service').astype(object)
+
+    monthly_charges = np.round(rng.uniform(18.25, 118.75, size=n_rows), 2)
+
+    # Total charges drift a little from monthly * tenure, covering every billing_flag outcome
+    total_charges = np.round(monthly_charges * tenure * rng.uniform(0.9, 1.1, size=n_rows), 2)
+    total_charges = np.where(tenure == 0, np.nan, total_charges)
+
+    return pd.DataFrame({
+        'customerID': [f'{i:04d}-SYNTH' for i in range(n_rows)],
+        'gender': pick(['Female', 'Male']),
+        'SeniorCitizen': rng.choice([0, 1], size=n_rows, p=[0.84, 0.16]),
+        'Partner': pick(['Yes', 'No']),
+        'Dependents': pick(['Yes', 'No'], p=[0.3, 0.7]),
+        'tenure': tenure,
+        'PhoneService': phone_service,
+        'MultipleLines': np.where(phone_service == 'Yes', pick(['Yes', 'No']), 'No phone service').astype(object),
+        'InternetService': internet_service,
+        'OnlineSecurity': internet_addon(),
+        'OnlineBackup': internet_addon(),
+        'DeviceProtection': internet_addon(),
+        'TechSupport': internet_addon(),
+        'StreamingTV': internet_addon(),
+        'StreamingMovies': internet_addon(),
+        'Contract': pick(['Month-to-month', 'One year', 'Two year'], p=[0.55, 0.21, 0.24]),
+        'PaperlessBilling': pick(['Yes', 'No'], p=[0.59, 0.41]),
+        'PaymentMethod': pick(['Electronic check', 'Mailed check', 'Bank transfer (automatic)',
+                               'Credit card (automatic)']),
+        'MonthlyCharges': monthly_charges,
+        'TotalCharges': total_charges,
+    })
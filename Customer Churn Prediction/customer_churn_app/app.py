@@ -1,10 +1,12 @@
 import streamlit as st
 
 from helper_functions.load_css import load_css
-from helper_functions.create_df import create_df
 from helper_functions.generateCustomerID import generateCustomerID
-from helper_functions.write_to_csv import write_to_csv
-from helper_functions.predict_churn import predict_churn
+from helper_functions.model_registry import warm_up
+
+# pandas, pyarrow and the model libraries are imported when a prediction is first needed (or by the background
+# warm-up started after the page is drawn), so they never delay the first render of a fresh worker.
+# Measure the import cost before the first render with: python benchmarks/startup_budget.py
 
 #  streamlit run customer_churn_app/app.py
 
@@ -44,6 +46,13 @@ st.set_page_config(
     }
 )
 
+# Merge the prediction log's small segments in the background, once per process (started with the first append)
+@st.cache_resource
+def start_prediction_log_compaction():
+    from helper_functions.prediction_log import start_compaction
+    return start_compaction()
+
+
 # Load CSS
 load_css('customer_churn_app/style.css')
 
@@ -362,23 +371,40 @@ with (tab3):
                 # All required field are filled, proceed with prediction
                 st.write("Running churn prediction...")
 
+                # Heavy imports happen here on first use (already done if the background warm-up has finished)
+                from helper_functions.create_df import create_df
+                from helper_functions.customer_store import get_customer_store
+                from helper_functions.predict_record import predict_record
+                from helper_functions.prediction_log import get_prediction_log
+
                 df = create_df(st.session_state.customer_id, gender, senior_citizen, partner, dependents, tenure,
                                phone_service,
                                multiple_lines, internet_service, online_security, online_backup, device_protection,
                                tech_support, streaming_tv, streaming_movies, contract, paperless_billing,
                                payment_method,
                                monthly_charges, total_charges)
-                write_to_csv(df)
+
+                # Upsert the customer's latest inputs, keeping their previous score (if any) to compare against
+                store = get_customer_store()
+                previous = store.last_score(st.session_state.customer_id)
+                store.upsert(df)
 
                 st.success("✅ Customer data saved successfully!")
 
                 try:
-                    churn_label = predict_churn(df)
+                    # Single-customer fast path: features straight from the raw fields, no DataFrame pipeline
+                    result = predict_record(df.to_dict('records')[0])
+                    if result is None:
+                        raise ValueError("these customer details cannot be scored (check tenure and charges)")
+                    prob, pred = result
 
-                    prob = churn_label[0][0]
-                    pred = churn_label[1][0]
+                    # Record the customer and their score in the columnar prediction log
+                    get_prediction_log().append(df, [prob], [pred])
+                    start_prediction_log_compaction()
+                    store.record_scores([st.session_state.customer_id], [prob], [pred])
 
-                    st.metric("Churn probability", f"{prob * 100:.2f}%")
+                    delta = None if previous is None else f"{(prob - previous[0]) * 100:+.2f} pts since last score"
+                    st.metric("Churn probability", f"{prob * 100:.2f}%", delta=delta, delta_color='inverse')
 
                     if pred == 1:
                         st.error("🚨Customer is **likely to churn**")
@@ -387,3 +413,15 @@ with (tab3):
 
                 except Exception as e:
                     st.error(f"⚠️Prediction failed: {e}")
+
+
+# Runs once the page above has been sent to the browser.
+# Import the prediction code and load the model in the background once per process, so the first "Predict Churn"
+# click is fast
+@st.cache_resource
+def start_model_warm_up():
+    return warm_up(modules=['helper_functions.create_df', 'helper_functions.predict_record',
+                            'helper_functions.prediction_log', 'helper_functions.customer_store'])
+
+
+start_model_warm_up()
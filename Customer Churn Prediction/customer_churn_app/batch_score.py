@@ -0,0 +1,111 @@
+import argparse
+import os
+
+from helper_functions.score_frame import score_frame
+from helper_functions.customer_store import CUSTOMER_FIELDS, CustomerStore
+from helper_functions.load_customers import load_customers
+
+#  python customer_churn_app/batch_score.py data/telco_customer_churn.csv predictions.csv --chunksize 50000
+#  python customer_churn_app/batch_score.py data/telco_customer_churn.csv predictions.csv --store customer_store.db
+
+
+def batch_score(input_path, output_path, chunksize=50000, feature_plan=False, low_memory=False, store_path=None):
+    """
+    Scores a raw Telco customer CSV chunk by chunk and streams the results to another CSV.
+
+    Only one chunk is held in memory at a time, so memory use stays flat regardless of file size. The output has
+    one row per scored customer with the columns `customerID, probability, prediction`. Customers that cannot be
+    scored (e.g. blank TotalCharges) are left out and counted.
+
+    Args:
+        input_path (str): CSV shaped like `data/telco_customer_churn.csv` (a `Churn` column is ignored)
+        output_path (str): Destination CSV, overwritten if it exists
+        chunksize (int): Number of rows read and scored per chunk
+        feature_plan (bool): If True, only the engineered features the model consumes are computed
+        low_memory (bool): If True, parse string fields as Categoricals and preprocess without intermediate copies
+        store_path (str | None): If given, also upsert every scored customer's inputs and score into this customer
+            store, one transaction per chunk
+
+    Returns:
+        dict: Number of rows read, scored and skipped, plus the peak bytes per stage in low-memory mode
+    """
+    rows_read = 0
+    rows_scored = 0
+
+    # Peak allocation per preprocessing stage, across all chunks (low-memory mode only)
+    memory_report = {} if low_memory else None
+
+    store = CustomerStore(store_path, batch_size=chunksize) if store_path else None
+
+    # Write to a temporary file first so a failed run never leaves a half-written output behind
+    tmp_path = f"{output_path}.tmp"
+
+    try:
+        with open(tmp_path, 'w', newline='') as out:
+            # Header written once; every chunk after that is appended
+            out.write('customerID,probability,prediction\n')
+
+            # Typed parse; blank or malformed TotalCharges become NaN and the row is skipped, never the whole job
+            for chunk in load_customers(input_path, categorical=low_memory, chunksize=chunksize, strict=False):
+                rows_read += len(chunk)
+
+                # Keep the IDs aside: preprocessing drops the customerID column but keeps the row index
+                customer_ids = chunk['customerID']
+
+                # Preprocessing transforms the charge columns in place, so keep the raw inputs for the store
+                if store is not None:
+                    customers = chunk[[col for col in CUSTOMER_FIELDS if col in chunk.columns]].copy()
+
+                scores = score_frame(chunk, feature_plan=feature_plan, low_memory=low_memory,
+                                     memory_report=memory_report)
+                scores.insert(0, 'customerID', customer_ids.loc[scores.index])
+
+                scores.to_csv(out, header=False, index=False)
+                rows_scored += len(scores)
+
+                if store is not None:
+                    store.upsert(customers.loc[scores.index], scores['probability'], scores['prediction'])
+
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        # Nothing of a failed run is left behind, not even the temporary file
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        if store is not None:
+            store.close()
+
+    summary = {'rows_read': rows_read, 'rows_scored': rows_scored, 'rows_skipped': rows_read - rows_scored}
+    if memory_report is not None:
+        summary['peak_memory'] = memory_report
+    return summary
+
+
+def main():
+    """
+    Command-line entry point for nightly batch scoring.
+    """
+    parser = argparse.ArgumentParser(description="Score a Telco customer CSV for churn in fixed-size chunks.")
+    parser.add_argument('input', help="CSV of raw customer data, e.g. data/telco_customer_churn.csv")
+    parser.add_argument('output', help="CSV to write customerID, probability, prediction to")
+    parser.add_argument('--chunksize', type=int, default=50000, help="rows scored per chunk (default: 50000)")
+    parser.add_argument('--feature-plan', action='store_true',
+                        help="compute only the engineered features the model consumes")
+    parser.add_argument('--low-memory', action='store_true',
+                        help="categorical dtypes, no intermediate copies; reports peak memory per stage")
+    parser.add_argument('--store', help="also upsert each customer's inputs and latest score into this SQLite store")
+    args = parser.parse_args()
+
+    summary = batch_score(args.input, args.output, chunksize=args.chunksize, feature_plan=args.feature_plan,
+                          low_memory=args.low_memory, store_path=args.store)
+    print(f"Scored {summary['rows_scored']} of {summary['rows_read']} customers "
+          f"({summary['rows_skipped']} skipped) -> {args.output}")
+
+    # Peak memory per preprocessing stage (largest chunk)
+    for stage, peak in summary.get('peak_memory', {}).items():
+        print(f"   {stage}: {peak / 2 ** 20:.1f} MiB peak")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+from helper_functions.model_features import model_feature_sets
+from helper_functions.model_registry import APP_DIR, load_artifact
+from helper_functions.instrumentation import record, timed_stage
+
+logger = logging.getLogger(__name__)
+
+# Individually trained classifiers (project root saved_models/) and the feature set each was trained on
+SAVED_MODELS_DIR = os.path.join(os.path.dirname(APP_DIR), 'saved_models')
+COMPARISON_MODELS = {
+    'LogisticRegression': 'linear',
+    'SVC': 'linear',
+    'DecisionTreeClassifier': 'tree',
+    'XGBClassifier': 'tree',
+    'LGBMClassifier': 'tree',
+    'CatBoostClassifier': 'tree',
+}
+
+# Shared pool, one thread per model: the boosters and scikit-learn's compiled code release the GIL while predicting,
+# so a comparison takes as long as the slowest model rather than the sum of all of them
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """
+    Returns the process-wide comparison thread pool, created on first use.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=len(COMPARISON_MODELS), thread_name_prefix='compare')
+    return _executor
+
+
+def _score_model(name, X):
+    """
+    Loads one saved model and scores a feature matrix with it.
+
+    Models without `predict_proba` (the SVC was trained with `probability=False`) return their decision function
+    instead, a signed margin rather than a probability.
+
+    Returns:
+        np.ndarray: One score per row
+    """
+    model = load_artifact(os.path.join(SAVED_MODELS_DIR, f'{name}.pkl'))
+
+    # The models were fitted on NumPy arrays, so they are given one
+    values = X.to_numpy()
+    if len(values) == 0:
+        return np.empty(0)
+    with timed_stage(f'compare.{name}', rows=len(values)):
+        if hasattr(model, 'predict_proba'):
+            return np.asarray(model.predict_proba(values))[:, 1]
+        return np.asarray(model.decision_function(values))
+
+
+def submit_comparison(data, models=None):
+    """
+    Starts scoring one batch with every saved model concurrently and returns without waiting.
+
+    Use this for shadow scoring: the caller serves its own prediction and the candidates finish in the background.
+
+    Args:
+        data (pd.DataFrame): Raw customer data with the columns produced by `create_df` (not modified)
+        models (list[str] | None): Subset of `COMPARISON_MODELS`; all of them when None
+
+    Returns:
+        tuple: (scored row index, dict of model name -> Future resolving to that model's scores)
+    """
+    X_tree, X_linear = model_feature_sets(data)
+    feature_sets = {'tree': X_tree, 'linear': X_linear}
+
+    executor = _get_executor()
+    futures = {name: executor.submit(_score_model, name, feature_sets[COMPARISON_MODELS[name]])
+               for name in (models or COMPARISON_MODELS)}
+    return X_tree.index, futures
+
+
+def compare_models(data, models=None, timeout=None):
+    """
+    Scores one batch with every saved model concurrently and returns the results side by side.
+
+    A model that fails or does not finish within `timeout` gets a column of NaN (and a logged warning) rather than
+    failing or holding up the comparison; it keeps running in the pool and warms its cache for the next call.
+
+    Args:
+        data (pd.DataFrame): Raw customer data with the columns produced by `create_df` (not modified)
+        models (list[str] | None): Subset of `COMPARISON_MODELS`; all of them when None
+        timeout (float | None): Longest time (seconds) to wait for the slowest model
+
+    Returns:
+        pd.DataFrame: One column of scores per model, indexed like the rows of `data` that survive preprocessing
+    """
+    start = time.perf_counter()
+    index, futures = submit_comparison(data, models)
+    wait(futures.values(), timeout=timeout)
+
+    results = pd.DataFrame(index=index)
+    for name, future in futures.items():
+        if not future.done():
+            logger.warning("%s did not finish within %.3f s; left out of the comparison", name, timeout)
+            results[name] = np.nan
+        elif future.exception() is not None:
+            logger.warning("%s failed: %s", name, future.exception())
+            results[name] = np.nan
+        else:
+            results[name] = future.result()
+
+    record('compare_models', time.perf_counter() - start, len(index))
+    return results
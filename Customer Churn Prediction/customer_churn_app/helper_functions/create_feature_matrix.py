@@ -1,10 +1,11 @@
 from helper_functions.feature_engineering import (reduce_labels, bin_tenure, monthly_plans, charge_diff, billing_flag, average_charges_per_month,
-                                                                     contract_loyalty, contract_length, contract_progress,
+                                                                     contract_loyalty, contract_lengths, contract_progress,
                                                                      service_count, charge_tenure_ratio, address_skewness,
                                                                      high_engagement_loyalty, additional_features)
+from helper_functions.feature_plan import run_feature_plan
 import numpy as np
 
-def create_feature_matrix(data):
+def create_feature_matrix(data, features=None):
     """
     Transforms raw customer data into a feature matrix for encoding.
 
@@ -12,11 +13,17 @@ def create_feature_matrix(data):
 
     Args:
         data: Raw customer data containing demographic, service, and billing information.
+        features: Optional list of output columns. When given, only the steps these columns depend on are run
+            (see `feature_plan.run_feature_plan`) and only these columns are returned.
 
     Returns:
         X_untransformed: Feature matrix ready for encoding and transformation
     """
 
+    # Feature-plan mode: compute only what was asked for
+    if features is not None:
+        return run_feature_plan(data, features)
+
     # Apply sequential feature engineering transformations
     dataset = reduce_labels(data)                   # Simplify categorical labels
     dataset = bin_tenure(dataset)                   # Group tenure into meaningful ranges
@@ -25,7 +32,7 @@ def create_feature_matrix(data):
     dataset = billing_flag(dataset)                 # Create billing_related flags
     dataset = average_charges_per_month(dataset)    # Compute average monthly charges
     dataset = contract_loyalty(dataset)             # Generate contract loyalty indicators
-    dataset['contract_length'] = dataset['Contract'].apply(contract_length)     # Calculate contract duration
+    dataset['contract_length'] = contract_lengths(dataset['Contract'])          # Calculate contract duration
     dataset = contract_progress(dataset)            # Measures progress through contract term
     dataset = service_count(dataset)                # Count total services subscribed
     dataset = charge_tenure_ratio(dataset)          # Compute charge-to-tenure ratio
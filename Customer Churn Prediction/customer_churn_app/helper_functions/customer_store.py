@@ -0,0 +1,272 @@
+import atexit
+import csv
+import logging
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from helper_functions.instrumentation import timed_stage
+from helper_functions.write_to_csv import DATA_PATH as CSV_PATH
+
+logger = logging.getLogger(__name__)
+
+# SQLite database next to app.py, replacing the append-only `customer_data.csv`
+STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'customer_store.db')
+
+# Raw customer fields, in `create_df` order, with their SQLite types
+CUSTOMER_COLUMNS = [
+    ('customerID', 'TEXT'),
+    ('gender', 'TEXT'),
+    ('SeniorCitizen', 'INTEGER'),
+    ('Partner', 'TEXT'),
+    ('Dependents', 'TEXT'),
+    ('tenure', 'INTEGER'),
+    ('PhoneService', 'TEXT'),
+    ('MultipleLines', 'TEXT'),
+    ('InternetService', 'TEXT'),
+    ('OnlineSecurity', 'TEXT'),
+    ('OnlineBackup', 'TEXT'),
+    ('DeviceProtection', 'TEXT'),
+    ('TechSupport', 'TEXT'),
+    ('StreamingTV', 'TEXT'),
+    ('StreamingMovies', 'TEXT'),
+    ('Contract', 'TEXT'),
+    ('PaperlessBilling', 'TEXT'),
+    ('PaymentMethod', 'TEXT'),
+    ('MonthlyCharges', 'REAL'),
+    ('TotalCharges', 'REAL'),
+]
+CUSTOMER_FIELDS = [name for name, _ in CUSTOMER_COLUMNS]
+
+# Latest score of each customer; NULL until the current inputs have been scored
+SCORE_FIELDS = ['probability', 'prediction', 'scored_at']
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS customers (
+    customerID TEXT PRIMARY KEY,
+    {', '.join(f'{name} {kind}' for name, kind in CUSTOMER_COLUMNS[1:])},
+    probability REAL,
+    prediction INTEGER,
+    scored_at TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS customers_probability ON customers (probability);
+"""
+
+
+def _column_values(frame, columns):
+    """
+    Converts DataFrame columns to rows of plain Python values (NaN -> None) that sqlite3 can bind.
+    """
+    values = [frame[col].astype(object).where(frame[col].notna(), None).tolist() if col in frame.columns
+              else [None] * len(frame) for col in columns]
+    return list(zip(*values))
+
+
+class CustomerStore:
+    """
+    SQLite store of submitted customers, one row per `customerID`.
+
+    Each customer's latest inputs and latest score overwrite the previous ones (upsert), so the table never holds
+    duplicates. The primary key and an index on `probability` make "last score of this customer" and "customers in
+    this score range" B-tree lookups instead of file scans. The database runs in WAL mode, so readers in other
+    processes (batch jobs) are never blocked by a writer.
+
+    Within a process every thread shares one connection behind a lock. Streamlit runs each rerun on a new thread, so
+    a connection per thread would leak one (with its file descriptor and WAL mapping) per interaction; the queries are
+    primary-key and index lookups, so serialising them costs next to nothing.
+    """
+
+    def __init__(self, path=STORE_PATH, timeout=30.0, batch_size=10000):
+        """
+        Args:
+            path (str): Database file (created with the schema if missing)
+            timeout (float): Seconds to wait for another process's write lock
+            batch_size (int): Rows written per transaction by `upsert`
+        """
+        self.path = path
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self._conn = None
+        self._lock = threading.RLock()
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executescript(SCHEMA)
+
+    def _connection(self):
+        """
+        Returns the shared connection, opening it (in WAL mode) on first use. Callers must hold `self._lock`.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            # With WAL, NORMAL only syncs at checkpoints: a crash can lose the last commits but never corrupts
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn = conn
+        return self._conn
+
+    def upsert(self, customers, probabilities=None, predictions=None):
+        """
+        Inserts customers, or replaces the stored inputs of those already present.
+
+        Without scores, the stored score of each customer is cleared (it belonged to the previous inputs). Rows are
+        written `batch_size` at a time, one transaction per batch; a later row with the same ID wins.
+
+        Args:
+            customers (pd.DataFrame): Raw customer fields with a `customerID` column (extra columns are ignored)
+            probabilities: Churn probability per row, or None
+            predictions: Binary churn prediction per row, or None
+        """
+        now = pd.Timestamp.now(tz='UTC').isoformat()
+        rows = customers.reset_index(drop=True)
+        if probabilities is not None:
+            rows = rows.assign(probability=list(probabilities), prediction=list(predictions), scored_at=now)
+
+        fields = CUSTOMER_FIELDS + SCORE_FIELDS
+        values = [row + (now,) for row in _column_values(rows, fields)]
+        assignments = ', '.join(f'{col} = excluded.{col}' for col in fields[1:] + ['updated_at'])
+        statement = (f"INSERT INTO customers ({', '.join(fields)}, updated_at) "
+                     f"VALUES ({', '.join('?' * (len(fields) + 1))}) "
+                     f"ON CONFLICT (customerID) DO UPDATE SET {assignments}")
+
+        with self._lock, timed_stage('customer_store_upsert', rows=len(values)):
+            conn = self._connection()
+            for start in range(0, len(values), self.batch_size):
+                with conn:
+                    conn.executemany(statement, values[start:start + self.batch_size])
+
+    def record_scores(self, customer_ids, probabilities, predictions):
+        """
+        Sets the latest score of customers whose inputs are already stored.
+
+        Args:
+            customer_ids (list[str]): Customer IDs
+            probabilities: Churn probability per customer
+            predictions: Binary churn prediction per customer
+        """
+        now = pd.Timestamp.now(tz='UTC').isoformat()
+        values = [(float(prob), int(pred), now, now, customer_id)
+                  for customer_id, prob, pred in zip(customer_ids, probabilities, predictions)]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany("UPDATE customers SET probability = ?, prediction = ?, scored_at = ?, updated_at = ? "
+                                 "WHERE customerID = ?", values)
+
+    def get_customer(self, customer_id):
+        """
+        Latest inputs and score of one customer.
+
+        Args:
+            customer_id (str): Customer ID
+
+        Returns:
+            dict | None: Stored fields, or None for an unknown customer
+        """
+        with self._lock:
+            cursor = self._connection().execute("SELECT * FROM customers WHERE customerID = ?", (customer_id,))
+            row = cursor.fetchone()
+        return None if row is None else dict(zip([col[0] for col in cursor.description], row))
+
+    def last_score(self, customer_id):
+        """
+        Latest score of one customer (a primary-key lookup).
+
+        Args:
+            customer_id (str): Customer ID
+
+        Returns:
+            tuple | None: (probability, prediction, scored_at ISO timestamp), or None if the customer is unknown or
+            their current inputs have not been scored
+        """
+        with self._lock:
+            return self._connection().execute("SELECT probability, prediction, scored_at FROM customers "
+                                              "WHERE customerID = ? AND probability IS NOT NULL",
+                                              (customer_id,)).fetchone()
+
+    def customers_by_score(self, low=0.0, high=1.0, limit=None):
+        """
+        Customers whose latest probability lies in [low, high], highest first (an index range scan).
+
+        Args:
+            low (float): Lowest probability
+            high (float): Highest probability
+            limit (int | None): Maximum number of customers returned
+
+        Returns:
+            pd.DataFrame: Stored fields of the matching customers
+        """
+        query = "SELECT * FROM customers WHERE probability BETWEEN ? AND ? ORDER BY probability DESC"
+        params = [low, high]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return pd.read_sql_query(query, self._connection(), params=params)
+
+    def __len__(self):
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+
+    def import_csv(self, path=CSV_PATH):
+        """
+        Loads a `customer_data.csv` written by `write_to_csv` (with or without a header); repeated IDs keep their
+        last row.
+
+        Args:
+            path (str): CSV of raw customer fields in `create_df` order
+
+        Returns:
+            int: Number of rows read
+        """
+        with open(path, newline='') as f:
+            first = next(csv.reader(f), None)
+        header = 0 if first and first[0] == 'customerID' else None
+        data = pd.read_csv(path, header=header, names=CUSTOMER_FIELDS, dtype={'customerID': str})
+        data['TotalCharges'] = pd.to_numeric(data['TotalCharges'], errors='coerce')
+        self.upsert(data)
+        return len(data)
+
+    def close(self):
+        """
+        Closes the shared connection (it is reopened if the store is used again).
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Process-wide store shared by every session, created on first use
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_customer_store():
+    """
+    Returns the process-wide customer store, creating the database on first use.
+
+    A new database is seeded from an existing `customer_data.csv`, so customers submitted before the store existed
+    keep their latest inputs.
+
+    Returns:
+        CustomerStore: The shared store (closed automatically at interpreter exit)
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                is_new = not os.path.exists(STORE_PATH)
+                store = CustomerStore()
+                if is_new and os.path.exists(CSV_PATH):
+                    try:
+                        logger.info("Imported %d rows from %s", store.import_csv(CSV_PATH), CSV_PATH)
+                    except Exception as e:
+                        logger.warning("Could not import %s into the customer store: %s", CSV_PATH, e)
+                atexit.register(store.close)
+                _store = store
+    return _store
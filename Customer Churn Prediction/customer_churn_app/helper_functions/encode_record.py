@@ -0,0 +1,141 @@
+import math
+
+import numpy as np
+
+# Raw fields of one customer (the columns `create_df` produces)
+CUSTOMER_FIELDS = ['customerID', 'gender', 'SeniorCitizen', 'Partner', 'Dependents', 'tenure', 'PhoneService',
+                   'MultipleLines', 'InternetService', 'OnlineSecurity', 'OnlineBackup', 'DeviceProtection',
+                   'TechSupport', 'StreamingTV', 'StreamingMovies', 'Contract', 'PaperlessBilling', 'PaymentMethod',
+                   'MonthlyCharges', 'TotalCharges']
+
+# Fields that must be numeric
+NUMERIC_FIELDS = ['SeniorCitizen', 'tenure', 'MonthlyCharges', 'TotalCharges']
+
+# Services counted by `service_count`, and the security add-ons counted by `security_bundle`
+SERVICE_FIELDS = ['PhoneService', 'MultipleLines', 'OnlineSecurity', 'OnlineBackup', 'DeviceProtection',
+                  'TechSupport', 'StreamingTV', 'StreamingMovies']
+SECURITY_FIELDS = ['OnlineSecurity', 'OnlineBackup', 'DeviceProtection', 'TechSupport']
+
+# Encodings used by `contract_lengths` and `encode_features`
+CONTRACT_LENGTHS = {'Month-to-month': 1, 'One year': 12, 'Two year': 24}
+CONTRACT_CODES = {'Month-to-month': 0, 'One year': 1, 'Two year': 2}
+GENDER_CODES = {'Female': 0, 'Male': 1}
+PAPERLESS_CODES = {'No': 0, 'Yes': 1}
+
+NAN = float('nan')
+
+
+def _number(value):
+    """
+    Converts a numeric field to float the way `pd.to_numeric(errors='coerce')` does (None/junk become NaN).
+    """
+    if value is None:
+        return NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def _is_missing(value):
+    """
+    True for the values `dropna` removes: None and NaN.
+    """
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _divide(a, b):
+    """
+    Float division with NumPy semantics: x/0 is +-inf and 0/0 is NaN instead of an exception.
+    """
+    if b == 0:
+        if a == 0 or a != a:
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+def _round2(x):
+    """
+    `np.round(x, 2)` for a scalar: scale by 100, round half to even, scale back (not Python's decimal-exact round).
+    """
+    if not math.isfinite(x):
+        return x
+    return round(x * 100.0) / 100.0
+
+
+def encode_record(record):
+    """
+    Turns one raw customer record into the 20 model features without pandas.
+
+    Computes exactly what `preprocess_data` produces for a one-row DataFrame - same feature order, same NumPy
+    rounding and log semantics (including the double log of the charges applied by `address_skewness`) - at a
+    fraction of the cost. Logs go through `np.log1p` rather than `math.log1p`, because NumPy's SIMD implementation
+    can differ from the C library in the last bit.
+
+    Like `preprocess_data`, a record that would be dropped as incomplete or invalid (a missing field, tenure outside
+    0-72, an unknown contract, zero tenure with zero charges, ...) yields None.
+
+    Args:
+        record (dict): Raw customer fields keyed like `CUSTOMER_FIELDS`
+
+    Returns:
+        list[float] | None: Feature vector in `EXPECTED_FEATURES` order, or None if the record cannot be scored
+    """
+    values = {field: record.get(field) for field in CUSTOMER_FIELDS}
+    for field in NUMERIC_FIELDS:
+        values[field] = _number(values[field])
+
+    # `dropna` removes rows with any missing raw field
+    if any(_is_missing(value) for value in values.values()):
+        return None
+
+    senior = values['SeniorCitizen']
+    tenure = values['tenure']
+    monthly = values['MonthlyCharges']
+    total = values['TotalCharges']
+    contract = values['Contract']
+
+    # `bin_tenure` leaves tenure outside [0, 73) unbinned (NaN), and `contract_lengths` unknown contracts
+    if not 0 <= tenure < 73 or contract not in CONTRACT_LENGTHS:
+        return None
+    contract_length = CONTRACT_LENGTHS[contract]
+
+    average_charges = _round2(_divide(total, tenure))
+    contract_progress = _round2(tenure / contract_length)
+    charge_tenure_ratio = _round2(_divide(monthly, tenure + 1))
+
+    # `address_skewness` logs the charges in place; the *_log features are computed from those values
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio_logged, monthly_logged, total_logged = np.log1p([charge_tenure_ratio, monthly, total]).tolist()
+        monthly_log, total_log = np.log1p([monthly_logged, total_logged]).tolist()
+    charge_tenure_ratio_log = _round2(ratio_logged)
+
+    # Any NaN among the engineered features drops the row too
+    if any(value != value for value in (average_charges, charge_tenure_ratio_log, monthly_logged, total_logged)):
+        return None
+
+    def yes(field):
+        return values[field] == 'Yes'
+
+    is_long_contract = contract in ('One year', 'Two year')
+
+    return [
+        senior,                                                     # SeniorCitizen
+        tenure,                                                     # tenure
+        monthly_log,                                                # MonthlyCharges_log
+        total_log,                                                  # TotalCharges_log
+        average_charges,                                            # average_charges_per_month
+        float(contract != 'Month-to-month' and tenure > 12),        # contract_loyalty
+        contract_progress,                                          # contract_progress
+        float(sum(yes(field) for field in SERVICE_FIELDS)),         # ServiceCount
+        charge_tenure_ratio_log,                                    # charge_tenure_ratio_log
+        float(sum(yes(field) for field in SECURITY_FIELDS)),        # security_bundle
+        float(is_long_contract),                                    # is_long_contract
+        float(yes('Partner') or yes('Dependents')),                 # family_flag
+        float(CONTRACT_CODES[contract]),                            # Contract
+        float(GENDER_CODES.get(values['gender'], 0)),               # gender
+        float(PAPERLESS_CODES.get(values['PaperlessBilling'], 0)),  # PaperlessBilling
+        # The one-hot columns are never produced by the feature pipeline, so `encode_features` defaults them to 0
+        0.0, 0.0, 0.0, 0.0, 0.0,
+    ]
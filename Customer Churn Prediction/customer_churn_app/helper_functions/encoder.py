@@ -1,5 +1,21 @@
+import logging
+
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# The EXACT 20 features the model expects, in training order
+EXPECTED_FEATURES = [
+    'SeniorCitizen', 'tenure', 'MonthlyCharges_log', 'TotalCharges_log',
+    'average_charges_per_month', 'contract_loyalty', 'contract_progress',
+    'ServiceCount', 'charge_tenure_ratio_log', 'security_bundle', 'is_long_contract',
+    'family_flag', 'Contract', 'gender', 'PaperlessBilling',
+    'InternetService_Fiber optic', 'OnlineSecurity_No',
+    'TechSupport_No', 'PaymentMethod_Electronic check',
+    'billing_flag_partial_month'
+]
+
+
 def encode_features(data):
     """
     Encodes features for model prediction compatibility.
@@ -14,16 +30,8 @@ def encode_features(data):
         pd.DataFrame: Encoded features with exactly 20 columns in expected order
     """
 
-    # Define the EXACT 20 features your model expects with proper encoding
-    expected_features = [
-        'SeniorCitizen', 'tenure', 'MonthlyCharges_log', 'TotalCharges_log',
-        'average_charges_per_month', 'contract_loyalty', 'contract_progress',
-        'ServiceCount', 'charge_tenure_ratio_log', 'security_bundle', 'is_long_contract',
-        'family_flag', 'Contract', 'gender', 'PaperlessBilling',
-        'InternetService_Fiber optic', 'OnlineSecurity_No',
-        'TechSupport_No', 'PaymentMethod_Electronic check',
-        'billing_flag_partial_month'
-    ]
+    # The EXACT 20 features your model expects with proper encoding
+    expected_features = EXPECTED_FEATURES
 
     # Create a new DataFrame with only numerical values
     X = pd.DataFrame(index=data.index)
@@ -79,17 +87,16 @@ def encode_features(data):
     # Convert any remaining object types to numeric, coercing errors to NaN then filling with 0
     for col in X.columns:
         if X[col].dtype == 'object':
-            print(f"Warning: Column {col} is still object type, converting to numeric")
+            logger.warning("Column %s is still object type, converting to numeric", col)
             X[col] = pd.to_numeric(X[col], errors='coerce').fillna(0)
 
     # Ensure the features are in the exact order expected by the model
     # Model training was done with features in this specific order
     X = X[expected_features]
 
-    # Debug output: Display final data types for verification
-    print(f"✅ Encoded features. Final dtypes:")
-    for col in X.columns:
-        print(f"   {col}: {X[col].dtype}")
+    # Debug output: Display final data types for verification (skipped entirely unless debug logging is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Encoded features. Final dtypes: %s", dict(X.dtypes.astype(str)))
 
     return X
 
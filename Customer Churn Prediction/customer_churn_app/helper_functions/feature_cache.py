@@ -0,0 +1,99 @@
+import hashlib
+import logging
+import os
+
+import pandas as pd
+
+from helper_functions import create_feature_matrix as create_feature_matrix_module
+from helper_functions import feature_engineering, feature_plan
+from helper_functions.create_feature_matrix import create_feature_matrix
+from helper_functions.model_registry import APP_DIR
+
+logger = logging.getLogger(__name__)
+
+# Cached feature matrices, one Parquet file per (data, feature code, requested columns)
+FEATURE_CACHE_DIR = os.path.join(os.path.dirname(APP_DIR), 'saved_data', 'feature_cache')
+
+# Modules whose source determines the feature values; editing any of them invalidates every cached matrix
+FEATURE_MODULES = [feature_engineering, feature_plan, create_feature_matrix_module]
+
+# Oldest cached matrices are deleted beyond this many files
+MAX_ENTRIES = 20
+
+
+def _source_hash():
+    """
+    Hashes the source files of `FEATURE_MODULES`.
+    """
+    digest = hashlib.sha256()
+    for module in FEATURE_MODULES:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def data_fingerprint(data):
+    """
+    Content hash of a DataFrame: values, index, column names and dtypes.
+
+    Args:
+        data (pd.DataFrame): Raw customer data
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in data.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _prune(cache_dir, max_entries):
+    """
+    Deletes the least recently written cache files beyond `max_entries`.
+    """
+    paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.parquet')]
+    for path in sorted(paths, key=os.path.getmtime)[:-max_entries or None]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def cached_feature_matrix(data, features=None, cache_dir=FEATURE_CACHE_DIR, max_entries=MAX_ENTRIES):
+    """
+    `create_feature_matrix` with an on-disk cache.
+
+    The result is stored as Parquet under a key made of the data's fingerprint, the source of the feature
+    engineering modules and the requested columns, so an unchanged rerun only reads the file back, and any change to
+    the data or to the feature code computes (and caches) a fresh matrix. Unlike `create_feature_matrix`, `data`
+    is never modified.
+
+    Args:
+        data (pd.DataFrame): Raw customer data
+        features (list[str] | None): Output columns, as for `create_feature_matrix`
+        cache_dir (str): Directory holding the cached matrices
+        max_entries (int): Most matrices kept; the oldest are deleted first
+
+    Returns:
+        pd.DataFrame: The feature matrix, identical to `create_feature_matrix(data.copy(), features)`
+    """
+    key = hashlib.sha256(f"{data_fingerprint(data)}:{_source_hash()}:{features}".encode()).hexdigest()[:32]
+    path = os.path.join(cache_dir, f"{key}.parquet")
+
+    if os.path.exists(path):
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            # A corrupt or unreadable entry is just a miss
+            logger.warning("Ignoring unreadable feature cache entry %s: %s", path, e)
+
+    matrix = create_feature_matrix(data.copy(), features=features)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    matrix.to_parquet(tmp_path)
+    os.replace(tmp_path, path)
+    _prune(cache_dir, max_entries)
+
+    return matrix
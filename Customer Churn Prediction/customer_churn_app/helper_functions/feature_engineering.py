@@ -1,4 +1,3 @@
-```python
 # Import necessary libraries
 import numpy as np
 import pandas as pd
@@ -56,6 +55,10 @@ def bin_tenure(data):
     return data
 
 
+# Pricing tier labels, indexed by tier number (cheapest first)
+PLAN_LABELS = np.array(['Basic', 'Standard', 'Premium', 'Platinum'], dtype=object)
+
+
 def determine_plans(plan):
     """
     Determines pricing tier based on monthly charge amount
@@ -84,14 +87,21 @@ def monthly_plans(data):
     """
     Categorises customers into monthly pricing tiers
 
+    Vectorised equivalent of applying `determine_plans` to every row.
+
     Args:
         data: DataFrame with 'MonthlyCharges' column
 
     Returns:
         DataFrame with new 'monthly_pricing_tiers' column
     """
-    # Apply the function to create a new column 'monthly_pricing_tiers'
-    data['monthly_pricing_tiers'] = data['MonthlyCharges'].apply(determine_plans)
+    charges = data['MonthlyCharges'].to_numpy()
+
+    # Pick the first tier whose upper bound the charge falls under ($95 or more, or NaN -> Platinum)
+    tier = np.select([charges < 40, charges < 70, charges < 95], [0, 1, 2], default=3)
+
+    # Create a new column 'monthly_pricing_tiers' by looking up each tier's label
+    data['monthly_pricing_tiers'] = PLAN_LABELS[tier]
 
     return data
 
@@ -144,18 +154,35 @@ def billing_issue(row):
     return 'ok'  # default case for minor differences
 
 
+# Billing flag labels, indexed by the condition matched in `billing_flag`
+BILLING_LABELS = np.array(['partial_month', 'discount', 'billing_issue', 'ok'], dtype=object)
+
+
 def billing_flag(data):
     """
     Applies billing issue detection to entire dataset
 
+    Vectorised equivalent of applying `billing_issue` to every row: the conditions are evaluated column-wise
+    and checked in the same order, so the first one that holds decides the label.
+
     Args:
         data: DataFrame with charge_diff and MonthlyCharges columns
 
     Returns:
         DataFrame with new 'billing_flag' column
     """
-    # Apply row-wise billing issue detection
-    data['billing_flag'] = data.apply(billing_issue, axis=1)
+    charge_diff = data['charge_diff'].to_numpy()
+    monthly_charge = data['MonthlyCharges'].to_numpy()
+
+    conditions = [
+        np.abs(charge_diff) < (0.5 * monthly_charge),                                       # partial_month
+        ((-1 * monthly_charge) <= charge_diff) & (charge_diff <= (-0.5 * monthly_charge)),  # discount
+        np.abs(charge_diff) > monthly_charge,                                               # billing_issue
+    ]
+
+    # Anything else (including perfectly aligned payments) is 'ok'
+    flag = np.select(conditions, [0, 1, 2], default=3)
+    data['billing_flag'] = BILLING_LABELS[flag]
 
     return data
 
@@ -210,6 +237,33 @@ def contract_length(contract):
         return 24
 
 
+def contract_lengths(contracts):
+    """
+    Converts a column of contract types to numerical lengths in months
+
+    Vectorised equivalent of applying `contract_length` to every element: unknown contracts become NaN,
+    and the result is integer-typed when every contract is known.
+
+    Args:
+        contracts: Series of contract type strings
+
+    Returns:
+        Series of contract lengths in months, aligned with `contracts`
+    """
+    lengths = np.select(
+        [contracts == 'Month-to-month', contracts == 'One year', contracts == 'Two year'],
+        [1, 12, 24],
+        default=np.nan
+    )
+    lengths = pd.Series(lengths, index=contracts.index)
+
+    # Match the integer dtype `apply` produces when there are no unknown contracts
+    if not lengths.isna().any():
+        lengths = lengths.astype('int64')
+
+    return lengths
+
+
 def contract_progress(data):
     """
     Calculates how far a customer has progressed into their contract
@@ -220,8 +274,8 @@ def contract_progress(data):
     Returns:
         DataFrame with new 'contract_progress' column
     """
-    # Apply the function to create new column "contract_length"
-    data['contract_length'] = data['Contract'].apply(contract_length)
+    # Create new column "contract_length"
+    data['contract_length'] = contract_lengths(data['Contract'])
 
     # Create new column to calculate how far a customer has progressed into their contract
     data['contract_progress'] = (data['tenure'] / data['contract_length']).round(2)
@@ -305,57 +359,68 @@ def high_engagement_loyalty(data):
     return data
 
 
-def additional_features(data):
+def additional_features(data, columns=None):
     """
     Creates multiple additional engineered features for analysis
 
     Args:
         data: DataFrame with customer data
+        columns: Optional collection of feature names to create; all of them are created when None
 
     Returns:
         DataFrame with multiple new feature columns
     """
+    def wanted(feature):
+        return columns is None or feature in columns
+
     # High risk: month-to-month contracts with high monthly charges
-    data["high_risk_contract"] = ((data["Contract"] == "Month-to-month") &
-                                  (data["MonthlyCharges"] > 80)).astype(int)
+    if wanted("high_risk_contract"):
+        data["high_risk_contract"] = ((data["Contract"] == "Month-to-month") &
+                                      (data["MonthlyCharges"] > 80)).astype(int)
 
     # Recent high charge: new customers with high monthly charges
-    data["recent_high_charge"] = ((data["tenure"] < 12) & (data["MonthlyCharges"] > 90)).astype(int)
+    if wanted("recent_high_charge"):
+        data["recent_high_charge"] = ((data["tenure"] < 12) & (data["MonthlyCharges"] > 90)).astype(int)
 
     # Automatic payment methods
-    auto_methods = ["Bank transfer (automatic)", "Credit card (automatic)"]
-    data["is_auto_pay"] = data["PaymentMethod"].isin(auto_methods).astype(int)
+    if wanted("is_auto_pay"):
+        auto_methods = ["Bank transfer (automatic)", "Credit card (automatic)"]
+        data["is_auto_pay"] = data["PaymentMethod"].isin(auto_methods).astype(int)
 
     # Electronic check payment method
-    data["is_electronic_check"] = (data["PaymentMethod"] == "Electronic check").astype(int)
+    if wanted("is_electronic_check"):
+        data["is_electronic_check"] = (data["PaymentMethod"] == "Electronic check").astype(int)
 
     # Security bundle: count of security-related services
-    data["security_bundle"] = (
-            (data["OnlineSecurity"] == "Yes").astype(int) +
-            (data["OnlineBackup"] == "Yes").astype(int) +
-            (data["DeviceProtection"] == "Yes").astype(int) +
-            (data["TechSupport"] == "Yes").astype(int)
-    )
+    if wanted("security_bundle"):
+        data["security_bundle"] = (
+                (data["OnlineSecurity"] == "Yes").astype(int) +
+                (data["OnlineBackup"] == "Yes").astype(int) +
+                (data["DeviceProtection"] == "Yes").astype(int) +
+                (data["TechSupport"] == "Yes").astype(int)
+        )
 
     # Entertainment bundle: has both streaming services
-    data["entertainment_bundle"] = ((data["StreamingTV"] == "Yes") &
-                                    (data["StreamingMovies"] == "Yes")).astype(int)
+    if wanted("entertainment_bundle"):
+        data["entertainment_bundle"] = ((data["StreamingTV"] == "Yes") &
+                                        (data["StreamingMovies"] == "Yes")).astype(int)
 
     # Paperless billing with autopay
-    data["paperless_autopay"] = ((data["PaperlessBilling"] == "Yes") &
-                                 (data["is_auto_pay"] == 1)).astype(int)
+    if wanted("paperless_autopay"):
+        data["paperless_autopay"] = ((data["PaperlessBilling"] == "Yes") &
+                                     (data["is_auto_pay"] == 1)).astype(int)
 
     # Senior citizens with long tenure
-    data["senior_loyal"] = ((data["SeniorCitizen"] == 1) &
-                            (data["tenure"] > 24)).astype(int)
+    if wanted("senior_loyal"):
+        data["senior_loyal"] = ((data["SeniorCitizen"] == 1) &
+                                (data["tenure"] > 24)).astype(int)
 
     # Long-term contracts (not month-to-month)
-    data["is_long_contract"] = data["Contract"].isin(["One year", "Two year"]).astype(int)
+    if wanted("is_long_contract"):
+        data["is_long_contract"] = data["Contract"].isin(["One year", "Two year"]).astype(int)
 
     # Family indicator: has partner or dependents
-    data["family_flag"] = ((data["Partner"] == "Yes") |
-                           (data["Dependents"] == "Yes")).astype(int)
+    if wanted("family_flag"):
+        data["family_flag"] = ((data["Partner"] == "Yes") |
+                               (data["Dependents"] == "Yes")).astype(int)
     return data
-
-
-```
\ No newline at end of file
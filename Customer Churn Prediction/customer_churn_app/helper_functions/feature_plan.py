@@ -0,0 +1,147 @@
+from functools import partial
+
+import numpy as np
+
+from helper_functions.feature_engineering import (reduce_labels, bin_tenure, monthly_plans, charge_diff, billing_flag,
+                                                  average_charges_per_month, contract_loyalty, contract_progress,
+                                                  service_count, charge_tenure_ratio, address_skewness,
+                                                  high_engagement_loyalty, additional_features)
+
+
+def log_charges(data):
+    """
+    Creates the logarithmic transformations of the monetary features used by the model
+
+    Args:
+        data: DataFrame with 'MonthlyCharges' and 'TotalCharges' columns
+
+    Returns:
+        DataFrame with new 'MonthlyCharges_log' and 'TotalCharges_log' columns
+    """
+    data['MonthlyCharges_log'] = np.log1p(data['MonthlyCharges'])  # log(1 + MonthlyCharges)
+    data['TotalCharges_log'] = np.log1p(data['TotalCharges'])  # log(1 + TotalCharges)
+    return data
+
+
+# Service columns read by `service_count`
+SERVICE_COLS = ['PhoneService', 'MultipleLines', 'OnlineSecurity', 'OnlineBackup', 'DeviceProtection',
+                'TechSupport', 'StreamingTV', 'StreamingMovies']
+
+# Columns simplified by `reduce_labels`
+REDUCED_COLS = ['MultipleLines', 'OnlineSecurity', 'OnlineBackup', 'DeviceProtection', 'TechSupport',
+                'StreamingTV', 'StreamingMovies']
+
+# Every step of `create_feature_matrix`, in execution order, as (step, columns read, columns written).
+# Order matters: `address_skewness` overwrites MonthlyCharges/TotalCharges in place, so steps before it see the raw
+# charges and steps after it see the log-transformed ones.
+FEATURE_STEPS = [
+    (reduce_labels, REDUCED_COLS, [f"{col}_categorised" for col in REDUCED_COLS]),
+    (bin_tenure, ['tenure'], ['tenure_bin']),
+    (monthly_plans, ['MonthlyCharges'], ['monthly_pricing_tiers']),
+    (charge_diff, ['TotalCharges', 'MonthlyCharges', 'tenure'], ['charge_diff']),
+    (billing_flag, ['charge_diff', 'MonthlyCharges'], ['billing_flag']),
+    (average_charges_per_month, ['TotalCharges', 'tenure'], ['average_charges_per_month']),
+    (contract_loyalty, ['Contract', 'tenure'], ['contract_loyalty']),
+    (contract_progress, ['Contract', 'tenure'], ['contract_length', 'contract_progress']),
+    (service_count, SERVICE_COLS, ['ServiceCount']),
+    (charge_tenure_ratio, ['MonthlyCharges', 'tenure'], ['charge_tenure_ratio', 'charge_tenure_ratio_log']),
+    (address_skewness, ['MonthlyCharges', 'TotalCharges', 'charge_tenure_ratio'],
+     ['MonthlyCharges', 'TotalCharges', 'charge_tenure_ratio']),
+    (high_engagement_loyalty, ['ServiceCount', 'contract_length'], ['high_engagement_loyalty']),
+
+    # `additional_features` is split per column so unused ones are never computed
+    (partial(additional_features, columns=['high_risk_contract']), ['Contract', 'MonthlyCharges'],
+     ['high_risk_contract']),
+    (partial(additional_features, columns=['recent_high_charge']), ['tenure', 'MonthlyCharges'],
+     ['recent_high_charge']),
+    (partial(additional_features, columns=['is_auto_pay']), ['PaymentMethod'], ['is_auto_pay']),
+    (partial(additional_features, columns=['is_electronic_check']), ['PaymentMethod'], ['is_electronic_check']),
+    (partial(additional_features, columns=['security_bundle']),
+     ['OnlineSecurity', 'OnlineBackup', 'DeviceProtection', 'TechSupport'], ['security_bundle']),
+    (partial(additional_features, columns=['entertainment_bundle']), ['StreamingTV', 'StreamingMovies'],
+     ['entertainment_bundle']),
+    (partial(additional_features, columns=['paperless_autopay']), ['PaperlessBilling', 'is_auto_pay'],
+     ['paperless_autopay']),
+    (partial(additional_features, columns=['senior_loyal']), ['SeniorCitizen', 'tenure'], ['senior_loyal']),
+    (partial(additional_features, columns=['is_long_contract']), ['Contract'], ['is_long_contract']),
+    (partial(additional_features, columns=['family_flag']), ['Partner', 'Dependents'], ['family_flag']),
+
+    (log_charges, ['MonthlyCharges', 'TotalCharges'], ['MonthlyCharges_log', 'TotalCharges_log']),
+]
+
+
+# Engineered columns the model never reads, but whose missing values make `create_feature_matrix` drop the row
+# (a tenure outside the `tenure_bin` ranges). Plans always compute them, so every path scores the same rows.
+ROW_FILTER_COLUMNS = ['tenure_bin']
+
+
+def row_filter_columns(columns, raw_columns, touched):
+    """
+    Columns whose missing values drop a row, as `create_feature_matrix`'s `dropna()` does: every raw input column
+    and every column the plan used.
+
+    Args:
+        columns: Columns of the engineered frame
+        raw_columns: Columns of the raw input
+        touched: Columns the plan read or wrote (from `resolve_plan`)
+
+    Returns:
+        list: The filter columns present in the frame
+    """
+    return [col for col in columns if col in touched or col in raw_columns]
+
+
+def resolve_plan(features):
+    """
+    Works out the minimal, ordered set of feature engineering steps needed to produce `features`.
+
+    Walks `FEATURE_STEPS` backwards tracking which columns are still needed: a step is kept only if it writes a
+    needed column, in which case its outputs are satisfied and its inputs become needed instead.
+
+    Args:
+        features: Names of the output columns wanted
+
+    Returns:
+        tuple: (steps to run in execution order, every column the plan reads or writes)
+    """
+    needed = set(features)
+    touched = set(features)
+    plan = []
+
+    for step, reads, writes in reversed(FEATURE_STEPS):
+        if needed.intersection(writes):
+            plan.append(step)
+            needed = needed.difference(writes).union(reads)
+            touched.update(reads, writes)
+
+    return plan[::-1], touched
+
+
+def run_feature_plan(data, features):
+    """
+    Builds only the requested feature columns from raw customer data.
+
+    Produces the same rows and values as `create_feature_matrix` for those columns: a row is dropped when a raw
+    field or a column the plan used is missing, and `ROW_FILTER_COLUMNS` are always computed so a tenure outside
+    the `tenure_bin` ranges removes the row here too.
+
+    Args:
+        data: Raw customer data containing demographic, service, and billing information.
+        features: Names of the columns wanted in the output
+
+    Returns:
+        DataFrame with the requested columns that could be produced, in the order given
+    """
+    raw_columns = set(data.columns)
+    plan, touched = resolve_plan(list(features) + ROW_FILTER_COLUMNS)
+
+    for step in plan:
+        data = step(data)
+
+    # Requested features that could be produced (any others are defaulted by the encoder)
+    output = [feature for feature in features if feature in data.columns]
+
+    # Clean data by removing any rows the full feature matrix would drop
+    data = data.dropna(subset=row_filter_columns(data.columns, raw_columns, touched))
+
+    return data[output]
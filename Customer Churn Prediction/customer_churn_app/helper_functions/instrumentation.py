@@ -0,0 +1,119 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency histogram buckets: 50µs up to 10s, roughly 2x apart; anything slower
+# lands in a final overflow bucket
+BUCKET_BOUNDS = [0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                 1.0, 2.5, 5.0, 10.0]
+
+# Process-wide statistics: stage name -> aggregated measurements
+_stats = {}
+_lock = threading.Lock()
+
+
+class StageTimer:
+    """
+    Handle yielded by `timed_stage`; set `rows` inside the block if the row count is only known there.
+    """
+
+    def __init__(self, rows=None):
+        self.rows = rows
+
+
+@contextmanager
+def timed_stage(stage, rows=None):
+    """
+    Records the wall time (and optionally row count) of the enclosed block under `stage`.
+
+    Args:
+        stage (str): Name of the pipeline stage, e.g. 'feature_matrix' or 'predict_proba'
+        rows (int | None): Number of rows processed, if known up front
+
+    Yields:
+        StageTimer: Handle whose `rows` attribute can be updated inside the block
+    """
+    timer = StageTimer(rows)
+    start = time.perf_counter()
+    try:
+        yield timer
+    finally:
+        record(stage, time.perf_counter() - start, timer.rows)
+
+
+def record(stage, seconds, rows=None):
+    """
+    Adds one measurement to the aggregated statistics of a stage.
+
+    Args:
+        stage (str): Name of the pipeline stage
+        seconds (float): Wall time of the call
+        rows (int | None): Number of rows processed
+    """
+    with _lock:
+        stats = _stats.get(stage)
+        if stats is None:
+            stats = _stats[stage] = {'count': 0, 'rows': 0, 'total_s': 0.0, 'min_s': seconds, 'max_s': seconds,
+                                     'buckets': [0] * (len(BUCKET_BOUNDS) + 1)}
+
+        stats['count'] += 1
+        stats['rows'] += rows or 0
+        stats['total_s'] += seconds
+        stats['min_s'] = min(stats['min_s'], seconds)
+        stats['max_s'] = max(stats['max_s'], seconds)
+        stats['buckets'][bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+
+def _quantile(buckets, count, q):
+    """
+    Approximates a latency quantile as the upper bound of the histogram bucket that contains it.
+
+    Args:
+        buckets (list[int]): Histogram counts
+        count (int): Total number of measurements
+        q (float): Quantile in [0, 1]
+
+    Returns:
+        float | None: Upper bound in seconds (None if it falls in the overflow bucket)
+    """
+    target = q * count
+    seen = 0
+    for bound, n in zip(BUCKET_BOUNDS + [None], buckets):
+        seen += n
+        if seen >= target:
+            return bound
+    return None
+
+
+def stage_summary():
+    """
+    Returns aggregated latency statistics for every stage measured so far.
+
+    Returns:
+        dict: stage -> count, rows, mean/min/max seconds, approximate p50/p90/p99 and the raw histogram
+    """
+    with _lock:
+        summary = {}
+        for stage, stats in _stats.items():
+            count = stats['count']
+            summary[stage] = {
+                'count': count,
+                'rows': stats['rows'],
+                'mean_s': stats['total_s'] / count,
+                'min_s': stats['min_s'],
+                'max_s': stats['max_s'],
+                'p50_s': _quantile(stats['buckets'], count, 0.50),
+                'p90_s': _quantile(stats['buckets'], count, 0.90),
+                'p99_s': _quantile(stats['buckets'], count, 0.99),
+                'histogram': dict(zip([str(b) for b in BUCKET_BOUNDS] + ['inf'], stats['buckets'])),
+            }
+        return summary
+
+
+def reset_stats():
+    """
+    Clears all recorded measurements.
+    """
+    with _lock:
+        _stats.clear()
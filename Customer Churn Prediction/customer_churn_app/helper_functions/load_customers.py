@@ -0,0 +1,99 @@
+import importlib.util
+
+import pandas as pd
+
+from helper_functions.low_memory import CATEGORICAL_COLUMNS
+
+# Explicit dtypes of the raw Telco CSV, so nothing is inferred. Columns not listed (extra fields in an extract)
+# are still inferred by pandas.
+NUMERIC_DTYPES = {
+    'SeniorCitizen': 'int64',
+    'tenure': 'int64',
+    'MonthlyCharges': 'float64',
+    'TotalCharges': 'float64',
+}
+
+# Only truly blank fields are missing: TotalCharges is ' ' for brand-new customers, and that becomes NaN at parse
+# time instead of each consumer running `pd.to_numeric(errors='coerce')` on a string column
+NA_VALUES = ['', ' ']
+
+# Arrow's CSV reader parses on all cores; it is used for whole-file reads when pyarrow is installed
+ARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+def customer_dtypes(categorical=True, strict=True):
+    """
+    The `dtype` mapping for `pd.read_csv`.
+
+    Args:
+        categorical (bool): Parse the string fields (contract, services, billing, Churn...) as Categoricals, as the
+            low-memory path expects; False keeps them as plain strings for `create_feature_matrix`, whose label
+            `replace` calls pandas deprecates on Categoricals
+        strict (bool): False reads the numeric fields as text, to be coerced afterwards (see `load_customers`)
+
+    Returns:
+        dict: Column name -> dtype
+    """
+    dtypes = {'customerID': object, **NUMERIC_DTYPES}
+    if not strict:
+        dtypes.update(dict.fromkeys(NUMERIC_DTYPES, object))
+    for col in CATEGORICAL_COLUMNS:
+        dtypes[col] = 'category' if categorical else object
+    return dtypes
+
+
+def _coerce_numeric(data):
+    """
+    Converts the text numeric fields to numbers, anything unparseable becoming NaN (an integer field with a missing
+    value becomes float64).
+    """
+    for col in NUMERIC_DTYPES:
+        if col in data.columns:
+            data[col] = pd.to_numeric(data[col], errors='coerce')
+    return data
+
+
+def _coerced_chunks(reader):
+    """
+    Yields the chunks of a `read_csv` iterator with the numeric fields coerced.
+    """
+    with reader:
+        for chunk in reader:
+            yield _coerce_numeric(chunk)
+
+
+def load_customers(path, categorical=True, chunksize=None, usecols=None, engine=None, strict=True):
+    """
+    Reads a CSV shaped like `data/telco_customer_churn.csv` with a fixed schema.
+
+    Numbers are parsed straight to int64/float64 (blank TotalCharges -> NaN), string fields to Categoricals if asked,
+    so there is no dtype inference pass and no per-consumer coercion.
+
+    With `strict=True` (the default) any other non-numeric text in a numeric column, or a blank integer field,
+    raises a ValueError, so a malformed extract is noticed. With `strict=False`, junk or blanks in any numeric field
+    (e.g. TotalCharges 'N/A', a blank tenure) become NaN - the `pd.to_numeric(errors='coerce')` rule the notebooks
+    use - so the row is dropped downstream instead of the whole read failing; those columns are then parsed as text
+    first, which is slower.
+
+    Args:
+        path (str): CSV to read
+        categorical (bool): Parse the string fields as Categoricals (see `customer_dtypes`)
+        chunksize (int | None): If given, return an iterator of DataFrames of this many rows
+        usecols (list[str] | None): Only read these columns
+        engine (str | None): 'c' or 'pyarrow' (multi-threaded; whole-file reads only). None picks 'pyarrow' when it
+            is installed and the file is read in one go.
+        strict (bool): Raise on malformed numeric fields instead of coercing them to NaN
+
+    Returns:
+        pd.DataFrame | iterator: The data, or an iterator of chunks
+    """
+    if engine is None:
+        engine = 'pyarrow' if ARROW_AVAILABLE and chunksize is None else 'c'
+    if engine == 'pyarrow' and chunksize is not None:
+        raise ValueError("The pyarrow engine cannot read in chunks; use engine='c'")
+
+    data = pd.read_csv(path, dtype=customer_dtypes(categorical, strict), keep_default_na=False, na_values=NA_VALUES,
+                       chunksize=chunksize, usecols=usecols, engine=engine)
+    if strict:
+        return data
+    return _coerced_chunks(data) if chunksize is not None else _coerce_numeric(data)
@@ -0,0 +1,159 @@
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from helper_functions.encoder import EXPECTED_FEATURES
+from helper_functions.feature_plan import ROW_FILTER_COLUMNS, resolve_plan, row_filter_columns
+from helper_functions.instrumentation import timed_stage
+
+# Raw string fields with only a handful of distinct values - stored as pandas Categoricals in low-memory mode
+CATEGORICAL_COLUMNS = ['gender', 'Partner', 'Dependents', 'PhoneService', 'MultipleLines', 'InternetService',
+                       'OnlineSecurity', 'OnlineBackup', 'DeviceProtection', 'TechSupport', 'StreamingTV',
+                       'StreamingMovies', 'Contract', 'PaperlessBilling', 'PaymentMethod', 'Churn']
+
+# Integer fields that fit in a small integer type. `tenure` stays int64: the features do arithmetic on it
+# (`tenure + 1` in `charge_tenure_ratio`), which would wrap around in int8.
+SMALL_INT_COLUMNS = ['SeniorCitizen']
+
+# Manual encodings used by `encode_features`, applied to category codes instead of strings
+ENCODINGS = {
+    'Contract': {'Month-to-month': 0, 'One year': 1, 'Two year': 2},
+    'gender': {'Female': 0, 'Male': 1},
+    'PaperlessBilling': {'No': 0, 'Yes': 1},
+}
+
+# One-hot columns, and the mapping `encode_features` applies to them when they arrive as strings
+ONE_HOT_FEATURES = ['InternetService_Fiber optic', 'OnlineSecurity_No', 'TechSupport_No',
+                    'PaymentMethod_Electronic check', 'billing_flag_partial_month']
+ONE_HOT_ENCODING = {'No': 0, 'Yes': 1, 'Fiber optic': 1, 'Electronic check': 1, 'partial_month': 1}
+
+
+@contextmanager
+def track_memory(stage, report):
+    """
+    Records the peak Python/NumPy heap allocation made while the block runs.
+
+    Does nothing when `report` is None, so tracing costs nothing unless asked for.
+
+    Args:
+        stage (str): Name the measurement is stored under
+        report (dict | None): Dictionary to store the peak (in bytes) in; the largest value seen is kept
+    """
+    if report is None:
+        yield
+        return
+
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        yield
+    finally:
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        report[stage] = max(report.get(stage, 0), peak)
+        if started_here:
+            tracemalloc.stop()
+
+
+def categorise(data):
+    """
+    Converts the raw string fields to Categoricals and downcasts the small integer fields, in place.
+
+    Args:
+        data (pd.DataFrame): Raw customer data
+
+    Returns:
+        pd.DataFrame: The same frame, with compact dtypes
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in data.columns and not isinstance(data[col].dtype, pd.CategoricalDtype):
+            data[col] = data[col].astype('category')
+
+    for col in SMALL_INT_COLUMNS:
+        if col in data.columns and pd.api.types.is_integer_dtype(data[col]):
+            data[col] = pd.to_numeric(data[col], downcast='integer')
+
+    return data
+
+
+def _encode_column(values, mapping):
+    """
+    Applies a label -> number mapping to a column, treating unknown labels and missing values as 0.
+
+    Args:
+        values (pd.Series): Categorical or string column
+        mapping (dict): Label to number mapping
+
+    Returns:
+        np.ndarray: Encoded values as float64
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Look up each category once, then index by code (code -1 = missing lands on the trailing 0)
+        lookup = np.array([mapping.get(label, 0) for label in values.cat.categories] + [0], dtype=float)
+        return lookup[values.cat.codes.to_numpy()]
+
+    return values.map(mapping).fillna(0).to_numpy(dtype=float)
+
+
+def preprocess_lean(data, report=None):
+    """
+    Low-memory equivalent of `preprocess_data(data, feature_plan=True)`.
+
+    String fields are held as Categoricals, only the model's features are computed (onto `data` itself, so it is
+    modified in place), no intermediate copies of the frame are made unless rows have to be dropped, and the
+    20 features are encoded straight into a single float64 block.
+
+    Args:
+        data (pd.DataFrame): Raw customer data to be processed
+        report (dict | None): If given, filled with the peak bytes allocated by each stage
+
+    Returns:
+        pd.DataFrame: Processed data with exactly 20 float features named Column_0 to Column_19
+    """
+    # Stage 1: Compact dtypes for the raw inputs
+    with track_memory('categorise', report):
+        data = categorise(data)
+
+    # Stage 2: Compute only the engineered features the model consumes
+    with track_memory('feature_matrix', report), timed_stage('feature_matrix', rows=len(data)):
+        raw_columns = set(data.columns)
+        plan, touched = resolve_plan(EXPECTED_FEATURES + ROW_FILTER_COLUMNS)
+        for step in plan:
+            data = step(data)
+
+        # Rows are dropped exactly as in `run_feature_plan`
+        used = row_filter_columns(data.columns, raw_columns, touched)
+        keep = data[used].notna().all(axis=1).to_numpy()
+        if not keep.all():
+            data = data.loc[keep]
+
+    # Stage 3: Encode every feature directly into one preallocated float block
+    with track_memory('encoding', report), timed_stage('encoding', rows=len(data)):
+        encoded = np.zeros((len(data), len(EXPECTED_FEATURES)), dtype=float)
+
+        for i, feature in enumerate(EXPECTED_FEATURES):
+            if feature not in data.columns:
+                continue  # Missing features keep their default of 0, as in `encode_features`
+
+            values = data[feature]
+            is_text = values.dtype == 'object' or isinstance(values.dtype, pd.CategoricalDtype)
+
+            if feature in ENCODINGS:
+                encoded[:, i] = _encode_column(values, ENCODINGS[feature])
+            elif feature in ONE_HOT_FEATURES and is_text:
+                encoded[:, i] = _encode_column(values, ONE_HOT_ENCODING)
+            elif is_text:
+                # Same safety net as `encode_features`: coerce, treating anything unparseable as 0
+                encoded[:, i] = pd.to_numeric(values.astype(object), errors='coerce').fillna(0).to_numpy(dtype=float)
+            else:
+                encoded[:, i] = values.to_numpy(dtype=float)
+
+        final_data = pd.DataFrame(encoded, index=data.index, columns=[f'Column_{i}' for i in range(20)],
+                                  copy=False)
+
+    return final_data
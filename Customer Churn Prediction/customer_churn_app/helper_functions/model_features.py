@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from helper_functions.create_feature_matrix import create_feature_matrix
+from helper_functions.feature_cache import cached_feature_matrix
+
+# Feature sets of the individual models in saved_models/, in training order
+# (saved_data/feature_names/tree_feature_names.pkl and linear_feature_names.pkl)
+TREE_FEATURES = [
+    'SeniorCitizen', 'tenure', 'MonthlyCharges_log', 'TotalCharges_log', 'average_charges_per_month',
+    'contract_loyalty', 'contract_progress', 'ServiceCount', 'charge_tenure_ratio_log', 'security_bundle',
+    'is_long_contract', 'family_flag', 'Contract', 'gender', 'PaperlessBilling', 'InternetService_Fiber optic',
+    'OnlineSecurity_No', 'TechSupport_No', 'PaymentMethod_Electronic check', 'billing_flag_partial_month'
+]
+LINEAR_FEATURES = [
+    'SeniorCitizen', 'charge_tenure_ratio_log', 'high_engagement_loyalty', 'high_risk_contract',
+    'entertainment_bundle', 'Contract', 'tenure_bin', 'Dependents', 'PhoneService', 'MultipleLines_categorised',
+    'OnlineSecurity_categorised', 'TechSupport_categorised', 'PaperlessBilling', 'InternetService_Fiber optic',
+    'InternetService_No', 'PaymentMethod_Electronic check', 'billing_flag_discount', 'billing_flag_ok'
+]
+
+# Codes assigned by the encoders in encoders/: OrdinalEncoder and LabelEncoder number categories alphabetically
+CONTRACT_CODES = {'Month-to-month': 0, 'One year': 1, 'Two year': 2}
+TENURE_BIN_CODES = {'Long term': 0, 'Mid term': 1, 'Short term': 2}
+GENDER_CODES = {'Female': 0, 'Male': 1}
+
+# Binary (label-encoded, No=0/Yes=1) columns
+YES_NO_FEATURES = ['Dependents', 'PhoneService', 'MultipleLines_categorised', 'OnlineSecurity_categorised',
+                   'TechSupport_categorised', 'PaperlessBilling']
+
+# One-hot columns: (source column, category)
+ONE_HOT_FEATURES = {
+    'InternetService_Fiber optic': ('InternetService', 'Fiber optic'),
+    'InternetService_No': ('InternetService', 'No'),
+    'OnlineSecurity_No': ('OnlineSecurity', 'No'),
+    'TechSupport_No': ('TechSupport', 'No'),
+    'PaymentMethod_Electronic check': ('PaymentMethod', 'Electronic check'),
+    'billing_flag_partial_month': ('billing_flag', 'partial_month'),
+    'billing_flag_discount': ('billing_flag', 'discount'),
+    'billing_flag_ok': ('billing_flag', 'ok'),
+}
+
+# StandardScaler applied to `charge_tenure_ratio_log` for the linear models. The notebook never saved the scaler;
+# these are its mean and scale, recovered exactly from the saved X_test_tree / X_test_linear pair
+LINEAR_RATIO_MEAN = 1.4224786672084524
+LINEAR_RATIO_SCALE = 0.8825961114972581
+
+
+def _encode(features, names):
+    """
+    Turns the engineered (still partly categorical) features into a numeric matrix with the given columns.
+    """
+    X = pd.DataFrame(index=features.index)
+    for name in names:
+        if name in ONE_HOT_FEATURES:
+            column, category = ONE_HOT_FEATURES[name]
+            X[name] = (features[column] == category).astype(float)
+        elif name in YES_NO_FEATURES:
+            X[name] = (features[name] == 'Yes').astype(float)
+        elif name == 'Contract':
+            X[name] = features[name].map(CONTRACT_CODES).astype(float)
+        elif name == 'tenure_bin':
+            X[name] = features[name].astype(object).map(TENURE_BIN_CODES).astype(float)
+        elif name == 'gender':
+            X[name] = features[name].map(GENDER_CODES).astype(float)
+        else:
+            X[name] = features[name].astype(float)
+    return X
+
+
+def model_feature_sets(data, cache=False):
+    """
+    Builds the tree and linear feature matrices the individual models in saved_models/ were trained on.
+
+    Unlike `preprocess_data`, which feeds the served ensemble, this reproduces the notebook's training features
+    exactly: real one-hot columns instead of zeros, the monetary features logged once (and `high_risk_contract`
+    tested against the raw charges), and the linear set's `charge_tenure_ratio_log` standardised.
+
+    Args:
+        data (pd.DataFrame): Raw customer data with the columns produced by `create_df` (not modified)
+        cache (bool): If True, read the engineered features from the on-disk cache (see `feature_cache`); worth it
+            for whole datasets that are rebuilt repeatedly, not for live requests
+
+    Returns:
+        tuple: (tree features, linear features) as float DataFrames with `TREE_FEATURES` / `LINEAR_FEATURES`
+            columns, both indexed like the rows of `data` that survive preprocessing
+    """
+    # `address_skewness` logs the charges in place before the *_log columns and `high_risk_contract` are derived;
+    # training used the raw charges for both, so keep them aside
+    charges = data[['MonthlyCharges', 'TotalCharges']]
+
+    features = cached_feature_matrix(data) if cache else create_feature_matrix(data.copy())
+    raw = charges.loc[features.index]
+    features['MonthlyCharges_log'] = np.log1p(raw['MonthlyCharges'])
+    features['TotalCharges_log'] = np.log1p(raw['TotalCharges'])
+    features['high_risk_contract'] = (features['Contract'] == 'Month-to-month') & (raw['MonthlyCharges'] > 80)
+
+    X_tree = _encode(features, TREE_FEATURES)
+    X_linear = _encode(features, LINEAR_FEATURES)
+    X_linear['charge_tenure_ratio_log'] = (X_linear['charge_tenure_ratio_log'] - LINEAR_RATIO_MEAN) / LINEAR_RATIO_SCALE
+
+    return X_tree, X_linear
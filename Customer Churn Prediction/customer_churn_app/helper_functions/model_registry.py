@@ -0,0 +1,195 @@
+import hashlib
+import importlib
+import os
+import threading
+
+# Directory containing the serialised model artifacts (customer_churn_app/)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Full paths to the artifacts used at inference time
+MODEL_PATH = os.path.join(APP_DIR, "final_cost_sensitive_voting_ensemble.pkl")
+THRESHOLD_PATH = os.path.join(APP_DIR, "best_threshold.pkl")
+
+# The same ensemble exported by src/tree_export.py to NumPy node arrays; served instead of the pickle when present
+COMPILED_MODEL_PATH = os.path.join(APP_DIR, "final_cost_sensitive_voting_ensemble.npz")
+
+# Process-wide cache shared by every Streamlit session: path -> cache entry
+_artifacts = {}
+
+# Guards the cache so concurrent sessions never load the same file twice
+_lock = threading.Lock()
+
+
+def _file_signature(path):
+    """
+    Reads the cheap-to-obtain identity of a file on disk.
+
+    Args:
+        path (str): Path of the artifact
+
+    Returns:
+        tuple: (modification time in nanoseconds, size in bytes)
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_hash(path):
+    """
+    Computes the SHA-256 digest of a file, reading it in 1 MiB blocks.
+
+    Args:
+        path (str): Path of the artifact
+
+    Returns:
+        str: Hexadecimal digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_pickle(path):
+    """
+    Unpickles a joblib artifact; joblib (and whatever the pickle needs, e.g. xgboost) is imported on first use.
+    """
+    import joblib
+    return joblib.load(path)
+
+
+def _load_packed(path):
+    """
+    Loads a model exported by src/tree_export.py (NumPy only).
+    """
+    from helper_functions.tree_evaluator import load_packed_model
+    return load_packed_model(path)
+
+
+# How each kind of artifact is deserialised, by file extension (anything else is a joblib pickle)
+LOADERS = {'.npz': _load_packed}
+
+
+def load_artifact(path):
+    """
+    Returns the unpickled artifact at `path`, loading it from disk only when needed.
+
+    The artifact is cached for the lifetime of the process. On every call the file's mtime and size are checked
+    (a single `os.stat`); only when they differ from the cached values is the file hashed, and only when the hash
+    differs is the artifact unpickled again. Touching or re-copying an identical file therefore never triggers a
+    reload.
+
+    Args:
+        path (str): Path of the artifact (a joblib pickle, or an exported `.npz` model)
+
+    Returns:
+        object: The deserialised artifact
+    """
+    signature = _file_signature(path)
+
+    # Fast path: nothing changed on disk since the last load
+    entry = _artifacts.get(path)
+    if entry is not None and entry["signature"] == signature:
+        return entry["value"]
+
+    with _lock:
+        # Another session may have refreshed the entry while we waited for the lock
+        entry = _artifacts.get(path)
+        if entry is not None and entry["signature"] == signature:
+            return entry["value"]
+
+        # The file was touched: only reload it if the contents actually changed
+        file_hash = _file_hash(path)
+        if entry is not None and entry["hash"] == file_hash:
+            entry["signature"] = signature
+            return entry["value"]
+
+        loader = LOADERS.get(os.path.splitext(path)[1], _load_pickle)
+        value = loader(path)
+        _artifacts[path] = {"signature": signature, "hash": file_hash, "value": value}
+        return value
+
+
+def artifact_hash(path):
+    """
+    Returns the content hash of a cached artifact, loading it first if necessary.
+
+    Args:
+        path (str): Path of the artifact
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of the artifact currently in use
+    """
+    load_artifact(path)
+    return _artifacts[path]["hash"]
+
+
+def _model_path():
+    """
+    Picks the model artifact to serve: the exported NumPy version when it exists, otherwise the pickle.
+    """
+    return COMPILED_MODEL_PATH if os.path.exists(COMPILED_MODEL_PATH) else MODEL_PATH
+
+
+def get_model():
+    """
+    Returns the trained voting ensemble used for churn prediction.
+
+    The exported NumPy version is preferred when it exists: it scores without importing xgboost, lightgbm or
+    catboost, and without their per-call overhead.
+
+    Returns:
+        object: Fitted classifier exposing `predict_proba`
+    """
+    return load_artifact(_model_path())
+
+
+def model_version():
+    """
+    Identifies the model and threshold currently served, changing whenever either artifact's contents change.
+
+    Returns:
+        str: '<model hash>:<threshold hash>'
+    """
+    return f"{artifact_hash(_model_path())}:{artifact_hash(THRESHOLD_PATH)}"
+
+
+def get_threshold():
+    """
+    Returns the optimal decision threshold as a float.
+
+    Returns:
+        float: Probability threshold above which a customer is classified as churning
+    """
+    best_thr = load_artifact(THRESHOLD_PATH)
+    if not isinstance(best_thr, (float, int)):
+        best_thr = float(best_thr[0])  # Safely extract scalar value if it's in an array
+    return best_thr
+
+
+def warm_up(modules=()):
+    """
+    Imports the prediction code and loads the model and threshold in a background thread, so the first prediction
+    does not pay for them and the page can render before they are ready.
+
+    Failures (e.g. a missing artifact) are swallowed here; they surface on the first real prediction instead.
+
+    Args:
+        modules (iterable[str]): Modules to import before loading the artifacts, e.g. 'helper_functions.predict_churn'
+
+    Returns:
+        threading.Thread: The daemon thread performing the warm-up
+    """
+    def _load():
+        try:
+            for module in modules:
+                importlib.import_module(module)
+            get_model()
+            get_threshold()
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_load, name="model-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -1,8 +1,11 @@
 from helper_functions.preprocess_data import preprocess_data
-import joblib
-import os
+from helper_functions.model_registry import get_model, get_threshold
+from helper_functions.instrumentation import timed_stage
+import logging
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 
 def predict_churn(data):
     """
@@ -20,33 +23,24 @@ def predict_churn(data):
     # Step 1: Preprocess the input data into the format expectd by the model
     processed_data = preprocess_data(data)
 
-    # DEBUG: Print processed data information for troubleshooting
-    print(f"Processed data shape: {processed_data.shape}")
-    print(f"Processed data columns: {list(processed_data.columns)}")
-
-    # Step 2: Load the trained model and threshold
-    # Get the directory where this script is located
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-
-    # Construct full paths to model files in the parent directory
-    model_path = os.path.join(parent_dir, "final_cost_sensitive_voting_ensemble.pkl")
-    thr_path = os.path.join(parent_dir, "best_threshold.pkl")
+    # DEBUG: Processed data information for troubleshooting (skipped entirely unless debug logging is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Processed data shape: %s", processed_data.shape)
+        logger.debug("Processed data columns: %s", list(processed_data.columns))
 
-    # Load the pre-trained ensemble model
-    model = joblib.load(model_path)
+    # Step 2: Fetch the trained model from the process-wide registry
+    # (loaded from disk once, and again only if the artifact changes)
+    with timed_stage('model_load'):
+        model = get_model()
 
     # DEBUG: Check model's expected features for compatibility verification
-    try:
-        if hasattr(model, 'feature_names_in_'):
-            print(f"Model expects features: {model.feature_names_in_}")
-            print(f"Number of features model expects: {len(model.feature_names_in_)}")
-    except:
-        print("Could not get feature names from model")
+    if logger.isEnabledFor(logging.DEBUG) and hasattr(model, 'feature_names_in_'):
+        logger.debug("Model expects %d features: %s", len(model.feature_names_in_), model.feature_names_in_)
 
     # Step 3: Generate predictions
     # Get probability estimates for both classes (typically [prob_class_0, prob_class_1])
-    y_proba = model.predict_proba(processed_data)
+    with timed_stage('predict_proba', rows=len(processed_data)):
+        y_proba = model.predict_proba(processed_data)
 
     # Extract probabilities for the positive class (churn = 1)
     if isinstance(y_proba, np.ndarray):
@@ -54,13 +48,12 @@ def predict_churn(data):
     else:
         y_proba = np.array(y_proba)[:, 1] # Convert to numpy array if needed
 
-    # Step 4: Load and apply optimal threshold
-    best_thr = joblib.load("customer_churn_app/best_threshold.pkl")
-    if not isinstance(best_thr, (float, int)):
-        best_thr = float(best_thr[0])  # Safely extract scalar value if it's in an array
+    # Step 4: Fetch and apply optimal threshold
+    with timed_stage('thresholding', rows=len(y_proba)):
+        best_thr = get_threshold()
 
-    # Apply threshold to convert probabilities to binary predictions
-    churn_pred = (y_proba >= best_thr).astype(int)
+        # Apply threshold to convert probabilities to binary predictions
+        churn_pred = (y_proba >= best_thr).astype(int)
 
     # Package results for return
     items = [y_proba, churn_pred]
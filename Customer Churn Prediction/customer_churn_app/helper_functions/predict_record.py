@@ -0,0 +1,62 @@
+import numpy as np
+
+from helper_functions.encode_record import encode_record
+from helper_functions.model_registry import get_model, get_threshold, model_version
+from helper_functions.instrumentation import timed_stage
+from helper_functions.prediction_cache import cache_key, get_prediction_cache
+from helper_functions.tree_evaluator import PackedEnsemble
+
+
+def predict_record(record):
+    """
+    Predicts churn for a single customer without building a DataFrame for preprocessing.
+
+    Same result as `predict_churn` on a one-row DataFrame: the features come from `encode_record`, which is
+    bit-identical to `preprocess_data`.
+
+    Results are cached by the encoded features and the model version, so repeated customers skip the model entirely
+    and a retrained model or threshold never serves a stale answer.
+
+    Args:
+        record (dict): Raw customer fields keyed like `encode_record.CUSTOMER_FIELDS`
+
+    Returns:
+        tuple | None: (churn probability, 0/1 prediction), or None if the record is incomplete or invalid and
+        `preprocess_data` would have dropped it
+    """
+    # Step 1: Raw fields straight to the 20-feature vector
+    with timed_stage('encode_record', rows=1):
+        vector = encode_record(record)
+    if vector is None:
+        return None
+
+    # Step 2: Reuse the prediction if this exact feature vector was scored by the current model
+    cache = get_prediction_cache()
+    version = model_version()
+    cache.invalidate(version)
+    key = cache_key(vector, version)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    with timed_stage('model_load'):
+        model = get_model()
+
+    # scikit-learn estimators fitted on a DataFrame warn when the input has no column names, so give them the names
+    # they were trained with; the exported NumPy model takes the array as-is
+    X = np.array([vector])
+    if hasattr(model, 'feature_names_in_') and not isinstance(model, PackedEnsemble):
+        import pandas as pd
+        X = pd.DataFrame(X, columns=model.feature_names_in_)
+
+    # Step 3: Probability of churn (positive class)
+    with timed_stage('predict_proba', rows=1):
+        probability = float(np.asarray(model.predict_proba(X))[0, 1])
+
+    # Step 4: Apply the optimal threshold
+    result = probability, int(probability >= get_threshold())
+
+    # Only cache the result if the artifacts were not swapped while it was being computed
+    if model_version() == version:
+        cache.put(key, result)
+    return result
@@ -0,0 +1,138 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+def cache_key(vector, version):
+    """
+    Content address of a prediction: the encoded features plus the model version that scores them.
+
+    Args:
+        vector (list[float]): Encoded feature vector
+        version (str): Model version, e.g. from `model_registry.model_version`
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    digest = hashlib.sha256(np.asarray(vector, dtype=np.float64).tobytes())
+    digest.update(version.encode())
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache of predictions with a time-to-live.
+
+    Entries are dropped when they are older than `ttl` seconds, and the least recently used entry is evicted once
+    `max_size` entries are held. Because keys include the model version, a new model or threshold never sees
+    results cached for the old one; `invalidate` additionally frees them as soon as the version changes.
+    """
+
+    def __init__(self, max_size=10000, ttl=3600.0, clock=time.monotonic):
+        """
+        Args:
+            max_size (int): Largest number of cached predictions
+            ttl (float): Seconds a prediction stays valid
+            clock: Zero-argument callable returning the current time in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expiry time, value), least recently used first
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key):
+        """
+        Looks up a prediction, counting a hit or a miss.
+
+        Args:
+            key (str): Output of `cache_key`
+
+        Returns:
+            object | None: The cached value, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        """
+        Stores a prediction, evicting the least recently used one if the cache is full.
+
+        Args:
+            key (str): Output of `cache_key`
+            value: Prediction to cache
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, version):
+        """
+        Empties the cache if the model version differs from the one it was last called with.
+
+        Args:
+            version (str): Current model version
+        """
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: size, max_size, hits, misses, hit_rate, evictions and expirations
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+
+# Process-wide cache shared by every session, created on first use
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_prediction_cache():
+    """
+    Returns the process-wide prediction cache.
+
+    Returns:
+        PredictionCache: The shared cache
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PredictionCache()
+    return _cache
@@ -0,0 +1,372 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from helper_functions.write_to_csv import file_lock
+
+logger = logging.getLogger(__name__)
+
+# Root of the partitioned log, next to app.py: prediction_log/date=YYYY-MM-DD/*.parquet
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'prediction_log')
+
+# Fixed schema for every segment, so segments written at different times always merge and scan together
+LOG_SCHEMA = pa.schema([
+    ('customerID', pa.string()),
+    ('gender', pa.string()),
+    ('SeniorCitizen', pa.int64()),
+    ('Partner', pa.string()),
+    ('Dependents', pa.string()),
+    ('tenure', pa.int64()),
+    ('PhoneService', pa.string()),
+    ('MultipleLines', pa.string()),
+    ('InternetService', pa.string()),
+    ('OnlineSecurity', pa.string()),
+    ('OnlineBackup', pa.string()),
+    ('DeviceProtection', pa.string()),
+    ('TechSupport', pa.string()),
+    ('StreamingTV', pa.string()),
+    ('StreamingMovies', pa.string()),
+    ('Contract', pa.string()),
+    ('PaperlessBilling', pa.string()),
+    ('PaymentMethod', pa.string()),
+    ('MonthlyCharges', pa.float64()),
+    ('TotalCharges', pa.float64()),
+    ('probability', pa.float64()),
+    ('prediction', pa.int64()),
+    ('scored_at', pa.timestamp('us', tz='UTC')),
+])
+
+# Hive-style date partitioning of the log directory
+PARTITIONING = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+# Written into a partition before a merged segment is published and removed once the segments it replaces are gone,
+# so a compaction interrupted in between is finished by the next one (or the next scan) instead of leaving the same
+# rows in two files. Scans ignore files starting with '_'.
+COMPACTION_MARKER = '_compaction.json'
+
+
+class PredictionLog:
+    """
+    Append-optimised, date-partitioned Parquet log of submitted customers and their scores.
+
+    Appends are buffered in memory and written as small immutable segments (one per date per flush). `compact`
+    merges a partition's small segments into one larger file, so scans stay fast as the log grows. `scan` reads
+    only the requested columns and date partitions.
+    """
+
+    def __init__(self, root=LOG_DIR, flush_rows=500, small_segment_bytes=8 * 2 ** 20):
+        """
+        Args:
+            root (str): Directory holding the `date=YYYY-MM-DD` partitions
+            flush_rows (int): Number of buffered rows that triggers a write
+            small_segment_bytes (int): Segments smaller than this are merged by `compact`
+        """
+        self.root = root
+        self.flush_rows = flush_rows
+        self.small_segment_bytes = small_segment_bytes
+        self._buffer = []
+        self._buffered_rows = 0
+        self._lock = threading.Lock()
+
+    def append(self, customers, probabilities, predictions):
+        """
+        Buffers scored customers, writing a segment once `flush_rows` rows are pending.
+
+        The write runs in whichever call crosses `flush_rows`; if it fails, the error is logged and the rows stay
+        buffered for the next attempt rather than failing the caller's request.
+
+        Args:
+            customers (pd.DataFrame): Raw customer fields (extra columns, e.g. engineered features, are ignored)
+            probabilities: Churn probability per row
+            predictions: Binary churn prediction per row
+        """
+        rows = customers[[name for name in LOG_SCHEMA.names if name in customers.columns]].copy()
+        rows['probability'] = list(probabilities)
+        rows['prediction'] = list(predictions)
+        rows['scored_at'] = pd.Timestamp.now(tz='UTC')
+
+        with self._lock:
+            self._buffer.append(rows)
+            self._buffered_rows += len(rows)
+            if self._buffered_rows < self.flush_rows:
+                return
+            pending = self._take_buffer()
+
+        self._write_or_keep(pending)
+
+    def flush(self):
+        """
+        Writes any buffered rows immediately.
+
+        Returns:
+            bool: True if everything was written; on failure the rows stay buffered (and the error is logged)
+        """
+        with self._lock:
+            pending = self._take_buffer()
+        return self._write_or_keep(pending)
+
+    def _write_or_keep(self, frames):
+        """
+        Writes taken-out frames, putting back the rows of any partition that could not be written.
+
+        Args:
+            frames (list[pd.DataFrame]): Rows taken from the buffer
+
+        Returns:
+            bool: True if everything was written
+        """
+        failed = self._write(frames)
+        if failed:
+            with self._lock:
+                # Ahead of anything appended meanwhile, so rows keep their order
+                self._buffer = failed + self._buffer
+                self._buffered_rows += sum(len(part) for part in failed)
+        return not failed
+
+    def _take_buffer(self):
+        """
+        Empties the buffer (caller holds `self._lock`).
+
+        Returns:
+            list[pd.DataFrame]: The buffered frames
+        """
+        pending, self._buffer, self._buffered_rows = self._buffer, [], 0
+        return pending
+
+    def _write(self, frames):
+        """
+        Writes buffered frames as one new segment per date partition.
+
+        Args:
+            frames (list[pd.DataFrame]): Buffered rows
+
+        Returns:
+            list[pd.DataFrame]: Rows of the partitions that could not be written (logged), so they can be retried
+        """
+        if not frames:
+            return []
+
+        rows = pd.concat(frames, ignore_index=True)
+        dates = rows['scored_at'].dt.strftime('%Y-%m-%d')
+
+        failed = []
+        for date, part in rows.groupby(dates):
+            try:
+                table = pa.Table.from_pandas(part.reindex(columns=LOG_SCHEMA.names), schema=LOG_SCHEMA,
+                                             preserve_index=False)
+                self._publish(table, os.path.join(self.root, f'date={date}'), self._segment_name('part'))
+            except Exception as e:
+                logger.error("Could not write %d prediction log rows for %s, keeping them buffered: %s",
+                             len(part), date, e)
+                failed.append(part)
+        return failed
+
+    @staticmethod
+    def _segment_name(prefix):
+        """
+        Unique segment file name.
+
+        Args:
+            prefix (str): File name prefix ('part' for appends, 'compacted' for merges)
+
+        Returns:
+            str: The file name
+        """
+        return f'{prefix}-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet'
+
+    @staticmethod
+    def _publish(table, partition_dir, name):
+        """
+        Atomically adds a segment to a partition: written under a hidden name, then renamed into place.
+
+        Args:
+            table (pa.Table): Rows to write
+            partition_dir (str): Partition directory
+            name (str): Segment file name (from `_segment_name`)
+
+        Returns:
+            str: Path of the new segment
+        """
+        os.makedirs(partition_dir, exist_ok=True)
+
+        # Scans ignore files starting with '.', so readers never see a half-written segment
+        tmp_path = os.path.join(partition_dir, f'.{name}.tmp')
+        pq.write_table(table, tmp_path)
+
+        path = os.path.join(partition_dir, name)
+        os.replace(tmp_path, path)
+        return path
+
+    def partitions(self):
+        """
+        Lists the date partitions present in the log.
+
+        Returns:
+            list[str]: Partition dates (YYYY-MM-DD), oldest first
+        """
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(entry[len('date='):] for entry in os.listdir(self.root) if entry.startswith('date='))
+
+    @staticmethod
+    def _finish_compaction(partition_dir):
+        """
+        Completes an interrupted compaction of a partition, if its marker is present (caller holds the compaction
+        lock): once the merged segment has been published, the segments it replaces are removed; if it never was,
+        they are still the only copy of their rows and are kept.
+
+        Args:
+            partition_dir (str): Partition directory
+        """
+        marker = os.path.join(partition_dir, COMPACTION_MARKER)
+        if not os.path.exists(marker):
+            return
+
+        with open(marker) as f:
+            pending = json.load(f)
+        if os.path.exists(os.path.join(partition_dir, pending['merged'])):
+            for name in pending['sources']:
+                path = os.path.join(partition_dir, name)
+                if os.path.exists(path):
+                    os.remove(path)
+        os.remove(marker)
+
+    def compact(self, dates=None):
+        """
+        Merges the small segments of each partition into a single file.
+
+        The merged file is published before the originals are removed, so a concurrent scan may briefly see the
+        rows twice but never misses any. A marker listing the replaced segments is written first, so if the process
+        dies between the two steps the removal is finished by the next compaction or scan. Compaction is serialised
+        across processes with a lock file.
+
+        Args:
+            dates (list[str] | None): Partitions to compact; all of them when None
+
+        Returns:
+            int: Number of segments merged away
+        """
+        merged = 0
+
+        os.makedirs(self.root, exist_ok=True)
+        with file_lock(os.path.join(self.root, '.compaction.lock')):
+            for date in dates if dates is not None else self.partitions():
+                partition_dir = os.path.join(self.root, f'date={date}')
+                if not os.path.isdir(partition_dir):
+                    continue
+                self._finish_compaction(partition_dir)
+
+                small = sorted(
+                    os.path.join(partition_dir, name) for name in os.listdir(partition_dir)
+                    if name.endswith('.parquet') and not name.startswith(('.', '_'))
+                    and os.path.getsize(os.path.join(partition_dir, name)) < self.small_segment_bytes
+                )
+                if len(small) < 2:
+                    continue
+
+                table = pa.concat_tables(pq.read_table(path, schema=LOG_SCHEMA) for path in small)
+
+                # Record what the merged segment replaces before publishing it, then remove those segments
+                name = self._segment_name('compacted')
+                marker = os.path.join(partition_dir, COMPACTION_MARKER)
+                with open(f'{marker}.tmp', 'w') as f:
+                    json.dump({'merged': name, 'sources': [os.path.basename(path) for path in small]}, f)
+                os.replace(f'{marker}.tmp', marker)
+
+                self._publish(table, partition_dir, name)
+                self._finish_compaction(partition_dir)
+                merged += len(small)
+
+        return merged
+
+    def scan(self, columns=None, start_date=None, end_date=None):
+        """
+        Reads the log, touching only the requested columns and date partitions.
+
+        Args:
+            columns (list[str] | None): Columns to read (all when None); `date` is available as a column too
+            start_date (str | None): First partition to include, YYYY-MM-DD
+            end_date (str | None): Last partition to include, YYYY-MM-DD
+
+        Returns:
+            pd.DataFrame: Matching rows
+        """
+        schema = LOG_SCHEMA.append(pa.field('date', pa.string()))
+        if not self.partitions():
+            return schema.empty_table().to_pandas()[columns or schema.names]
+
+        # Finish any compaction left half-done, so its rows are not read from both the merged and original segments
+        interrupted = [os.path.join(self.root, f'date={date}') for date in self.partitions()
+                       if os.path.exists(os.path.join(self.root, f'date={date}', COMPACTION_MARKER))]
+        if interrupted:
+            with file_lock(os.path.join(self.root, '.compaction.lock')):
+                for partition_dir in interrupted:
+                    self._finish_compaction(partition_dir)
+
+        dataset = ds.dataset(self.root, format='parquet', schema=schema, partitioning=PARTITIONING)
+
+        # Partition pruning: only matching date directories are opened
+        condition = None
+        if start_date is not None:
+            condition = ds.field('date') >= start_date
+        if end_date is not None:
+            upper = ds.field('date') <= end_date
+            condition = upper if condition is None else condition & upper
+
+        return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
+# Process-wide log shared by every session, created on first use
+_log = None
+_log_lock = threading.Lock()
+
+
+def get_prediction_log():
+    """
+    Returns the process-wide prediction log, flushed automatically at interpreter exit.
+
+    Returns:
+        PredictionLog: The shared log
+    """
+    global _log
+    if _log is None:
+        with _log_lock:
+            if _log is None:
+                _log = PredictionLog()
+                atexit.register(_log.flush)
+    return _log
+
+
+def start_compaction(interval=3600):
+    """
+    Starts a daemon thread that flushes the shared log and compacts its partitions every `interval` seconds.
+
+    Args:
+        interval (float): Seconds between compaction runs
+
+    Returns:
+        threading.Thread: The compaction thread
+    """
+    log = get_prediction_log()
+
+    def _loop():
+        while True:
+            time.sleep(interval)
+            try:
+                log.flush()
+                log.compact()
+            except Exception as e:
+                logger.warning("Prediction log compaction failed: %s", e)
+
+    thread = threading.Thread(target=_loop, name="prediction-log-compaction", daemon=True)
+    thread.start()
+    return thread
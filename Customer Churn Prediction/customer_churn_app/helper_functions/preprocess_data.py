@@ -1,27 +1,42 @@
 from helper_functions.create_feature_matrix import create_feature_matrix
-from helper_functions.encoder import encode_features
+from helper_functions.encoder import encode_features, EXPECTED_FEATURES
+from helper_functions.low_memory import preprocess_lean
+from helper_functions.instrumentation import timed_stage
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # Function to preprocess customer data for churn prediction
-def preprocess_data(data):
+def preprocess_data(data, feature_plan=False, low_memory=False, memory_report=None):
     """
     Prepares customer data for machine learning prediction by creating features, encoding categroical variables, and
     ensuring consistent format.
 
     Args:
         data: Raw customer data to be processed.
+        feature_plan: If True, only the engineered features the model consumes are computed.
+        low_memory: If True, use the copy-free, categorical-dtype path in `low_memory.preprocess_lean`
+            (implies `feature_plan`). `data` is modified in place.
+        memory_report: Optional dict filled with the peak bytes allocated per stage (low-memory mode only).
 
     Returns:
         final_data: Processed data with exactly 20 numeric features ready for prediction.
     """
+    if low_memory:
+        return preprocess_lean(data, report=memory_report)
+
     # Step 1: Create additional features from raw data
-    data = create_feature_matrix(data)
+    with timed_stage('feature_matrix', rows=len(data)):
+        data = create_feature_matrix(data, features=EXPECTED_FEATURES if feature_plan else None)
 
     # Step 2: Encode categorical variables to numeric format
-    data = encode_features(data)
+    with timed_stage('encoding', rows=len(data)):
+        data = encode_features(data)
 
     # Step 3: Ensure data has exactly 20 features for model compatibility
-    final_data = data.copy()
+    # (encode_features already returns a new frame, so no defensive copy is needed)
+    final_data = data
 
     # If there are more than 20 columns, keep only the first 20
     if len(final_data.columns) > 20:
@@ -37,8 +52,9 @@ def preprocess_data(data):
     # Step 5: Convert all data to float for machine learning model
     final_data = final_data.astype(float)
 
-    # Print confirmation message with shape and data types
-    print(f"Preprocessing complete: {final_data.shape}, all dtypes: {final_data.dtypes.unique()}")
+    # Confirmation message with shape and data types (only formatted when debug logging is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Preprocessing complete: %s, all dtypes: %s", final_data.shape, final_data.dtypes.unique())
 
     # Step 6: Return refined data
     return final_data
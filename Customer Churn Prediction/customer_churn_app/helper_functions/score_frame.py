@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from helper_functions.preprocess_data import preprocess_data
+from helper_functions.model_registry import get_model, get_threshold
+from helper_functions.instrumentation import timed_stage
+
+
+def score_frame(data, feature_plan=False, low_memory=False, memory_report=None):
+    """
+    Scores every customer in a DataFrame in a single vectorised model call.
+
+    Rows that cannot be scored (e.g. a blank TotalCharges) are dropped during preprocessing, so the result is
+    indexed like the surviving rows of `data` rather than positionally.
+
+    Args:
+        data (pd.DataFrame): Raw customer data with the columns produced by `create_df`
+        feature_plan (bool): If True, only the engineered features the model consumes are computed
+        low_memory (bool): If True, preprocess with categorical dtypes and no intermediate copies
+        memory_report (dict | None): Filled with the peak bytes allocated per preprocessing stage (low-memory mode)
+
+    Returns:
+        pd.DataFrame: 'probability' and 'prediction' columns, indexed like the scored rows of `data`
+    """
+    # Step 1: Preprocess the input data into the format expected by the model
+    processed_data = preprocess_data(data, feature_plan=feature_plan, low_memory=low_memory,
+                                     memory_report=memory_report)
+
+    # Nothing survived preprocessing, so there is nothing to hand to the model
+    if processed_data.empty:
+        return pd.DataFrame({'probability': pd.Series(dtype=float), 'prediction': pd.Series(dtype=int)})
+
+    with timed_stage('model_load'):
+        model = get_model()
+
+    # Step 2: Probability of churn (positive class) for every row at once
+    with timed_stage('predict_proba', rows=len(processed_data)):
+        y_proba = np.asarray(model.predict_proba(processed_data))[:, 1]
+
+    # Step 3: Apply the optimal threshold to get the binary prediction
+    with timed_stage('thresholding', rows=len(y_proba)):
+        churn_pred = (y_proba >= get_threshold()).astype(int)
+
+    return pd.DataFrame({'probability': y_proba, 'prediction': churn_pred}, index=processed_data.index)
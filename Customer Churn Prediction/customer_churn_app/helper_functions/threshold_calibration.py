@@ -0,0 +1,191 @@
+import os
+import threading
+
+import numpy as np
+
+from helper_functions.model_registry import APP_DIR, THRESHOLD_PATH
+
+# Running histograms of labelled scores, kept next to the threshold so recalibration resumes across restarts
+STATE_PATH = os.path.join(APP_DIR, 'threshold_calibration.npz')
+
+# Default misclassification costs: missing a churner (false negative) costs a lost customer, flagging a loyal one
+# (false positive) only a retention offer
+FN_COST = 5.0
+FP_COST = 1.0
+
+# Weights are rescaled once they grow past this, long before float64 loses precision
+_MAX_WEIGHT = 1e100
+
+
+class ThresholdRecalibrator:
+    """
+    Keeps the cost-optimal churn threshold up to date as labelled outcomes arrive.
+
+    Scores are counted into two fixed-size histograms (churners and non-churners) over [0, 1]; candidate
+    thresholds are the bin edges, the same 0.01 grid `best_threshold.pkl` was tuned on by default. An update is
+    O(1) and finding the best threshold is O(bins), independent of how many outcomes have been seen, so nothing is
+    ever re-scored or re-sorted.
+
+    With a `half_life`, older outcomes fade exponentially so the threshold follows drifting base rates. Rather than
+    decaying every bin on each update, each new outcome is counted with a weight that grows by the decay factor,
+    and everything is rescaled only when the weights get large.
+
+    Outcomes passed to `update_many` with ordered keys (score time, then customer) only count past a watermark -
+    the largest key counted so far, saved with the state as a single value - so feeding the same outcomes again,
+    e.g. rerunning on a growing outcomes file, never counts them twice and the state stays fixed-size.
+    """
+
+    def __init__(self, bins=100, fn_cost=FN_COST, fp_cost=FP_COST, half_life=None):
+        """
+        Args:
+            bins (int): Number of histogram bins (threshold resolution 1 / bins)
+            fn_cost (float): Cost of a churner scored below the threshold
+            fp_cost (float): Cost of a non-churner scored at or above it
+            half_life (float | None): Number of outcomes after which an outcome counts half; None never forgets
+        """
+        self.bins = bins
+        self.fn_cost = fn_cost
+        self.fp_cost = fp_cost
+        self.half_life = half_life
+        self.churned = np.zeros(bins)
+        self.retained = np.zeros(bins)
+        self.seen = 0
+        self.watermark = None
+        self._growth = 1.0 if half_life is None else 2.0 ** (1.0 / half_life)
+        self._weight = 1.0
+        self._lock = threading.Lock()
+
+    def update(self, probability, churned):
+        """
+        Counts one labelled outcome.
+
+        Args:
+            probability (float): Churn probability the model gave the customer
+            churned (bool): Whether the customer actually churned
+        """
+        bin_index = min(max(int(probability * self.bins), 0), self.bins - 1)
+        with self._lock:
+            histogram = self.churned if churned else self.retained
+            histogram[bin_index] += self._weight
+            self.seen += 1
+
+            self._weight *= self._growth
+            if self._weight > _MAX_WEIGHT:
+                self.churned /= self._weight
+                self.retained /= self._weight
+                self._weight = 1.0
+
+    def update_many(self, probabilities, churned, keys=None):
+        """
+        Counts a batch of labelled outcomes, oldest first; same result as calling `update` on each.
+
+        Args:
+            probabilities (array-like): Churn probabilities
+            churned (array-like): 0/1 or boolean outcomes, aligned with `probabilities`
+            keys (array-like | None): Increasing, sortable key per outcome (e.g. score time then customer ID);
+                outcomes at or below the watermark are skipped, so an outcome arriving after later-scored ones have
+                been counted is skipped too
+
+        Returns:
+            int: Number of outcomes counted
+        """
+        keys = [None] * len(probabilities) if keys is None else [str(key) for key in keys]
+        added = 0
+        for probability, outcome, key in zip(np.asarray(probabilities, dtype=float), np.asarray(churned, dtype=bool),
+                                             keys):
+            if key is not None:
+                if self.watermark is not None and key <= self.watermark:
+                    continue
+                self.watermark = key
+            self.update(probability, outcome)
+            added += 1
+        return added
+
+    def costs(self):
+        """
+        Expected misclassification cost at every candidate threshold.
+
+        Returns:
+            tuple: (thresholds, costs) - thresholds are the bin edges 0, 1/bins, ..., 1
+        """
+        with self._lock:
+            churned = self.churned.copy()
+            retained = self.retained.copy()
+
+        # At threshold k/bins, churners in bins below k are missed and non-churners in bins k and above are flagged
+        missed = np.concatenate([[0.0], np.cumsum(churned)])
+        flagged = np.concatenate([np.cumsum(retained[::-1])[::-1], [0.0]])
+        thresholds = np.arange(self.bins + 1) / self.bins
+        return thresholds, self.fn_cost * missed + self.fp_cost * flagged
+
+    def best_threshold(self):
+        """
+        Returns the threshold with the lowest expected cost (the lowest one, if several tie).
+
+        Returns:
+            float: Probability threshold above which a customer is classified as churning
+        """
+        thresholds, costs = self.costs()
+        return float(thresholds[np.argmin(costs)])
+
+    def publish(self, path=THRESHOLD_PATH):
+        """
+        Writes the current best threshold as the served threshold artifact.
+
+        The file is written next to the target and renamed over it, so readers (and `model_registry`, which
+        reloads on change) only ever see the old or the new threshold, never a partial file.
+
+        Args:
+            path (str): Threshold artifact to replace
+
+        Returns:
+            float: The published threshold
+        """
+        import joblib
+
+        threshold = self.best_threshold()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(np.float64(threshold), tmp_path)
+        os.replace(tmp_path, path)
+        return threshold
+
+    def save(self, path=STATE_PATH):
+        """
+        Saves the histograms so recalibration can resume later (atomically, like `publish`).
+
+        Args:
+            path (str): Destination `.npz` file
+        """
+        with self._lock:
+            state = {'churned': self.churned / self._weight, 'retained': self.retained / self._weight,
+                     'seen': self.seen, 'costs': [self.fn_cost, self.fp_cost],
+                     'half_life': np.nan if self.half_life is None else self.half_life,
+                     'watermark': '' if self.watermark is None else self.watermark}
+
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, **state)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        """
+        Restores a recalibrator saved with `save`.
+
+        Args:
+            path (str): `.npz` file written by `save`
+
+        Returns:
+            ThresholdRecalibrator: The restored recalibrator
+        """
+        with np.load(path, allow_pickle=False) as state:
+            half_life = float(state['half_life'])
+            fn_cost, fp_cost = state['costs']
+            recalibrator = cls(bins=len(state['churned']), fn_cost=float(fn_cost), fp_cost=float(fp_cost),
+                               half_life=None if np.isnan(half_life) else half_life)
+            recalibrator.churned = state['churned'].copy()
+            recalibrator.retained = state['retained'].copy()
+            recalibrator.seen = int(state['seen'])
+            # States saved before keys were recorded have no watermark
+            if 'watermark' in state.files:
+                recalibrator.watermark = str(state['watermark']) or None
+        return recalibrator
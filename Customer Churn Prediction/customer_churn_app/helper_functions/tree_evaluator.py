@@ -0,0 +1,270 @@
+import numpy as np
+
+# How a split treats missing values: NaN follows the node's default direction, and with MISSING_ZERO so does 0
+# (|x| <= 1e-35, as LightGBM defines it)
+MISSING_NAN = 0
+MISSING_ZERO = 1
+
+# Per-node arrays stored for every component of a packed model
+NODE_ARRAYS = ['feature', 'threshold', 'left', 'default_left', 'missing_zero', 'value']
+
+# Rows x trees traversed together: large batches are split into blocks of about this many (row, tree) pairs so the
+# working arrays stay in cache
+BLOCK_SIZE = 65536
+
+
+def pack_trees(trees):
+    """
+    Concatenates trees into flat node arrays laid out for branch-free traversal.
+
+    Nodes are renumbered breadth-first so that the two children of a node are adjacent: the right child is always
+    `left + 1`, and one step of a traversal is `node = left[node] + (not go_left)`. Leaves point to themselves with
+    an infinite threshold and a default-left direction, so every row goes "left" and stays put once it reaches a
+    leaf, and a traversal can run a fixed number of steps.
+
+    Args:
+        trees (list[dict]): One dict per tree with per-node lists 'feature', 'threshold', 'left', 'right',
+            'default_left', 'missing' (MISSING_NAN or MISSING_ZERO) and 'value', root first (child indices local
+            to the tree, -1 for leaves)
+
+    Returns:
+        dict: The `NODE_ARRAYS`, 'roots' (index of each tree's root) and 'depth' (longest root-to-leaf path)
+    """
+    packed = {name: [] for name in NODE_ARRAYS}
+    roots, depth = [], 0
+
+    for tree in trees:
+        offset = sum(len(part) for part in packed['feature'])
+        left, right = tree['left'], tree['right']
+
+        # Breadth-first order with siblings next to each other, and the depth of every node
+        order, node_depth, first_child = [0], [0], {}
+        for position, node in enumerate(order):
+            if left[node] >= 0:
+                first_child[node] = len(order)
+                order += [left[node], right[node]]
+                node_depth += [node_depth[position] + 1] * 2
+        depth = max(depth, max(node_depth))
+
+        is_leaf = np.array([left[node] < 0 for node in order])
+        packed['left'].append(offset + np.array([position if left[node] < 0 else first_child[node]
+                                                 for position, node in enumerate(order)]))
+        packed['feature'].append(np.where(is_leaf, 0, [tree['feature'][node] for node in order]))
+        packed['threshold'].append(np.where(is_leaf, np.inf, [tree['threshold'][node] for node in order]))
+        packed['default_left'].append(is_leaf | [bool(tree['default_left'][node]) for node in order])
+        packed['missing_zero'].append(~is_leaf & [tree['missing'][node] == MISSING_ZERO for node in order])
+        packed['value'].append(np.where(is_leaf, [tree['value'][node] for node in order], 0.0))
+
+        roots.append(offset)
+
+    dtypes = {'feature': np.intp, 'threshold': np.float64, 'left': np.intp, 'default_left': bool,
+              'missing_zero': bool, 'value': np.float64}
+    arrays = {name: np.concatenate(parts).astype(dtypes[name]) for name, parts in packed.items()}
+    arrays['roots'] = np.asarray(roots, dtype=np.intp)
+    arrays['depth'] = depth
+    return arrays
+
+
+class PackedTrees:
+    """
+    One tree model (a decision tree, forest or gradient-boosted ensemble) flattened into node arrays.
+
+    Evaluation advances every (row, tree) pair one level per step with vectorised array lookups, so no ML library
+    is needed at scoring time.
+    """
+
+    def __init__(self, arrays, strict, float32, link, base_margin=0.0, scale=1.0):
+        """
+        Args:
+            arrays (dict): Output of `pack_trees`
+            strict (bool): True if rows go left when `x < threshold` (XGBoost), False for `x <= threshold`
+            float32 (bool): True if the library compares features as float32
+            link (str): 'mean' to average leaf probabilities (scikit-learn trees and forests), 'logit' to apply a
+                sigmoid to the summed leaf margins (boosters)
+            base_margin (float): Margin added to the sum of the leaves ('logit' only)
+            scale (float): Factor applied to the sum of the leaves before `base_margin` ('logit' only)
+        """
+        if link not in ('mean', 'logit'):
+            raise ValueError(f"link must be 'mean' or 'logit', got {link!r}")
+
+        for name in NODE_ARRAYS + ['roots']:
+            setattr(self, name, np.asarray(arrays[name]))
+        self.feature = self.feature.astype(np.intp)
+        self.left = self.left.astype(np.intp)
+        self.roots = self.roots.astype(np.intp)
+        self.depth = int(arrays['depth'])
+        self.strict = bool(strict)
+        self.float32 = bool(float32)
+        self.link = link
+        self.base_margin = float(base_margin)
+        self.scale = float(scale)
+
+        # Most models never treat 0 as missing, which saves a check per step
+        self._zero_missing = bool(self.missing_zero.any())
+
+    def leaves(self, X):
+        """
+        Finds the leaf every row reaches in every tree.
+
+        Args:
+            X (np.ndarray): float64 feature matrix (n_rows, n_features)
+
+        Returns:
+            np.ndarray: Leaf node indices (n_rows, n_trees)
+        """
+        if self.float32:
+            X = X.astype(np.float32).astype(np.float64)
+
+        # +inf would otherwise step off a leaf (leaves compare against an infinite threshold)
+        X = np.minimum(X, np.finfo(np.float64).max)
+
+        # Missing values can only be skipped when there are none
+        has_nan = bool(np.isnan(X).any())
+
+        # Gathering from the flattened matrix is cheaper than 2-D fancy indexing
+        flat = np.ascontiguousarray(X).ravel()
+        row_start = (np.arange(X.shape[0]) * X.shape[1])[:, None]
+        node = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+
+        for _ in range(self.depth):
+            x = flat[row_start + self.feature[node]]
+            go_left = x < self.threshold[node] if self.strict else x <= self.threshold[node]
+
+            # Missing values follow the direction learned during training
+            if has_nan or self._zero_missing:
+                use_default = np.isnan(x)
+                if self._zero_missing:
+                    use_default |= self.missing_zero[node] & (np.abs(x) <= 1e-35)
+                go_left = np.where(use_default, self.default_left[node], go_left)
+
+            node = self.left[node] + ~go_left
+
+        return node
+
+    def predict_positive(self, X):
+        """
+        Computes the probability of the positive class.
+
+        Args:
+            X (np.ndarray): float64 feature matrix (n_rows, n_features)
+
+        Returns:
+            np.ndarray: Probability of class 1 for every row
+        """
+        block_rows = max(1, BLOCK_SIZE // len(self.roots))
+        totals = np.concatenate([self.value[self.leaves(X[start:start + block_rows])].sum(axis=1)
+                                 for start in range(0, max(len(X), 1), block_rows)])
+
+        if self.link == 'mean':
+            return totals / len(self.roots)
+        margin = self.base_margin + self.scale * totals
+        return 1.0 / (1.0 + np.exp(-margin))
+
+
+class PackedEnsemble:
+    """
+    Drop-in, NumPy-only replacement for an exported classifier's `predict_proba`.
+
+    A single exported model is an ensemble of one component; a soft-voting ensemble averages the positive-class
+    probability of its components with the voting weights.
+    """
+
+    def __init__(self, components, weights, feature_names):
+        """
+        Args:
+            components (list[PackedTrees]): Exported models
+            weights (list[float]): Voting weight of each component
+            feature_names (list[str]): Feature columns, in the order the models were trained on
+        """
+        self.components = components
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        self.classes_ = np.array([0, 1])
+
+    def _matrix(self, X):
+        """
+        Converts the input to a float64 matrix with columns in training order.
+
+        DataFrames carrying the training column names are reordered by name (extra columns are ignored); anything
+        else, including the positional `Column_0`..`Column_19` frames from `preprocess_data`, is taken in order.
+        """
+        if hasattr(X, 'columns') and set(self.feature_names_in_).issubset(X.columns):
+            X = X[list(self.feature_names_in_)]
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        return X
+
+    def predict_proba(self, X):
+        """
+        Predicts class probabilities, matching the original library's `predict_proba`.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Feature matrix
+
+        Returns:
+            np.ndarray: (n_rows, 2) probabilities of class 0 and class 1
+        """
+        X = self._matrix(X)
+        positive = np.average([component.predict_positive(X) for component in self.components], axis=0,
+                              weights=self.weights)
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X):
+        """
+        Predicts the class with the higher probability.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Feature matrix
+
+        Returns:
+            np.ndarray: 0/1 prediction for every row
+        """
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(int)
+
+
+def save_packed_model(path, ensemble):
+    """
+    Writes a packed ensemble to an uncompressed `.npz` file (no pickled objects).
+
+    Args:
+        path (str): Destination file
+        ensemble (PackedEnsemble): Model to save
+    """
+    arrays = {
+        'feature_names': np.asarray(ensemble.feature_names_in_, dtype=str),
+        'weights': ensemble.weights,
+        'n_components': np.int64(len(ensemble.components)),
+    }
+    for i, component in enumerate(ensemble.components):
+        for name in NODE_ARRAYS + ['roots']:
+            arrays[f'c{i}_{name}'] = getattr(component, name)
+        arrays[f'c{i}_depth'] = np.int64(component.depth)
+        arrays[f'c{i}_strict'] = np.bool_(component.strict)
+        arrays[f'c{i}_float32'] = np.bool_(component.float32)
+        arrays[f'c{i}_link'] = np.str_(component.link)
+        arrays[f'c{i}_base_margin'] = np.float64(component.base_margin)
+        arrays[f'c{i}_scale'] = np.float64(component.scale)
+
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def load_packed_model(path):
+    """
+    Reads a model written by `save_packed_model`.
+
+    Args:
+        path (str): `.npz` file
+
+    Returns:
+        PackedEnsemble: The model, ready for `predict_proba`
+    """
+    with np.load(path, allow_pickle=False) as data:
+        components = []
+        for i in range(int(data['n_components'])):
+            arrays = {name: data[f'c{i}_{name}'] for name in NODE_ARRAYS + ['roots', 'depth']}
+            components.append(PackedTrees(arrays, strict=data[f'c{i}_strict'], float32=data[f'c{i}_float32'],
+                                          link=str(data[f'c{i}_link']), base_margin=data[f'c{i}_base_margin'],
+                                          scale=data[f'c{i}_scale']))
+        return PackedEnsemble(components, data['weights'], list(data['feature_names']))
@@ -1,23 +1,223 @@
+import atexit
+import logging
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
 
+try:
+    import fcntl  # POSIX
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
 
-def write_to_csv(df):
+from helper_functions.instrumentation import timed_stage
+
+logger = logging.getLogger(__name__)
+
+# Default location of the submitted-customer log, next to app.py regardless of the working directory
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'customer_data.csv')
+
+# Marks the end of the queue when the writer is closed
+_STOP = object()
+
+
+@contextmanager
+def file_lock(lock_path):
+    """
+    Holds an exclusive, cross-process lock on `lock_path` for the duration of the block.
+
+    Args:
+        lock_path (str): Path of the lock file (created if missing)
+    """
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            # msvcrt gives up after ~10s of contention, so keep retrying
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class BackgroundCSVWriter:
     """
-        Writes a DataFrame to a CSV file, creating the file with headers if it doesn't exist,
-        or appending without headers if the file already exists.
+    Appends DataFrames to a CSV file from a background thread.
 
+    Callers only pay for putting the rows on a bounded queue. The writer thread drains the queue in batches, takes a
+    cross-process file lock so concurrent Streamlit sessions (or processes) never interleave partial lines, writes a
+    header when it creates the file, and syncs to disk according to `fsync`:
+
+    - 'batch': fsync after every batch written
+    - 'interval': fsync at most once every `fsync_interval` seconds, and no later than that after a batch is written
+    - 'never': leave flushing to the operating system
+
+    Unless the policy is 'never', `close` syncs whatever is still unsynced after writing the last batch.
+    """
+
+    def __init__(self, path=DATA_PATH, max_queue=1000, batch_size=100, fsync='batch', fsync_interval=1.0):
+        """
         Args:
-            df (pandas.DataFrame): The DataFrame to write to CSV
+            path (str): CSV file to append to
+            max_queue (int): Maximum number of pending writes; `write` blocks when the queue is full
+            batch_size (int): Maximum number of queued writes flushed together
+            fsync (str): Durability policy - 'batch', 'interval' or 'never'
+            fsync_interval (float): Seconds between fsyncs when `fsync='interval'`
+        """
+        if fsync not in ('batch', 'interval', 'never'):
+            raise ValueError(f"fsync must be 'batch', 'interval' or 'never', got {fsync!r}")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self._last_fsync = None  # Never synced yet, so the first batch is synced straight away
+        self._unsynced = False
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, df):
+        """
+        Queues a DataFrame to be appended to the file.
+
+        Args:
+            df (pandas.DataFrame): Rows to append; a snapshot is taken, so the caller may keep modifying it
+        """
+        if self._closed:
+            raise RuntimeError("BackgroundCSVWriter is closed")
+        self._queue.put(df.copy())
+
+    def close(self):
+        """
+        Writes everything still queued, then stops the writer thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        """
+        Worker loop: block for the next write, drain whatever else is queued, and flush it as one batch.
+
+        With `fsync='interval'`, the wait is cut short when written rows are due to be synced.
+        """
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self._sync_due_in())]
+            except queue.Empty:
+                self._sync()
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in batch)
+            frames = [item for item in batch if item is not _STOP]
+            if frames:
+                try:
+                    self._flush(frames)
+                except Exception as e:
+                    logger.warning("Failed to write %d row batch(es) to %s: %s", len(frames), self.path, e)
+
+            if stop:
+                if self.fsync != 'never':
+                    self._sync()
+                return
+
+    def _sync_due_in(self):
+        """
+        Seconds until unsynced rows must be synced under the 'interval' policy, or None if nothing is due.
+        """
+        if self.fsync != 'interval' or not self._unsynced:
+            return None
+        return max(0.0, self._last_fsync + self.fsync_interval - time.monotonic())
+
+    def _sync(self):
+        """
+        Fsyncs rows written since the last sync, if any.
+        """
+        if not self._unsynced:
+            return
+        try:
+            with open(self.path, 'a') as f:
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.warning("Failed to sync %s: %s", self.path, e)
+            return
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+
+    def _flush(self, frames):
+        """
+        Appends a batch of DataFrames to the file under the cross-process lock.
+
+        Args:
+            frames (list[pandas.DataFrame]): Frames to write, in submission order
+        """
+        with timed_stage('csv_write', rows=sum(len(df) for df in frames)), file_lock(f"{self.path}.lock"):
+            with open(self.path, 'a', newline='') as f:
+                # Only a brand-new (empty) file gets a header
+                write_header = f.tell() == 0
+                for df in frames:
+                    df.to_csv(f, header=write_header, index=False)
+                    write_header = False
+
+                f.flush()
+                self._unsynced = True
+                if self.fsync == 'batch' or (self.fsync == 'interval' and (
+                        self._last_fsync is None or time.monotonic() - self._last_fsync >= self.fsync_interval)):
+                    os.fsync(f.fileno())
+                    self._last_fsync = time.monotonic()
+                    self._unsynced = False
+
+
+# Process-wide writer shared by every session, created on first use
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """
+    Returns the process-wide background writer for `customer_data.csv`, starting it on first use.
+
+    Returns:
+        BackgroundCSVWriter: The shared writer (drained automatically at interpreter exit)
     """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = BackgroundCSVWriter()
+                atexit.register(_writer.close)
+    return _writer
 
-    # Define the file path for the CSV file
-    file_path = 'customer_churn_app/customer_data.csv'
 
-    # Check if the file exists
-    if not os.path.exists(file_path):
-        # File doesn't exist - create it with data but without header
-        # This assumes the first row of df contains what should be the header
-        df.to_csv(file_path, mode='w', header=False, index=False)
-    else:
-        # File exists - append data without repeating the header
-        df.to_csv(file_path, mode='a', header=False, index=False)
+def write_to_csv(df):
+    """
+        Queues a DataFrame to be appended to `customer_data.csv` by the background writer.
+
+        The file is created with a header if it doesn't exist; existing files are appended to without repeating it.
+        Disk I/O happens on the writer thread, so this returns as soon as the rows are queued.
+
+        Args:
+            df (pandas.DataFrame): The DataFrame to write to CSV
+    """
+    get_writer().write(df)
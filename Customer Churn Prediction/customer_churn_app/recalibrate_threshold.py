@@ -0,0 +1,81 @@
+import argparse
+import os
+
+import pandas as pd
+
+from helper_functions.prediction_log import get_prediction_log
+from helper_functions.threshold_calibration import FN_COST, FP_COST, STATE_PATH, ThresholdRecalibrator
+from helper_functions.model_registry import THRESHOLD_PATH
+
+#  python customer_churn_app/recalibrate_threshold.py outcomes.csv                  # customerID,Churn
+#  python customer_churn_app/recalibrate_threshold.py outcomes.csv --half-life 5000 --dry-run
+
+
+def labelled_scores(outcomes_path, log=None):
+    """
+    Joins observed outcomes to the probabilities the model gave those customers.
+
+    Args:
+        outcomes_path (str): CSV with `customerID` and `Churn` (Yes/No or 1/0) columns
+        log (PredictionLog | None): Prediction log to read scores from (the app's by default)
+
+    Returns:
+        pd.DataFrame: `probability`, `churned` and `key` columns, in `key` order. `key` is the score time (fixed-width
+        ISO, so it sorts chronologically) then the customer ID, so a recalibrator's watermark tells which outcomes
+        earlier runs have counted.
+    """
+    outcomes = pd.read_csv(outcomes_path, usecols=['customerID', 'Churn'])
+    outcomes['churned'] = outcomes['Churn'].astype(str).isin(['Yes', '1']).astype(int)
+
+    # Latest score per customer: the one the outcome most plausibly followed
+    scores = (log or get_prediction_log()).scan(columns=['customerID', 'probability', 'scored_at'])
+    scores = scores.sort_values('scored_at').drop_duplicates('customerID', keep='last')
+
+    labelled = scores.merge(outcomes[['customerID', 'churned']], on='customerID')
+    labelled['key'] = labelled['scored_at'].dt.strftime('%Y-%m-%dT%H:%M:%S.%f') + '|' + labelled['customerID']
+    return labelled.sort_values('key')[['probability', 'churned', 'key']].reset_index(drop=True)
+
+
+def main():
+    """
+    Command-line entry point: fold newly labelled outcomes into the running histograms and publish the threshold.
+    """
+    parser = argparse.ArgumentParser(description="Recalibrate the churn threshold from labelled outcomes.")
+    parser.add_argument('outcomes', help="CSV of observed outcomes with customerID and Churn columns")
+    parser.add_argument('--state', default=STATE_PATH, help="running histograms, created if missing")
+    parser.add_argument('--fn-cost', type=float, default=FN_COST,
+                        help=f"cost of missing a churner (default: {FN_COST:g}; new state only)")
+    parser.add_argument('--fp-cost', type=float, default=FP_COST,
+                        help=f"cost of flagging a non-churner (default: {FP_COST:g}; new state only)")
+    parser.add_argument('--half-life', type=float, default=None,
+                        help="outcomes after which an outcome counts half (default: never forget; new state only)")
+    parser.add_argument('--min-outcomes', type=int, default=500,
+                        help="labelled outcomes needed before a threshold is published (default: 500)")
+    parser.add_argument('--dry-run', action='store_true', help="report the new threshold without publishing it")
+    args = parser.parse_args()
+
+    if os.path.exists(args.state):
+        recalibrator = ThresholdRecalibrator.load(args.state)
+    else:
+        recalibrator = ThresholdRecalibrator(fn_cost=args.fn_cost, fp_cost=args.fp_cost, half_life=args.half_life)
+
+    # Outcomes up to the watermark of earlier runs are skipped, so reruns are idempotent
+    labelled = labelled_scores(args.outcomes)
+    added = recalibrator.update_many(labelled['probability'], labelled['churned'], keys=labelled['key'])
+    print(f"Added {added} labelled outcomes, skipped {len(labelled) - added} already counted "
+          f"({recalibrator.seen} in total)")
+
+    if args.dry_run:
+        print(f"Best threshold: {recalibrator.best_threshold():.2f} (not published)")
+        return
+
+    recalibrator.save(args.state)
+    if recalibrator.seen < args.min_outcomes:
+        print(f"Fewer than {args.min_outcomes} outcomes so far; threshold left unchanged")
+        return
+
+    print(f"Published threshold {recalibrator.publish():.2f} -> {THRESHOLD_PATH}")
+
+
+if __name__ == '__main__':
+    main()
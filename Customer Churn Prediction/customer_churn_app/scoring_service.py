@@ -0,0 +1,382 @@
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from helper_functions.score_frame import score_frame
+from helper_functions.predict_record import predict_record
+from helper_functions.encode_record import CUSTOMER_FIELDS, NUMERIC_FIELDS
+from helper_functions.model_registry import warm_up
+from helper_functions.instrumentation import stage_summary
+from helper_functions.prediction_cache import get_prediction_cache
+from helper_functions.compare_models import compare_models, submit_comparison
+
+logger = logging.getLogger(__name__)
+
+#  python customer_churn_app/scoring_service.py --port 8502 --max-batch-size 64 --max-wait-ms 5
+#
+#  curl -X POST localhost:8502/predict -d '{"customerID": "7590-VHVEG", "gender": "Female", ...}'
+#  curl -X POST localhost:8502/predict -d '[{...}, {...}]'
+#  curl -X POST localhost:8502/compare -d '[{...}, {...}]'      # every saved model, side by side
+#  curl localhost:8502/metrics
+#
+#  python customer_churn_app/scoring_service.py --shadow          # also score all traffic with the saved models
+
+# Shadow batches queued or running at once. Beyond this the saved models are falling behind the traffic, and new
+# batches are dropped from shadowing rather than queued without limit.
+SHADOW_MAX_PENDING = 4
+
+# Shadow jobs run on their own thread, so building their features never holds up the micro-batcher
+_shadow_executor = None
+_shadow_lock = threading.Lock()
+_shadow_slots = threading.BoundedSemaphore(SHADOW_MAX_PENDING)
+_shadow_stats = {'submitted': 0, 'dropped': 0}
+
+
+def records_frame(records):
+    """
+    Builds a raw customer DataFrame from request records.
+
+    Args:
+        records (list[dict]): Raw customer fields, keyed like `CUSTOMER_FIELDS`
+
+    Returns:
+        pd.DataFrame: One row per record, indexed 0..n-1
+    """
+    data = pd.DataFrame.from_records(records, columns=CUSTOMER_FIELDS)
+
+    # JSON nulls or strings in numeric fields become NaN, so the row is dropped instead of failing the whole batch
+    for col in NUMERIC_FIELDS:
+        data[col] = pd.to_numeric(data[col], errors='coerce')
+    return data
+
+
+def score_records(records):
+    """
+    Scores a list of customer records in a single vectorised model call.
+
+    A lone record (the usual case when traffic is light) takes the pandas-free `predict_record` path instead.
+
+    Args:
+        records (list[dict]): Raw customer fields, keyed like `CUSTOMER_FIELDS`
+
+    Returns:
+        list[dict]: One result per record, in order - either `probability` and `prediction`, or an `error`
+    """
+    if len(records) == 1:
+        result = {'customerID': records[0].get('customerID')}
+        scored = predict_record(records[0])
+        if scored is None:
+            result['error'] = 'missing or invalid customer fields'
+        else:
+            result['probability'], result['prediction'] = scored
+        return [result]
+
+    scores = score_frame(records_frame(records))
+
+    results = []
+    for i, record in enumerate(records):
+        result = {'customerID': record.get('customerID')}
+        if i in scores.index:
+            result['probability'] = float(scores.at[i, 'probability'])
+            result['prediction'] = int(scores.at[i, 'prediction'])
+        else:
+            # Dropped during preprocessing because a required field was missing or invalid
+            result['error'] = 'missing or invalid customer fields'
+        results.append(result)
+
+    return results
+
+
+def compare_records(records, timeout=None):
+    """
+    Scores customer records with every saved model (see `compare_models`) and returns the scores side by side.
+
+    Args:
+        records (list[dict]): Raw customer fields, keyed like `CUSTOMER_FIELDS`
+        timeout (float | None): Longest time (seconds) to wait for the slowest model
+
+    Returns:
+        list[dict]: One result per record, in order - a `scores` dict keyed by model name (null for a model that
+        failed or timed out), or an `error`
+    """
+    scores = compare_models(records_frame(records), timeout=timeout)
+
+    results = []
+    for i, record in enumerate(records):
+        result = {'customerID': record.get('customerID')}
+        if i in scores.index:
+            result['scores'] = {name: None if np.isnan(score) else float(score)
+                                for name, score in scores.loc[i].items()}
+        else:
+            result['error'] = 'missing or invalid customer fields'
+        results.append(result)
+
+    return results
+
+
+def _shadow_job(records):
+    """
+    Builds the features for a shadowed batch and waits for every saved model to score it, logging failures.
+
+    Holds one of the `SHADOW_MAX_PENDING` slots until the slowest model has finished.
+    """
+    try:
+        _, futures = submit_comparison(records_frame(records))
+        wait(futures.values())
+        for name, future in futures.items():
+            if future.exception() is not None:
+                logger.warning("Shadow model %s failed: %s", name, future.exception())
+    except Exception as e:
+        logger.warning("Shadow scoring failed: %s", e)
+    finally:
+        _shadow_slots.release()
+
+
+def shadow_score(records):
+    """
+    Hands a batch that has already been answered to the saved models, without doing any of the work here.
+
+    The whole job - building features included - runs on the shadow thread. If `SHADOW_MAX_PENDING` batches are
+    already waiting, this one is dropped (and counted) instead. Model latencies show up per model under
+    `compare.<name>` in /metrics.
+
+    Args:
+        records (list[dict]): Raw customer fields, keyed like `CUSTOMER_FIELDS`
+
+    Returns:
+        bool: Whether the batch was queued for shadowing
+    """
+    global _shadow_executor
+    if not _shadow_slots.acquire(blocking=False):
+        with _shadow_lock:
+            _shadow_stats['dropped'] += 1
+        return False
+
+    with _shadow_lock:
+        if _shadow_executor is None:
+            _shadow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='shadow')
+        _shadow_stats['submitted'] += 1
+    _shadow_executor.submit(_shadow_job, records)
+    return True
+
+
+def shadow_stats():
+    """
+    Number of batches queued for shadowing, and dropped because the queue was full.
+    """
+    with _shadow_lock:
+        return dict(_shadow_stats)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-customer requests into one vectorised `predict_proba` call.
+
+    A background thread waits for the first pending request, then keeps collecting until either
+    `max_batch_size` requests are queued or `max_wait` seconds have passed since the first one arrived, and scores
+    them all together.
+    """
+
+    def __init__(self, max_batch_size=64, max_wait=0.005, shadow=False):
+        """
+        Args:
+            max_batch_size (int): Largest number of requests scored in one model call
+            max_wait (float): Longest time (seconds) the first request in a batch waits for others to join
+            shadow (bool): If True, every batch is also scored by the saved models after its callers are answered
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.shadow = shadow
+        self._pending = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, record):
+        """
+        Queues one customer for scoring.
+
+        Args:
+            record (dict): Raw customer fields
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result dict for this customer
+        """
+        future = Future()
+        self._pending.put((record, future))
+        return future
+
+    def _collect(self):
+        """
+        Blocks for the first request, then gathers more until the batch is full or the wait budget is spent.
+
+        Returns:
+            list[tuple]: (record, future) pairs making up the next batch
+        """
+        batch = [self._pending.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    @staticmethod
+    def _score_individually(batch):
+        """
+        Scores each request of a failed batch on its own, resolving every future with its own result or error.
+
+        Args:
+            batch (list[tuple]): (record, future) pairs
+        """
+        for record, future in batch:
+            try:
+                future.set_result(score_records([record])[0])
+            except Exception as e:
+                future.set_exception(e)
+
+    def _run(self):
+        """
+        Worker loop: score each collected batch and hand every caller its own result.
+        """
+        while True:
+            batch = self._collect()
+            records = [record for record, _ in batch]
+
+            try:
+                results = score_records(records)
+            except Exception:
+                # One bad record must not fail everyone coalesced with it: score them one by one, so only the
+                # request that cannot be scored gets the error
+                self._score_individually(batch)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+
+            # Callers already have their answers, and the shadow job only queues the batch (or drops it when the
+            # shadow queue is full), so the candidates add nothing to request latency
+            if self.shadow:
+                shadow_score(records)
+
+
+def make_handler(batcher, compare_timeout=None):
+    """
+    Builds the HTTP request handler bound to a micro-batcher.
+
+    Args:
+        batcher (MicroBatcher): Batcher that single-customer requests are routed through
+        compare_timeout (float | None): Longest time (seconds) /compare waits for the slowest saved model
+
+    Returns:
+        type: A `BaseHTTPRequestHandler` subclass
+    """
+
+    class ScoringHandler(BaseHTTPRequestHandler):
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, {'status': 'ok'})
+            elif self.path == '/metrics':
+                # Aggregated per-stage latency histograms, plus the prediction cache and shadow queue counters
+                self._send_json(200, {**stage_summary(), 'prediction_cache': get_prediction_cache().stats(),
+                                      'shadow': shadow_stats()})
+            else:
+                self._send_json(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if self.path not in ('/predict', '/compare'):
+                self._send_json(404, {'error': 'not found'})
+                return
+
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length))
+            except (ValueError, json.JSONDecodeError):
+                self._send_json(400, {'error': 'request body must be JSON'})
+                return
+
+            if self.path == '/compare':
+                records = payload if isinstance(payload, list) else [payload]
+                try:
+                    self._send_json(200, compare_records(records, timeout=compare_timeout))
+                except Exception as e:
+                    self._send_json(500, {'error': f'comparison failed: {e}'})
+                return
+
+            try:
+                if isinstance(payload, list):
+                    # A list is already a batch - score it directly in one call
+                    self._send_json(200, score_records(payload))
+                    if batcher.shadow:
+                        shadow_score(payload)
+                elif isinstance(payload, dict):
+                    # Single customers are coalesced with other concurrent requests
+                    result = batcher.submit(payload).result()
+                    self._send_json(422 if 'error' in result else 200, result)
+                else:
+                    self._send_json(400, {'error': 'expected a customer object or a list of them'})
+            except Exception as e:
+                self._send_json(500, {'error': f'prediction failed: {e}'})
+
+        def log_message(self, format, *args):
+            # Keep per-request access logs off the hot path
+            pass
+
+    return ScoringHandler
+
+
+def main():
+    """
+    Command-line entry point for the local scoring service.
+    """
+    parser = argparse.ArgumentParser(description="Serve churn predictions over HTTP with adaptive micro-batching.")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8502, help="port to listen on (default: 8502)")
+    parser.add_argument('--max-batch-size', type=int, default=64,
+                        help="most single-customer requests scored in one model call (default: 64)")
+    parser.add_argument('--max-wait-ms', type=float, default=5.0,
+                        help="longest a request waits for others to join its batch (default: 5 ms)")
+    parser.add_argument('--shadow', action='store_true',
+                        help="also score every request with the saved models, after it has been answered")
+    parser.add_argument('--compare-timeout-ms', type=float, default=1000.0,
+                        help="longest /compare waits for the slowest saved model (default: 1000 ms)")
+    args = parser.parse_args()
+
+    # Load the model before accepting traffic
+    warm_up().join()
+
+    batcher = MicroBatcher(max_batch_size=args.max_batch_size, max_wait=args.max_wait_ms / 1000, shadow=args.shadow)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(batcher, args.compare_timeout_ms / 1000))
+    print(f"Scoring service listening on http://{args.host}:{args.port}/predict")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
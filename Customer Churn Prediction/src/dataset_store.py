@@ -0,0 +1,156 @@
+import argparse
+import glob
+import json
+import os
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#  python src/dataset_store.py                      # saved_data/train_test_data/*.pkl -> .npy + manifest.json
+#  python src/dataset_store.py --check              # convert, then verify every array against its pickle
+
+# The train/test splits saved by notebooks/02_modelling.ipynb; the .npy store lives next to the pickles
+STORE_DIR = os.path.join(PROJECT_DIR, 'saved_data', 'train_test_data')
+MANIFEST_NAME = 'manifest.json'
+
+
+def _read_manifest(store_dir):
+    """
+    Reads a store's manifest (empty if the store is new).
+    """
+    path = os.path.join(store_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _atomic_save(path, array):
+    """
+    Writes an array as .npy via a temporary file, so readers never map a half-written file.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+    os.replace(tmp_path, path)
+
+
+def save_dataset(name, data, store_dir=STORE_DIR):
+    """
+    Stores an array or numeric DataFrame as a plain .npy file that can be memory-mapped.
+
+    A DataFrame's values are stored as one float64 matrix (`name.npy`), its index as `name.index.npy` and its
+    column names and dtypes in the store's manifest, so `load_dataset(..., as_frame=True)` rebuilds it.
+    NumPy pads the .npy header to a 64-byte boundary, so the mapped data is aligned.
+
+    Args:
+        name (str): Dataset name, e.g. 'X_train_tree'
+        data (np.ndarray | pd.DataFrame | pd.Series): Numeric data
+        store_dir (str): Store directory
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    entry = {'file': f"{name}.npy", 'columns': None, 'dtypes': None, 'index': None}
+
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        entry['columns'] = [str(col) for col in frame.columns]
+        entry['dtypes'] = [str(dtype) for dtype in frame.dtypes]
+        entry['index'] = f"{name}.index.npy"
+        _atomic_save(os.path.join(store_dir, entry['index']), frame.index.to_numpy())
+        values = frame.to_numpy(dtype=np.float64)
+        if isinstance(data, pd.Series):
+            values = values[:, 0]
+    else:
+        values = np.asarray(data)
+
+    _atomic_save(os.path.join(store_dir, entry['file']), values)
+    entry['shape'] = list(values.shape)
+    entry['dtype'] = str(values.dtype)
+
+    manifest = _read_manifest(store_dir)
+    manifest[name] = entry
+    tmp_path = os.path.join(store_dir, f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(store_dir, MANIFEST_NAME))
+
+
+def load_dataset(name, store_dir=STORE_DIR, mmap_mode='r', as_frame=False):
+    """
+    Opens a stored dataset, memory-mapped by default.
+
+    Mapped arrays are read straight from the page cache: nothing is deserialised, load time does not depend on the
+    array's size, and any number of processes opening the same file share one copy of its pages.
+
+    Args:
+        name (str): Dataset name
+        store_dir (str): Store directory
+        mmap_mode (str | None): Passed to `np.load`; None reads the array into private memory
+        as_frame (bool): Rebuild the DataFrame (column names, index, original dtypes) if one was stored. Mixed
+            dtypes force a copy; an all-float64 frame wraps the mapped array as-is.
+
+    Returns:
+        np.ndarray | pd.DataFrame: The dataset
+    """
+    entry = _read_manifest(store_dir)[name]
+    values = np.load(os.path.join(store_dir, entry['file']), mmap_mode=mmap_mode, allow_pickle=False)
+
+    if not as_frame or entry['columns'] is None:
+        return values
+
+    index = np.load(os.path.join(store_dir, entry['index']), allow_pickle=False)
+    frame = pd.DataFrame(values.reshape(len(index), -1), columns=entry['columns'], index=index, copy=False)
+    if any(dtype != 'float64' for dtype in entry['dtypes']):
+        frame = frame.astype(dict(zip(entry['columns'], entry['dtypes'])))
+    return frame
+
+
+def convert_pickles(store_dir=STORE_DIR):
+    """
+    Converts every pickled array/DataFrame in a directory to the .npy store.
+
+    Args:
+        store_dir (str): Directory holding the pickles, and the store
+
+    Returns:
+        list[str]: Names of the converted datasets
+    """
+    names = []
+    for path in sorted(glob.glob(os.path.join(store_dir, '*.pkl'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        save_dataset(name, joblib.load(path), store_dir)
+        names.append(name)
+    return names
+
+
+def main():
+    """
+    Command-line entry point: convert the saved train/test pickles to the memory-mappable store.
+    """
+    parser = argparse.ArgumentParser(description="Convert saved_data pickles to memory-mappable .npy files.")
+    parser.add_argument('--store', default=STORE_DIR, help="directory of pickles to convert (default: %(default)s)")
+    parser.add_argument('--check', action='store_true', help="verify every stored array against its pickle")
+    args = parser.parse_args()
+
+    names = convert_pickles(args.store)
+    print(f"Stored {len(names)} datasets in {args.store}")
+
+    if args.check:
+        for name in names:
+            original = joblib.load(os.path.join(args.store, f"{name}.pkl"))
+            stored = load_dataset(name, args.store, as_frame=isinstance(original, (pd.DataFrame, pd.Series)))
+            if isinstance(original, pd.Series):
+                stored = stored.iloc[:, 0].rename(original.name)
+            same = (stored.equals(original) if hasattr(original, 'equals')
+                    else np.array_equal(stored, original, equal_nan=True))
+            print(f"  {name:<16} {'ok' if same else 'MISMATCH'}")
+            if not same:
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
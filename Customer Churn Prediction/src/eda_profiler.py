@@ -0,0 +1,319 @@
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#  python src/eda_profiler.py                                          # data/telco_customer_churn.csv
+#  python src/eda_profiler.py /data/customer_extract.csv --chunksize 500000 --output profile.json
+
+DATA_PATH = os.path.join(PROJECT_DIR, 'data', 'telco_customer_churn.csv')
+
+# Columns read as numbers; anything else is profiled as a category. TotalCharges is blank for brand-new customers
+# and is coerced to NaN, as everywhere else in the project.
+NUMERIC_COLUMNS = ['SeniorCitizen', 'tenure', 'MonthlyCharges', 'TotalCharges']
+
+# Identifier columns: counted, but their values are not tabulated
+ID_COLUMNS = ['customerID']
+
+
+class Moments:
+    """
+    Count, mean, variance, min and max of a numeric stream, updated a chunk at a time.
+
+    Each chunk's statistics are folded in with Chan et al.'s parallel form of Welford's algorithm, which is
+    numerically stable and lets two partial results (e.g. from different files or processes) be merged exactly.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def merge(self, count, mean, m2, minimum, maximum):
+        """
+        Folds in the statistics of another partition.
+        """
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    def update(self, values):
+        """
+        Folds in a chunk of non-missing values.
+
+        Args:
+            values (np.ndarray): Finite numbers
+        """
+        if len(values):
+            mean = values.mean()
+            self.merge(len(values), mean, float(((values - mean) ** 2).sum()), values.min(), values.max())
+
+    def variance(self):
+        """
+        Sample variance (ddof=1, like pandas), or NaN with fewer than two values.
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with a relative-error guarantee (DDSketch).
+
+    Values are counted in logarithmic buckets whose width grows with the value, so any quantile is returned within
+    `relative_accuracy` of the true value, whatever the data size. Memory is bounded by `max_buckets` per sign: when
+    exceeded, the buckets nearest zero are collapsed, which only affects the lowest quantiles.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+        self.count = 0
+
+    def _add(self, store, values):
+        """
+        Counts magnitudes into a bucket store, then collapses it if it grew too large.
+        """
+        buckets, counts = np.unique(np.ceil(np.log(values) / self.log_gamma).astype(np.int64), return_counts=True)
+        for bucket, count in zip(buckets.tolist(), counts.tolist()):
+            store[bucket] = store.get(bucket, 0) + count
+        self._collapse(store)
+
+    def _collapse(self, store):
+        """
+        Folds the buckets nearest zero into one until the store holds at most `max_buckets`.
+        """
+        if len(store) > self.max_buckets:
+            keys = sorted(store)
+            lowest = keys[len(keys) - self.max_buckets]
+            store[lowest] += sum(store.pop(key) for key in keys[:len(keys) - self.max_buckets])
+
+    def update(self, values):
+        """
+        Adds a chunk of non-missing values.
+
+        Args:
+            values (np.ndarray): Finite numbers
+        """
+        self.count += len(values)
+        self.zeros += int(np.count_nonzero(values == 0))
+        if np.any(values > 0):
+            self._add(self.positive, values[values > 0])
+        if np.any(values < 0):
+            self._add(self.negative, -values[values < 0])
+
+    def merge(self, other):
+        """
+        Adds every value counted by another sketch with the same accuracy.
+        """
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for bucket, count in theirs.items():
+                mine[bucket] = mine.get(bucket, 0) + count
+            self._collapse(mine)
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def quantile(self, q):
+        """
+        Approximate q-quantile (0 <= q <= 1), or NaN if the sketch is empty.
+        """
+        if self.count == 0:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Most negative first: the largest magnitudes of the negative store
+        for bucket in sorted(self.negative, reverse=True):
+            seen += self.negative[bucket]
+            if seen > rank:
+                return -2 * self.gamma ** bucket / (self.gamma + 1)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for bucket in sorted(self.positive):
+            seen += self.positive[bucket]
+            if seen > rank:
+                return 2 * self.gamma ** bucket / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.positive) / (self.gamma + 1)
+
+
+class ColumnProfile:
+    """
+    Everything collected for one column in the single pass.
+
+    Numeric columns keep moments and a quantile sketch overall and per target class; categorical columns keep
+    value counts and churn counts per value, capped at `max_categories` distinct values (later new values are
+    pooled under '(other)').
+    """
+
+    OTHER = '(other)'
+
+    def __init__(self, name, numeric, max_categories=100, relative_accuracy=0.01):
+        self.name = name
+        self.numeric = numeric
+        self.max_categories = max_categories
+        self.rows = 0
+        self.missing = 0
+        if numeric:
+            self.moments = Moments()
+            self.sketch = QuantileSketch(relative_accuracy)
+            self.moments_by_class = {0: Moments(), 1: Moments()}
+        else:
+            self.counts = {}
+            self.churned = {}
+
+    def update(self, values, target):
+        """
+        Folds in one chunk of the column.
+
+        Args:
+            values (pd.Series): Column values
+            target (np.ndarray | None): 0/1 target aligned with `values`, if profiling against one
+        """
+        present = values.notna().to_numpy()
+        self.rows += len(values)
+        self.missing += int(len(values) - present.sum())
+
+        if self.numeric:
+            numbers = values.to_numpy(dtype=np.float64)
+            self.moments.update(numbers[present])
+            self.sketch.update(numbers[present])
+            if target is not None:
+                for cls, moments in self.moments_by_class.items():
+                    moments.update(numbers[present & (target == cls)])
+            return
+
+        # One groupby per chunk gives the count and the churn count of every value
+        frame = pd.DataFrame({'value': values.astype(object).where(present, '(missing)'),
+                              'churned': 0 if target is None else target})
+        grouped = frame.groupby('value', sort=False)['churned'].agg(['size', 'sum'])
+        for value, (size, churned) in zip(grouped.index, grouped.to_numpy().tolist()):
+            if value not in self.counts and len(self.counts) >= self.max_categories:
+                value = self.OTHER
+            self.counts[value] = self.counts.get(value, 0) + size
+            self.churned[value] = self.churned.get(value, 0) + churned
+
+
+def profile_csv(path=DATA_PATH, chunksize=100_000, target='Churn', numeric_columns=NUMERIC_COLUMNS,
+                max_categories=100, relative_accuracy=0.01):
+    """
+    Profiles a customer CSV of any size in one chunked pass with bounded memory.
+
+    For every column: rows and missing values; for numeric columns the mean, standard deviation, min/max and
+    approximate quantiles (within `relative_accuracy`), overall and per target class; for categorical columns the
+    value counts and the churn rate of each value (the `pd.crosstab(..., normalize='index')` of the notebooks).
+
+    Args:
+        path (str): CSV shaped like `data/telco_customer_churn.csv`
+        chunksize (int): Rows read per chunk; memory use depends on this, not on the file size
+        target (str | None): Yes/No target column to cross-tabulate against
+        numeric_columns (list[str]): Columns profiled as numbers (others are categories)
+        max_categories (int): Distinct values tracked per categorical column
+        relative_accuracy (float): Quantile sketch accuracy
+
+    Returns:
+        dict: Column name -> ColumnProfile
+    """
+    profiles = {}
+    for chunk in pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False, na_values=['', ' ']):
+        labels = None
+        if target is not None and target in chunk:
+            labels = (chunk.pop(target) == 'Yes').to_numpy().astype(np.int8)
+
+        for column in chunk.columns:
+            numeric = column in numeric_columns
+            values = pd.to_numeric(chunk[column], errors='coerce') if numeric else chunk[column]
+
+            if column not in profiles:
+                profiles[column] = ColumnProfile(column, numeric, max_categories, relative_accuracy)
+            if column in ID_COLUMNS:
+                profiles[column].rows += len(values)
+                profiles[column].missing += int(values.isna().sum())
+                continue
+            profiles[column].update(values, labels)
+
+    return profiles
+
+
+def summarise(profiles, quantiles=(0.01, 0.25, 0.5, 0.75, 0.99)):
+    """
+    Turns the collected profiles into tables.
+
+    Args:
+        profiles (dict): Output of `profile_csv`
+        quantiles (tuple): Quantiles to report for numeric columns
+
+    Returns:
+        tuple: (numeric summary DataFrame, dict of column -> categorical DataFrame with count/share/churn_rate)
+    """
+    numeric_rows = []
+    categorical = {}
+    for name, profile in profiles.items():
+        if profile.numeric:
+            moments = profile.moments
+            row = {'column': name, 'rows': profile.rows, 'missing': profile.missing, 'mean': moments.mean,
+                   'std': math.sqrt(moments.variance()), 'min': moments.min, 'max': moments.max}
+            row.update({f'q{round(q * 100):02d}': profile.sketch.quantile(q) for q in quantiles})
+            for cls, label in ((1, 'churned'), (0, 'retained')):
+                row[f'mean_{label}'] = profile.moments_by_class[cls].mean if profile.moments_by_class[cls].count \
+                    else math.nan
+            numeric_rows.append(row)
+        elif name not in ID_COLUMNS:
+            table = pd.DataFrame({'count': pd.Series(profile.counts), 'churned': pd.Series(profile.churned)})
+            table['share'] = table['count'] / profile.rows
+            table['churn_rate'] = table['churned'] / table['count']
+            categorical[name] = table.sort_values('count', ascending=False)
+
+    return pd.DataFrame(numeric_rows).set_index('column'), categorical
+
+
+def main():
+    """
+    Command-line entry point: profile a CSV in one pass and print (or save) the summary.
+    """
+    parser = argparse.ArgumentParser(description="One-pass, bounded-memory EDA profile of a customer CSV.")
+    parser.add_argument('path', nargs='?', default=DATA_PATH, help="CSV to profile (default: the Telco sample)")
+    parser.add_argument('--chunksize', type=int, default=100_000, help="rows per chunk (default: 100000)")
+    parser.add_argument('--max-categories', type=int, default=100,
+                        help="distinct values tracked per categorical column (default: 100)")
+    parser.add_argument('--output', help="write the profile as JSON instead of printing it")
+    args = parser.parse_args()
+
+    numeric, categorical = summarise(profile_csv(args.path, chunksize=args.chunksize,
+                                                 max_categories=args.max_categories))
+
+    if args.output:
+        report = {'numeric': json.loads(numeric.to_json(orient='index')),
+                  'categorical': {name: json.loads(table.to_json(orient='index'))
+                                  for name, table in categorical.items()}}
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Profile written to {args.output}")
+        return
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(numeric.round(3))
+        for name, table in categorical.items():
+            print(f"\n{name}")
+            print(table.round(3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,370 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import joblib
+import numpy as np
+
+# Make `helper_functions` importable the same way app.py sees it
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'customer_churn_app'))
+
+from helper_functions.compare_models import COMPARISON_MODELS, SAVED_MODELS_DIR  # noqa: E402
+from helper_functions.load_customers import load_customers  # noqa: E402
+from helper_functions.model_features import model_feature_sets  # noqa: E402
+from dataset_store import load_dataset, save_dataset  # noqa: E402
+
+#  python src/model_pipeline.py                                        # tune and train all six models
+#  python src/model_pipeline.py --models XGBClassifier LGBMClassifier --workers 4 --promote
+#  python src/model_pipeline.py --smote --folds 10
+
+DATA_PATH = os.path.join(PROJECT_DIR, 'data', 'telco_customer_churn.csv')
+
+# Cross-validation folds, computed once per (labels, folds, seed) and reused by every model and every run
+FOLDS_DIR = os.path.join(PROJECT_DIR, 'saved_data', 'cv_folds')
+
+# Index of every trained artifact: model name -> list of versions with their parameters and scores
+MANIFEST_PATH = os.path.join(SAVED_MODELS_DIR, 'manifest.json')
+
+# Same split as notebooks/02_modelling.ipynb
+TEST_SIZE = 0.3
+RANDOM_STATE = 42
+
+# Boosters train up to `n_estimators` rounds and stop once validation AUC has not improved for this many
+EARLY_STOPPING_ROUNDS = 50
+
+# Candidate hyperparameters per model; every combination is cross-validated. Workers run one model each, so the
+# libraries' own threading is switched off to avoid oversubscribing the cores.
+PARAM_GRIDS = {
+    'LogisticRegression': {'C': [0.1, 1.0, 10.0], 'max_iter': [1000], 'random_state': [RANDOM_STATE]},
+    'SVC': {'kernel': ['linear'], 'C': [0.1, 1.0], 'random_state': [RANDOM_STATE]},
+    'DecisionTreeClassifier': {'criterion': ['entropy'], 'max_depth': [4, 6, 8, None], 'min_samples_leaf': [1, 5],
+                               'random_state': [RANDOM_STATE]},
+    'XGBClassifier': {'max_depth': [4, 6], 'learning_rate': [0.05, 0.1], 'n_estimators': [1000], 'n_jobs': [1],
+                      'random_state': [RANDOM_STATE]},
+    'LGBMClassifier': {'num_leaves': [15, 31], 'max_depth': [6], 'learning_rate': [0.05, 0.1],
+                       'n_estimators': [1000], 'n_jobs': [1], 'verbose': [-1], 'random_state': [RANDOM_STATE]},
+    'CatBoostClassifier': {'depth': [4, 6], 'learning_rate': [0.05, 0.1], 'iterations': [1000],
+                           'thread_count': [1], 'verbose': [0], 'random_seed': [RANDOM_STATE]},
+}
+
+# Boosters whose number of rounds is chosen by early stopping, and the parameter that holds it
+ROUNDS_PARAMS = {'XGBClassifier': 'n_estimators', 'LGBMClassifier': 'n_estimators', 'CatBoostClassifier': 'iterations'}
+
+
+def make_model(name, params):
+    """
+    Instantiates a classifier by name; each library is imported only when one of its models is built.
+
+    Args:
+        name (str): A key of `PARAM_GRIDS`
+        params (dict): Constructor arguments
+
+    Returns:
+        object: Unfitted estimator
+    """
+    if name == 'LogisticRegression':
+        from sklearn.linear_model import LogisticRegression
+        return LogisticRegression(**params)
+    if name == 'SVC':
+        from sklearn.svm import SVC
+        return SVC(**params)
+    if name == 'DecisionTreeClassifier':
+        from sklearn.tree import DecisionTreeClassifier
+        return DecisionTreeClassifier(**params)
+    if name == 'XGBClassifier':
+        from xgboost import XGBClassifier
+        return XGBClassifier(**params)
+    if name == 'LGBMClassifier':
+        from lightgbm import LGBMClassifier
+        return LGBMClassifier(**params)
+    if name == 'CatBoostClassifier':
+        from catboost import CatBoostClassifier
+        return CatBoostClassifier(**params)
+    raise ValueError(f"Unknown model: {name}")
+
+
+def fit_model(name, params, X_train, y_train, X_val=None, y_val=None):
+    """
+    Fits a classifier, with early stopping on the validation set for the boosters when one is given.
+
+    Args:
+        name (str): A key of `PARAM_GRIDS`
+        params (dict): Constructor arguments
+        X_train, y_train (np.ndarray): Training data
+        X_val, y_val (np.ndarray | None): Validation data used for early stopping
+
+    Returns:
+        tuple: (fitted model, number of boosting rounds kept - None for non-boosters or without early stopping)
+    """
+    if X_val is None or name not in ROUNDS_PARAMS:
+        return make_model(name, params).fit(X_train, y_train), None
+
+    if name == 'XGBClassifier':
+        model = make_model(name, {**params, 'early_stopping_rounds': EARLY_STOPPING_ROUNDS, 'eval_metric': 'auc'})
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
+        return model, model.best_iteration + 1
+
+    if name == 'LGBMClassifier':
+        import lightgbm
+        model = make_model(name, params)
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], eval_metric='auc',
+                  callbacks=[lightgbm.early_stopping(EARLY_STOPPING_ROUNDS, verbose=False)])
+        return model, model.best_iteration_
+
+    model = make_model(name, params)
+    model.fit(X_train, y_train, eval_set=(X_val, y_val), early_stopping_rounds=EARLY_STOPPING_ROUNDS, verbose=False)
+    return model, model.get_best_iteration() + 1
+
+
+def positive_scores(model, X):
+    """
+    Churn scores for ranking metrics: the positive-class probability, or the decision function for models trained
+    without probabilities (the linear SVC).
+    """
+    if hasattr(model, 'predict_proba'):
+        return model.predict_proba(X)[:, 1]
+    return model.decision_function(X)
+
+
+def load_training_data(path=DATA_PATH):
+    """
+    Reads the labelled customer CSV and builds both feature matrices once (from the feature cache on reruns).
+
+    Args:
+        path (str): CSV shaped like `data/telco_customer_churn.csv`
+
+    Returns:
+        tuple: (dict of feature set name -> float matrix, 0/1 labels), rows aligned
+    """
+    data = load_customers(path, categorical=False)
+
+    labels = (data.pop('Churn') == 'Yes').astype(int)
+    X_tree, X_linear = model_feature_sets(data, cache=True)
+
+    feature_sets = {'tree': X_tree.to_numpy(), 'linear': X_linear.to_numpy()}
+    return feature_sets, labels.loc[X_tree.index].to_numpy()
+
+
+def cached_folds(y, n_splits=5, seed=RANDOM_STATE, folds_dir=FOLDS_DIR):
+    """
+    Stratified K-fold indices, computed once and then read back from disk.
+
+    The cache key covers the labels and the splitting parameters, so new data or settings get new folds while
+    every model in a run (and every rerun) is evaluated on exactly the same ones.
+
+    Args:
+        y (np.ndarray): Training labels
+        n_splits (int): Number of folds
+        seed (int): Shuffling seed
+        folds_dir (str): Cache directory
+
+    Returns:
+        list[tuple]: (train indices, validation indices) per fold
+    """
+    key = hashlib.sha256(np.ascontiguousarray(y, dtype=np.int8).tobytes() + f"{n_splits}:{seed}".encode())
+    path = os.path.join(folds_dir, f"folds_{key.hexdigest()[:16]}.npz")
+
+    if os.path.exists(path):
+        with np.load(path) as cache:
+            return [(cache[f'train_{i}'], cache[f'val_{i}']) for i in range(n_splits)]
+
+    from sklearn.model_selection import StratifiedKFold
+    folds = list(StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed).split(np.zeros(len(y)), y))
+
+    os.makedirs(folds_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    arrays = {f'{part}_{i}': idx for i, fold in enumerate(folds) for part, idx in zip(('train', 'val'), fold)}
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    return folds
+
+
+def param_combinations(grid):
+    """
+    Expands a parameter grid into every combination, as dicts.
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+# Training data of a pool worker, set once by `_init_worker` instead of being pickled with every task
+_worker_data = {}
+
+
+def _init_worker(store_dir, kinds, folds, smote):
+    """
+    Pool initializer: memory-maps the training matrices and labels from the run's dataset store, so every worker
+    shares the same pages instead of holding its own copy.
+    """
+    feature_sets = {kind: load_dataset(f'X_train_{kind}', store_dir) for kind in kinds}
+    _worker_data.update(feature_sets=feature_sets, y=load_dataset('y_train', store_dir), folds=folds, smote=smote)
+
+
+def cross_validate(name, params):
+    """
+    Scores one parameter combination by cross-validated ROC AUC (runs inside a pool worker).
+
+    Args:
+        name (str): A key of `PARAM_GRIDS`
+        params (dict): Constructor arguments
+
+    Returns:
+        dict: name, params, mean and per-fold AUC, the early-stopped rounds per fold and the wall time
+    """
+    from sklearn.metrics import roc_auc_score
+
+    start = time.perf_counter()
+    X = _worker_data['feature_sets'][COMPARISON_MODELS[name]]
+    y = _worker_data['y']
+
+    aucs, rounds = [], []
+    for train_idx, val_idx in _worker_data['folds']:
+        X_train, y_train = X[train_idx], y[train_idx]
+
+        # Oversample the training part of the fold only, so validation scores stay honest
+        if _worker_data['smote']:
+            from imblearn.over_sampling import SMOTE
+            X_train, y_train = SMOTE(random_state=RANDOM_STATE).fit_resample(X_train, y_train)
+
+        model, kept = fit_model(name, params, X_train, y_train, X[val_idx], y[val_idx])
+        aucs.append(roc_auc_score(y[val_idx], positive_scores(model, X[val_idx])))
+        rounds.append(kept)
+
+    return {'name': name, 'params': params, 'auc': float(np.mean(aucs)), 'fold_aucs': [float(a) for a in aucs],
+            'rounds': rounds, 'seconds': time.perf_counter() - start}
+
+
+def _update_manifest(entries, manifest_path=MANIFEST_PATH):
+    """
+    Appends trained versions to the manifest, replacing the file atomically.
+    """
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    for entry in entries:
+        manifest.setdefault(entry['name'], []).append(entry)
+
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def run_pipeline(models=None, workers=None, n_splits=5, smote=False, promote=False, data_path=DATA_PATH):
+    """
+    Tunes, trains and saves the candidate models.
+
+    The feature matrices are built once and the CV folds come from the on-disk cache. Every (model, parameters)
+    combination is cross-validated in a process pool whose workers memory-map the training data, with boosters
+    early-stopped on each fold's validation part. The best combination per model is refitted on the full training
+    split - boosters with the mean early-stopped round count - scored on the held-out test split and saved as
+    `saved_models/<name>_<version>.pkl`.
+
+    Args:
+        models (list[str] | None): Models to train; all of `PARAM_GRIDS` when None
+        workers (int | None): Pool size (default: one per CPU)
+        n_splits (int): Number of CV folds
+        smote (bool): Oversample the minority class in every training fold, as the notebook did
+        promote (bool): Also copy each new version over `saved_models/<name>.pkl`, the file the app compares
+        data_path (str): Labelled customer CSV
+
+    Returns:
+        list[dict]: Manifest entries of the trained versions
+    """
+    from sklearn.metrics import roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    models = models or list(PARAM_GRIDS)
+    feature_sets, y = load_training_data(data_path)
+
+    # Hold out the test split before any tuning
+    train_idx, test_idx = train_test_split(np.arange(len(y)), test_size=TEST_SIZE, stratify=y,
+                                           random_state=RANDOM_STATE)
+    train_sets = {kind: X[train_idx] for kind, X in feature_sets.items()}
+    y_train, y_test = y[train_idx], y[test_idx]
+    folds = cached_folds(y_train, n_splits=n_splits, folds_dir=FOLDS_DIR)
+
+    tasks = [(name, params) for name in models for params in param_combinations(PARAM_GRIDS[name])]
+    print(f"Cross-validating {len(tasks)} candidates on {len(y_train)} rows ({n_splits} folds)")
+
+    best = {}
+    with tempfile.TemporaryDirectory(prefix='model_pipeline_') as store_dir:
+        for kind, X in train_sets.items():
+            save_dataset(f'X_train_{kind}', X, store_dir)
+        save_dataset('y_train', y_train, store_dir)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(store_dir, list(train_sets), folds, smote)) as pool:
+            for future in as_completed([pool.submit(cross_validate, name, params) for name, params in tasks]):
+                result = future.result()
+                print(f"  {result['name']:<24} AUC {result['auc']:.4f}  {result['seconds']:6.1f} s  "
+                      f"{result['params']}")
+                if result['name'] not in best or result['auc'] > best[result['name']]['auc']:
+                    best[result['name']] = result
+
+    version = time.strftime('%Y%m%d-%H%M%S')
+    data_hash = hashlib.sha256(b''.join(X.tobytes() for X in feature_sets.values()) + y.tobytes()).hexdigest()
+
+    entries = []
+    for name in models:
+        result = best[name]
+        params = dict(result['params'])
+        if name in ROUNDS_PARAMS and result['rounds'][0] is not None:
+            params[ROUNDS_PARAMS[name]] = int(np.mean(result['rounds']))
+
+        X_train = train_sets[COMPARISON_MODELS[name]]
+        X_test = feature_sets[COMPARISON_MODELS[name]][test_idx]
+        fit_X, fit_y = X_train, y_train
+        if smote:
+            from imblearn.over_sampling import SMOTE
+            fit_X, fit_y = SMOTE(random_state=RANDOM_STATE).fit_resample(X_train, y_train)
+        model, _ = fit_model(name, params, fit_X, fit_y)
+
+        path = os.path.join(SAVED_MODELS_DIR, f"{name}_{version}.pkl")
+        joblib.dump(model, path)
+        if promote:
+            tmp_path = os.path.join(SAVED_MODELS_DIR, f".{name}.pkl.tmp")
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, os.path.join(SAVED_MODELS_DIR, f"{name}.pkl"))
+
+        entry = {'name': name, 'version': version, 'path': os.path.relpath(path, PROJECT_DIR), 'params': params,
+                 'cv_auc': result['auc'], 'test_auc': float(roc_auc_score(y_test, positive_scores(model, X_test))),
+                 'feature_set': COMPARISON_MODELS[name], 'data_sha256': data_hash, 'smote': smote,
+                 'promoted': promote}
+        entries.append(entry)
+        print(f"{name:<24} test AUC {entry['test_auc']:.4f} -> {entry['path']}")
+
+    _update_manifest(entries, MANIFEST_PATH)
+    return entries
+
+
+def main():
+    """
+    Command-line entry point for retraining the candidate models.
+    """
+    parser = argparse.ArgumentParser(description="Tune and train the churn models in parallel.")
+    parser.add_argument('--models', nargs='+', choices=list(PARAM_GRIDS), help="models to train (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--folds', type=int, default=5, help="cross-validation folds (default: 5)")
+    parser.add_argument('--smote', action='store_true', help="oversample churners in every training fold")
+    parser.add_argument('--promote', action='store_true',
+                        help="replace saved_models/<name>.pkl with the new version")
+    parser.add_argument('--data', default=DATA_PATH, help="labelled customer CSV")
+    args = parser.parse_args()
+
+    run_pipeline(models=args.models, workers=args.workers, n_splits=args.folds, smote=args.smote,
+                 promote=args.promote, data_path=args.data)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Make `helper_functions` importable the same way app.py sees it
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'customer_churn_app'))
+
+from helper_functions.create_feature_matrix import create_feature_matrix  # noqa: E402
+from helper_functions.load_customers import load_customers  # noqa: E402
+from eda_profiler import Moments, QuantileSketch  # noqa: E402
+
+#  python src/segment_churn.py                                              # the notebook's five segmentations
+#  python src/segment_churn.py /data/extract.csv --workers 8 --segments billing_flag Contract PaymentMethod
+
+DATA_PATH = os.path.join(PROJECT_DIR, 'data', 'telco_customer_churn.csv')
+
+# Segmentations analysed in notebooks/02_modelling.ipynb
+SEGMENTATIONS = ['billing_flag', 'tenure_bin', 'monthly_pricing_tiers', 'progress_bin', 'avg_charge_bin']
+
+# `progress_bin` as the notebook defines it
+PROGRESS_BINS = [0, 0.2, 0.4, 0.6, 0.8, 1.2]
+PROGRESS_LABELS = ['0–20%', '20–40%', '40–60%', '60–80%', '80–120%']
+
+
+def segment_labels(features, segmentation, avg_charge_edges=None):
+    """
+    Labels every customer with their segment.
+
+    `progress_bin` and `avg_charge_bin` are the notebook's derived bins; any other name is taken as a column of the
+    feature matrix (e.g. 'Contract' or 'PaymentMethod').
+
+    Args:
+        features (pd.DataFrame): Output of `create_feature_matrix`
+        segmentation (str): Segmentation name
+        avg_charge_edges (list[float] | None): Bin edges for `avg_charge_bin`
+
+    Returns:
+        pd.Series: Segment of every row (NaN for rows outside every bin)
+    """
+    if segmentation == 'progress_bin':
+        return pd.cut(features['contract_progress'], bins=PROGRESS_BINS, labels=PROGRESS_LABELS)
+    if segmentation == 'avg_charge_bin':
+        # The notebook's `pd.qcut(q=5)` needs the whole column; fixed quintile edges give the same bins chunk by chunk
+        return pd.cut(features['average_charges_per_month'], bins=avg_charge_edges, include_lowest=True,
+                      duplicates='drop')
+    return features[segmentation]
+
+
+def partial_state(chunk, segmentations, avg_charge_edges=None):
+    """
+    Customer and churner counts per segment for one chunk - the mergeable partial result.
+
+    Args:
+        chunk (pd.DataFrame): Raw customer data (as read by `load_customers`) with a Yes/No `Churn` column
+        segmentations (list[str]): Segmentations to count
+        avg_charge_edges (list[float] | None): Bin edges for `avg_charge_bin`
+
+    Returns:
+        dict: Segmentation -> DataFrame of `count` and `churned`, indexed by segment
+    """
+    chunk = chunk.copy()
+    churned = (chunk.pop('Churn') == 'Yes').astype(np.int64)
+
+    with warnings.catch_warnings():
+        # `create_feature_matrix` assigns to a filtered frame; harmless here
+        warnings.simplefilter('ignore', pd.errors.SettingWithCopyWarning)
+        features = create_feature_matrix(chunk)
+    churned = churned.loc[features.index]
+
+    state = {}
+    for segmentation in segmentations:
+        labels = segment_labels(features, segmentation, avg_charge_edges)
+        grouped = churned.groupby(labels.astype(object), sort=False).agg(['size', 'sum'])
+        state[segmentation] = grouped.rename(columns={'size': 'count', 'sum': 'churned'})
+    return state
+
+
+def merge_states(left, right):
+    """
+    Combines two partial results. Associative and commutative, so chunks and processes can be merged in any order.
+
+    Args:
+        left, right (dict): Outputs of `partial_state` (or of earlier merges)
+
+    Returns:
+        dict: The combined counts
+    """
+    merged = dict(left)
+    for segmentation, counts in right.items():
+        if segmentation in merged:
+            merged[segmentation] = merged[segmentation].add(counts, fill_value=0).astype(np.int64)
+        else:
+            merged[segmentation] = counts
+    return merged
+
+
+def average_charge_edges(path, chunksize=500_000, q=5):
+    """
+    Quintile edges of `average_charges_per_month` for `avg_charge_bin`, from a light pass over two columns.
+
+    Uses the streaming quantile sketch from `eda_profiler` (within 1%), with the exact min and max as outer edges.
+
+    Args:
+        path (str): Customer CSV
+        chunksize (int): Rows per chunk
+        q (int): Number of bins
+
+    Returns:
+        list[float]: q + 1 increasing edges
+    """
+    sketch = QuantileSketch()
+    moments = Moments()
+    for chunk in load_customers(path, chunksize=chunksize, usecols=['tenure', 'TotalCharges']):
+        average = (chunk['TotalCharges'] / chunk['tenure']).round(2)
+        values = average[np.isfinite(average)].to_numpy()
+        sketch.update(values)
+        moments.update(values)
+
+    inner = [sketch.quantile(i / q) for i in range(1, q)]
+    return [moments.min] + inner + [moments.max]
+
+
+def segment_churn(path=DATA_PATH, segmentations=SEGMENTATIONS, chunksize=100_000, workers=None,
+                  avg_charge_edges=None):
+    """
+    Churn rate per segment for many segmentations, in one parallel pass over a customer CSV.
+
+    Chunks are read in order and handed to a process pool; each worker engineers the features once and counts every
+    segmentation, and the parent merges the partial counts as they come back. At most two chunks per worker are in
+    flight, so memory stays bounded.
+
+    Args:
+        path (str): CSV shaped like `data/telco_customer_churn.csv`
+        segmentations (list[str]): Segmentations to analyse
+        chunksize (int): Rows per chunk
+        workers (int | None): Worker processes (default: one per CPU)
+        avg_charge_edges (list[float] | None): Bin edges for `avg_charge_bin`; computed with an extra light pass over
+            two columns when needed and not given
+
+    Returns:
+        dict: Segmentation -> DataFrame of `count`, `churned`, `churn_rate` and `share`, indexed by segment
+    """
+    if 'avg_charge_bin' in segmentations and avg_charge_edges is None:
+        avg_charge_edges = average_charge_edges(path)
+
+    workers = workers or os.cpu_count() or 1
+    state = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = []
+        for chunk in load_customers(path, categorical=False, chunksize=chunksize):
+            in_flight.append(pool.submit(partial_state, chunk, segmentations, avg_charge_edges))
+            if len(in_flight) >= 2 * workers:
+                state = merge_states(state, in_flight.pop(0).result())
+        for future in in_flight:
+            state = merge_states(state, future.result())
+
+    tables = {}
+    for segmentation in segmentations:
+        table = state.get(segmentation, pd.DataFrame(columns=['count', 'churned'], dtype=np.int64)).copy()
+        table['churn_rate'] = table['churned'] / table['count']
+        table['share'] = table['count'] / table['count'].sum()
+        table.index.name = segmentation
+        try:
+            tables[segmentation] = table.sort_index()
+        except TypeError:
+            # Mixed label types (e.g. a missing segment next to strings)
+            tables[segmentation] = table.sort_index(key=lambda index: index.map(str))
+    return tables
+
+
+def main():
+    """
+    Command-line entry point: print the churn rate of every segment.
+    """
+    parser = argparse.ArgumentParser(description="Churn rate per customer segment in one parallel pass.")
+    parser.add_argument('path', nargs='?', default=DATA_PATH, help="customer CSV (default: the Telco sample)")
+    parser.add_argument('--segments', nargs='+', default=SEGMENTATIONS, help="segmentations to analyse")
+    parser.add_argument('--chunksize', type=int, default=100_000, help="rows per chunk (default: 100000)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    tables = segment_churn(args.path, args.segments, chunksize=args.chunksize, workers=args.workers)
+    for segmentation, table in tables.items():
+        print(f"\n{segmentation}")
+        print(table.round(3))
+
+
+if __name__ == '__main__':
+    main()
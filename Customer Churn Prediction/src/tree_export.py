@@ -0,0 +1,320 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+import joblib
+import numpy as np
+
+# Make `helper_functions` importable the same way app.py sees it
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'customer_churn_app'))
+
+from helper_functions.model_registry import MODEL_PATH, COMPILED_MODEL_PATH  # noqa: E402
+from helper_functions.tree_evaluator import (MISSING_NAN, MISSING_ZERO, PackedEnsemble, PackedTrees,  # noqa: E402
+                                             pack_trees, save_packed_model)
+from dataset_store import STORE_DIR, MANIFEST_NAME, load_dataset  # noqa: E402
+
+#  python src/tree_export.py                                    # voting ensemble -> .npz next to it
+#  python src/tree_export.py saved_models/XGBClassifier.pkl --output /tmp/xgb.npz
+#  python src/tree_export.py model.pkl --check-data X_check.pkl        # verify on another feature matrix
+
+# Test split used to check that the exported model reproduces the original
+CHECK_DATA_PATH = os.path.join(PROJECT_DIR, 'saved_data', 'train_test_data', 'X_test_tree.pkl')
+CHECK_FEATURES_PATH = os.path.join(PROJECT_DIR, 'saved_data', 'feature_names', 'tree_feature_names.pkl')
+
+
+def _empty_tree():
+    return {'feature': [], 'threshold': [], 'left': [], 'right': [], 'default_left': [], 'missing': [], 'value': []}
+
+
+def _add_node(tree, feature=0, threshold=0.0, default_left=False, missing=MISSING_NAN, value=0.0):
+    """
+    Appends a node (a leaf until its children are set) and returns its index.
+    """
+    for name, item in [('feature', feature), ('threshold', threshold), ('left', -1), ('right', -1),
+                       ('default_left', default_left), ('missing', missing), ('value', value)]:
+        tree[name].append(item)
+    return len(tree['feature']) - 1
+
+
+def export_sklearn_trees(model):
+    """
+    Exports a scikit-learn DecisionTreeClassifier, RandomForestClassifier or ExtraTreesClassifier.
+
+    Rows go left when `float32(x) <= threshold`; each leaf stores the fraction of positive training samples, and a
+    forest averages them. Trees fitted with missing-value support send NaN the way they learned.
+
+    Returns:
+        PackedTrees: The exported model
+    """
+    trees = []
+    for estimator in getattr(model, 'estimators_', [model]):
+        t = estimator.tree_
+        values = t.value[:, 0, :]
+        missing_left = getattr(t, 'missing_go_to_left', np.zeros(t.node_count, dtype=bool))
+        trees.append({
+            'feature': t.feature, 'threshold': t.threshold, 'left': t.children_left, 'right': t.children_right,
+            'default_left': missing_left, 'missing': [MISSING_NAN] * t.node_count,
+            'value': values[:, 1] / values.sum(axis=1),
+        })
+    return PackedTrees(pack_trees(trees), strict=False, float32=True, link='mean')
+
+
+def export_xgboost(model):
+    """
+    Exports an XGBClassifier trained with the binary:logistic objective.
+
+    Rows go left when `float32(x) < split_condition`, NaN follows the node's `missing` branch, and the probability
+    is the sigmoid of the base margin plus the summed leaves.
+
+    Returns:
+        PackedTrees: The exported model
+    """
+    booster = model.get_booster()
+    config = json.loads(booster.save_config())
+    objective = config['learner']['objective']['name']
+    if objective != 'binary:logistic':
+        raise NotImplementedError(f"Unsupported XGBoost objective: {objective}")
+
+    # base_score is a probability; newer releases store it as '[5E-1]'
+    base_score = float(config['learner']['learner_model_param']['base_score'].strip('[]'))
+    base_margin = np.log(base_score / (1.0 - base_score))
+
+    feature_index = {name: i for i, name in enumerate(booster.feature_names or [])}
+    dumps = booster.get_dump(dump_format='json')
+
+    # Only the trees predict_proba uses when early stopping kept a best iteration
+    best_iteration = getattr(model, 'best_iteration', None)
+    if best_iteration is not None:
+        trees_per_round = model.get_params().get('num_parallel_tree') or 1
+        dumps = dumps[:(best_iteration + 1) * trees_per_round]
+
+    def feature(split):
+        return feature_index[split] if split in feature_index else int(split.lstrip('f'))
+
+    def visit(tree, node):
+        if 'leaf' in node:
+            return _add_node(tree, value=node['leaf'])
+        if 'split_condition' not in node or 'categories' in node:
+            raise NotImplementedError("Categorical XGBoost splits are not supported")
+
+        index = _add_node(tree, feature=feature(node['split']), threshold=np.float32(node['split_condition']),
+                          default_left=node['missing'] == node['yes'])
+        children = {child['nodeid']: child for child in node['children']}
+        tree['left'][index] = visit(tree, children[node['yes']])
+        tree['right'][index] = visit(tree, children[node['no']])
+        return index
+
+    trees = []
+    for dump in dumps:
+        tree = _empty_tree()
+        visit(tree, json.loads(dump))
+        trees.append(tree)
+
+    return PackedTrees(pack_trees(trees), strict=True, float32=True, link='logit', base_margin=base_margin)
+
+
+def export_lightgbm(model):
+    """
+    Exports an LGBMClassifier trained with the binary objective.
+
+    Rows go left when `x <= threshold` (compared in float64), missing values follow each node's missing type and
+    default direction, and the probability is the sigmoid of the summed leaves times the objective's sigmoid factor.
+
+    Returns:
+        PackedTrees: The exported model
+    """
+    dump = model.booster_.dump_model(num_iteration=getattr(model, 'best_iteration_', None) or None)
+    objective = dump['objective'].split()
+    if objective[0] != 'binary':
+        raise NotImplementedError(f"Unsupported LightGBM objective: {dump['objective']}")
+
+    # e.g. 'binary sigmoid:1'
+    scale = next((float(part.split(':')[1]) for part in objective[1:] if part.startswith('sigmoid:')), 1.0)
+
+    def visit(tree, node):
+        if 'leaf_value' in node:
+            return _add_node(tree, value=node['leaf_value'])
+        if node['decision_type'] != '<=':
+            raise NotImplementedError("Categorical LightGBM splits are not supported")
+
+        # Missing type 'None' compares NaN as 0, i.e. NaN always goes the way 0 would
+        if node['missing_type'] == 'None':
+            default_left, missing = 0.0 <= node['threshold'], MISSING_NAN
+        else:
+            default_left = node['default_left']
+            missing = MISSING_ZERO if node['missing_type'] == 'Zero' else MISSING_NAN
+
+        index = _add_node(tree, feature=node['split_feature'], threshold=node['threshold'],
+                          default_left=default_left, missing=missing)
+        tree['left'][index] = visit(tree, node['left_child'])
+        tree['right'][index] = visit(tree, node['right_child'])
+        return index
+
+    trees = []
+    for info in dump['tree_info']:
+        tree = _empty_tree()
+        visit(tree, info['tree_structure'])
+        trees.append(tree)
+
+    return PackedTrees(pack_trees(trees), strict=False, float32=False, link='logit', scale=scale)
+
+
+def export_catboost(model):
+    """
+    Exports a CatBoostClassifier trained on numeric features with the Logloss objective.
+
+    CatBoost trees are oblivious: every level applies one split (`float32(x) > border` sets a bit of the leaf
+    index). Each tree is expanded into the equivalent binary tree, visiting the last split first so that the leaves,
+    read left to right, are in CatBoost's leaf-index order.
+
+    Returns:
+        PackedTrees: The exported model
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.json')
+        model.save_model(path, format='json')
+        with open(path) as f:
+            dump = json.load(f)
+
+    if dump['features_info'].get('categorical_features'):
+        raise NotImplementedError("CatBoost models with categorical features are not supported")
+
+    float_features = {info['feature_index']: info for info in dump['features_info']['float_features']}
+    scale, bias = dump.get('scale_and_bias', [1.0, [0.0]])
+    bias = bias[0] if isinstance(bias, list) else bias
+
+    trees = []
+    for oblivious in dump['oblivious_trees']:
+        splits = oblivious.get('splits', [])
+        leaf_values = oblivious['leaf_values']
+        depth = len(splits)
+        tree = _empty_tree()
+
+        # Heap layout: node i has children 2i+1 (bit 0, left) and 2i+2 (bit 1, right)
+        for i in range(2 ** depth - 1):
+            level = int(np.log2(i + 1))
+            split = splits[depth - 1 - level]
+            if split.get('split_type', 'FloatFeature') != 'FloatFeature':
+                raise NotImplementedError(f"Unsupported CatBoost split: {split.get('split_type')}")
+            info = float_features[split['float_feature_index']]
+            _add_node(tree, feature=info['flat_feature_index'], threshold=np.float32(split['border']),
+                      default_left=info.get('nan_value_treatment', 'AsIs') != 'AsTrue')
+            tree['left'][i], tree['right'][i] = 2 * i + 1, 2 * i + 2
+        for value in leaf_values:
+            _add_node(tree, value=value)
+
+        trees.append(tree)
+
+    return PackedTrees(pack_trees(trees), strict=False, float32=True, link='logit', base_margin=bias, scale=scale)
+
+
+# Exporter for each supported estimator, by class name
+EXPORTERS = {
+    'DecisionTreeClassifier': export_sklearn_trees,
+    'RandomForestClassifier': export_sklearn_trees,
+    'ExtraTreesClassifier': export_sklearn_trees,
+    'XGBClassifier': export_xgboost,
+    'LGBMClassifier': export_lightgbm,
+    'CatBoostClassifier': export_catboost,
+}
+
+
+def export_model(model, feature_names=None):
+    """
+    Flattens a fitted tree classifier, or a soft-voting ensemble of them, into a NumPy-only model.
+
+    Args:
+        model: Fitted estimator (one of `EXPORTERS`, or a VotingClassifier with voting='soft')
+        feature_names (list[str] | None): Training columns, when the model did not record them
+
+    Returns:
+        PackedEnsemble: Model whose `predict_proba` matches the original
+    """
+    name = model.__class__.__name__
+
+    if name == 'VotingClassifier':
+        if model.voting != 'soft':
+            raise NotImplementedError("Only soft-voting ensembles can be exported")
+        components = [EXPORTERS[est.__class__.__name__](est) for est in model.estimators_]
+        weights = model.weights if model.weights is not None else [1.0] * len(components)
+    elif name in EXPORTERS:
+        components, weights = [EXPORTERS[name](model)], [1.0]
+    else:
+        raise NotImplementedError(f"Cannot export {name}; supported: {', '.join(EXPORTERS)} and VotingClassifier")
+
+    if feature_names is None:
+        feature_names = getattr(model, 'feature_names_in_', None)
+    if feature_names is None:
+        feature_names = joblib.load(CHECK_FEATURES_PATH)
+    return PackedEnsemble(components, weights, list(feature_names))
+
+
+def check_export(model, packed, X):
+    """
+    Measures how far the exported model's probabilities are from the original's.
+
+    Args:
+        model: Original estimator
+        packed (PackedEnsemble): Exported model
+        X (np.ndarray): Feature matrix in training column order
+
+    Returns:
+        float: Largest absolute difference in the churn probability
+    """
+    expected = np.asarray(model.predict_proba(X))[:, 1]
+    return float(np.max(np.abs(packed.predict_proba(X)[:, 1] - expected)))
+
+
+def main():
+    """
+    Command-line entry point: export a pickled model and verify it on the saved test split.
+    """
+    parser = argparse.ArgumentParser(description="Export a tree model to the NumPy-only packed format.")
+    parser.add_argument('model', nargs='?', default=MODEL_PATH, help="pickled model (default: the voting ensemble)")
+    parser.add_argument('--output', help="destination .npz (default: next to the model, or the serving path for "
+                                         "the voting ensemble)")
+    parser.add_argument('--tolerance', type=float, default=1e-6,
+                        help="largest allowed probability difference on the test split (default: 1e-6)")
+    parser.add_argument('--check-data', help="pickled feature matrix to verify on (default: the saved test split)")
+    parser.add_argument('--no-check', action='store_true',
+                        help="write the export without verifying it (the registry will serve it unverified)")
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    packed = export_model(model)
+
+    # The registry serves the .npz in place of the pickle, so it is only written once it has been verified
+    if args.check_data:
+        X_check = joblib.load(args.check_data)
+    elif os.path.exists(os.path.join(STORE_DIR, MANIFEST_NAME)):
+        # The memory-mapped copy of the test split when it has been converted (src/dataset_store.py)
+        X_check = load_dataset('X_test_tree')
+    elif os.path.exists(CHECK_DATA_PATH):
+        X_check = joblib.load(CHECK_DATA_PATH)
+    else:
+        X_check = None
+
+    if X_check is not None and not args.no_check:
+        error = check_export(model, packed, np.asarray(X_check, dtype=np.float64))
+        print(f"Max |probability difference| on the test split: {error:.2e}")
+        if error > args.tolerance:
+            sys.exit(f"Export does not match the original model (tolerance {args.tolerance:.0e}); not written")
+    elif not args.no_check:
+        sys.exit("No data to verify the export on (pass --check-data, or --no-check to skip); not written")
+    else:
+        print("Warning: export not verified (--no-check)")
+
+    output = args.output
+    if output is None:
+        same_model = os.path.abspath(args.model) == os.path.abspath(MODEL_PATH)
+        output = COMPILED_MODEL_PATH if same_model else os.path.splitext(args.model)[0] + '.npz'
+
+    save_packed_model(output, packed)
+    print(f"Packed model written to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+
+def _accuracy(y_true, y_pred):
+    """
+    Share of correct predictions (the default `score` of a classifier).
+    """
+    return float(np.mean(y_true == y_pred))
+
+
+def _roc_auc(y_true, y_score):
+    """
+    ROC AUC via the rank-sum (Mann-Whitney) formula, with ties given their average rank.
+    """
+    ranks = pd.Series(y_score).rank().to_numpy()
+    positives = y_true == 1
+    n_pos = positives.sum()
+    n_neg = len(y_true) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("ROC AUC is undefined when y contains a single class")
+    return float((ranks[positives].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+
+# Built-in metrics: name -> (metric(y_true, output), which model output it needs)
+SCORERS = {
+    'accuracy': (_accuracy, 'predict'),
+    'roc_auc': (_roc_auc, 'score'),
+}
+
+
+def _model_output(model, X, output):
+    """
+    Class predictions, or positive-class scores (probability, else decision function) for ranking metrics.
+    """
+    if output == 'predict':
+        return np.asarray(model.predict(X))
+    if hasattr(model, 'predict_proba'):
+        return np.asarray(model.predict_proba(X))[:, 1]
+    return np.asarray(model.decision_function(X))
+
+
+# State of a permutation-importance worker, sent once per process by `_init_permutation_worker`
+_permutation_state = {}
+
+
+def _init_permutation_worker(state):
+    """
+    Pool initializer: receives the model, data and settings once per worker process.
+    """
+    _permutation_state.update(state)
+
+
+def _permute_feature(j):
+    """
+    Importance of feature `j` over every repeat: baseline score minus the score with that column shuffled.
+
+    All repeats are stacked into one matrix (up to `max_batch_rows` rows at a time) and predicted in a single call.
+    The shuffles come from a generator seeded with (random_state, j), so results do not depend on how features are
+    spread over workers.
+    """
+    state = _permutation_state
+    X, y, n_repeats = state['X'], state['y'], state['n_repeats']
+    metric, output = SCORERS[state['scoring']] if isinstance(state['scoring'], str) else (state['scoring'], 'score')
+
+    rng = np.random.default_rng([state['random_state'], j])
+    n_rows = len(X)
+    per_batch = max(1, state['max_batch_rows'] // n_rows)
+
+    scores = []
+    for start in range(0, n_repeats, per_batch):
+        repeats = min(per_batch, n_repeats - start)
+
+        # `repeats` copies of X, each with column j shuffled independently
+        stacked = np.tile(X, (repeats, 1))
+        for r in range(repeats):
+            stacked[r * n_rows:(r + 1) * n_rows, j] = X[rng.permutation(n_rows), j]
+
+        if state['columns'] is not None:
+            stacked = pd.DataFrame(stacked, columns=state['columns'])
+        predictions = _model_output(state['model'], stacked, output)
+
+        scores.extend(metric(y, predictions[r * n_rows:(r + 1) * n_rows]) for r in range(repeats))
+
+    return state['baseline'] - np.array(scores)
+
+
+def permutation_importance(model, X, y, n_repeats=10, random_state=42, scoring='accuracy', n_jobs=None,
+                           max_batch_rows=2_000_000):
+    """
+    Permutation feature importance, batched and spread over processes.
+
+    Same idea as `sklearn.inspection.permutation_importance`: how much the score drops when one feature's values
+    are shuffled. But the baseline prediction is made once, every repeat for a feature is scored in one stacked
+    predict call instead of `n_repeats` separate ones, and features are handled in parallel worker processes.
+    The shuffles are seeded per feature, so results are reproducible for any `n_jobs` (they differ from
+    scikit-learn's, which draws from a single stream).
+
+    Args:
+        model: Fitted estimator with `predict` (for 'accuracy') or `predict_proba`/`decision_function`
+        X (pd.DataFrame | np.ndarray): Feature matrix; a DataFrame keeps its column names for the model
+        y (array-like): True labels
+        n_repeats (int): Shuffles per feature
+        random_state (int): Base seed
+        scoring (str | callable): 'accuracy', 'roc_auc', or a function(y_true, scores) of positive-class scores
+        n_jobs (int | None): Worker processes; 1 runs in this process, None uses one per CPU
+        max_batch_rows (int): Largest stacked matrix predicted in one call, in rows
+
+    Returns:
+        SimpleNamespace: `importances_mean`, `importances_std` and `importances` (n_features x n_repeats), like the
+        scikit-learn result
+    """
+    columns = list(X.columns) if isinstance(X, pd.DataFrame) else None
+    values = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y)
+
+    metric, output = SCORERS[scoring] if isinstance(scoring, str) else (scoring, 'score')
+    baseline = metric(y, _model_output(model, X, output))
+
+    state = {'model': model, 'X': values, 'y': y, 'columns': columns, 'n_repeats': n_repeats,
+             'random_state': random_state, 'scoring': scoring, 'max_batch_rows': max_batch_rows,
+             'baseline': baseline}
+
+    features = range(values.shape[1])
+    if n_jobs == 1:
+        # Same code path as a worker, but in this process: drop the model and data afterwards
+        _init_permutation_worker(state)
+        try:
+            importances = [_permute_feature(j) for j in features]
+        finally:
+            _permutation_state.clear()
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_permutation_worker,
+                                 initargs=(state,)) as pool:
+            importances = list(pool.map(_permute_feature, features))
+
+    importances = np.vstack(importances)
+    return SimpleNamespace(importances_mean=importances.mean(axis=1), importances_std=importances.std(axis=1),
+                           importances=importances)
+
+
+def calculate_vif(data, center=False, tol=1e-10):
+    """
+    Variance Inflation Factor of every column, all at once.
+
+    VIF_i = 1 / (1 - R²_i), where R²_i comes from regressing column i on all the others. Instead of one regression
+    per column (statsmodels' `variance_inflation_factor`), every VIF is read off the diagonal of the inverse of
+    the correlation matrix, so the cost is one small matrix inversion however many columns there are.
+
+    Inversion uses a Cholesky factorisation. If the matrix is singular or too ill-conditioned for that
+    (e.g. one-hot groups that sum to one), it falls back to an eigendecomposition: columns involved in an exact
+    linear dependency get an infinite VIF and the rest are computed from the well-determined eigenvalues.
+
+    Args:
+        data (pd.DataFrame | np.ndarray): Numeric feature matrix
+        center (bool): If False (default) regress through the origin on the raw columns, exactly as statsmodels'
+            `variance_inflation_factor` does on a matrix without a constant column (the notebook's numbers;
+            `standardize=False` from statsmodels 0.15). True regresses with an intercept, i.e. uses the correlation
+            matrix, like statsmodels 0.15's default `standardize=True`.
+        tol (float): Relative eigenvalue below which the matrix is treated as singular
+
+    Returns:
+        pd.DataFrame: 'feature' and 'VIF' columns, one row per column of `data`
+    """
+    columns = list(data.columns) if isinstance(data, pd.DataFrame) else list(range(np.shape(data)[1]))
+    X = np.asarray(data, dtype=np.float64)
+    if center:
+        X = X - X.mean(axis=0)
+
+    # Scale every column to unit length, so X'X is the correlation matrix (centered) and well scaled either way.
+    # A column with no variation has no meaningful VIF.
+    norms = np.sqrt(np.einsum('ij,ij->j', X, X))
+    constant = norms == 0
+    Z = X[:, ~constant] / norms[~constant]
+    gram = Z.T @ Z
+
+    vif = np.full(len(columns), np.nan)
+    try:
+        factor = np.linalg.cholesky(gram)
+        eigenvalues = np.linalg.eigvalsh(gram)
+        if eigenvalues[0] <= tol * eigenvalues[-1]:
+            raise np.linalg.LinAlgError("ill-conditioned")
+
+        # diag(G^-1) from the Cholesky factor: G^-1 = L^-T L^-1, so its diagonal is the column norms² of L^-1
+        inverse_factor = np.linalg.solve(factor, np.eye(len(gram)))
+        vif[~constant] = np.einsum('ij,ij->j', inverse_factor, inverse_factor)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        singular = eigenvalues <= tol * eigenvalues[-1]
+        inflated = (eigenvectors[:, ~singular] ** 2 / eigenvalues[~singular]).sum(axis=1)
+
+        # A column with weight on a (near-)zero eigenvalue is (almost) a linear combination of the others
+        inflated[(eigenvectors[:, singular] ** 2).sum(axis=1) > tol ** 0.5] = np.inf
+        vif[~constant] = inflated
+
+    return pd.DataFrame({'feature': columns, 'VIF': vif})
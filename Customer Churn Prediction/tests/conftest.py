@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Make `helper_functions` and the `src` scripts importable the same way the scripts themselves see them
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'customer_churn_app'))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'src'))
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+import batch_score as batch_score_module
+from batch_score import batch_score
+from helper_functions.customer_store import CustomerStore
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data',
+                         'telco_customer_churn.csv')
+
+
+def test_failed_run_leaves_nothing_behind(tmp_path, monkeypatch):
+    def broken_model(chunk, **kwargs):
+        raise RuntimeError("model failed")
+
+    closed = []
+    close = CustomerStore.close
+    monkeypatch.setattr(batch_score_module, 'score_frame', broken_model)
+    monkeypatch.setattr(CustomerStore, 'close', lambda self: closed.append(self) or close(self))
+
+    output = tmp_path / 'predictions.csv'
+    with pytest.raises(RuntimeError):
+        batch_score(DATA_PATH, str(output), chunksize=1000, store_path=str(tmp_path / 'customers.db'))
+
+    assert not output.exists() and not (tmp_path / 'predictions.csv.tmp').exists()
+    assert len(closed) == 1
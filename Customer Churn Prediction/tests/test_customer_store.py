@@ -0,0 +1,102 @@
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+import pytest
+
+from helper_functions.customer_store import CUSTOMER_FIELDS, CustomerStore
+from helper_functions.load_customers import load_customers
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data',
+                         'telco_customer_churn.csv')
+
+
+@pytest.fixture
+def customers():
+    return load_customers(DATA_PATH, categorical=False).head(5)[CUSTOMER_FIELDS]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CustomerStore(str(tmp_path / 'customers.db'))
+    yield store
+    store.close()
+
+
+def test_upsert_replaces_the_row(store, customers):
+    store.upsert(customers)
+    changed = customers.head(1).copy()
+    changed['MonthlyCharges'] = 99.5
+    store.upsert(changed)
+
+    assert len(store) == len(customers)
+    assert store.get_customer(changed['customerID'].iloc[0])['MonthlyCharges'] == 99.5
+
+
+def test_unscored_upsert_clears_the_score(store, customers):
+    customer_id = customers['customerID'].iloc[0]
+    store.upsert(customers, probabilities=[0.1, 0.2, 0.3, 0.4, 0.5], predictions=[0, 0, 0, 0, 1])
+    assert store.last_score(customer_id)[:2] == (0.1, 0)
+
+    # New inputs make the old score stale
+    store.upsert(customers.head(1))
+    assert store.last_score(customer_id) is None
+    assert store.last_score(customers['customerID'].iloc[1])[:2] == (0.2, 0)
+
+
+def test_last_score(store, customers):
+    assert store.last_score('unknown') is None
+
+    store.upsert(customers)
+    customer_id = customers['customerID'].iloc[2]
+    assert store.last_score(customer_id) is None
+
+    store.record_scores([customer_id], [0.75], [1])
+    probability, prediction, scored_at = store.last_score(customer_id)
+    assert (probability, prediction) == (0.75, 1) and scored_at
+
+
+def test_customers_by_score(store, customers):
+    store.upsert(customers, probabilities=[0.9, 0.1, 0.5, 0.7, 0.3], predictions=[1, 0, 1, 1, 0])
+    ids = customers['customerID'].tolist()
+
+    assert store.customers_by_score(0.3, 0.7)['customerID'].tolist() == [ids[3], ids[2], ids[4]]
+    assert store.customers_by_score(limit=2)['customerID'].tolist() == [ids[0], ids[3]]
+
+
+@pytest.mark.parametrize('header', [True, False], ids=['header', 'no_header'])
+def test_import_csv(store, customers, tmp_path, header):
+    # `write_to_csv` appends, so the same customer can appear more than once; the last row wins
+    updated = customers.head(1).copy()
+    updated['tenure'] = 60
+    path = tmp_path / 'customer_data.csv'
+    pd.concat([customers, updated]).to_csv(path, index=False, header=header)
+
+    assert store.import_csv(str(path)) == len(customers) + 1
+    assert len(store) == len(customers)
+    assert store.get_customer(updated['customerID'].iloc[0])['tenure'] == 60
+
+
+def test_threads_share_one_connection(tmp_path, customers, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, 'connect', lambda *args, **kwargs: opened.append(1) or connect(*args, **kwargs))
+
+    store = CustomerStore(str(tmp_path / 'customers.db'))
+    store.upsert(customers)
+    found = []
+
+    def lookup():
+        found.append(store.get_customer(customers['customerID'].iloc[0]) is not None)
+
+    # Like Streamlit reruns: every lookup on a new thread
+    threads = [threading.Thread(target=lookup) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+
+    assert found == [True] * 20
+    assert len(opened) == 1
@@ -0,0 +1,19 @@
+import numpy as np
+
+from eda_profiler import QuantileSketch
+
+
+def test_merged_sketch_stays_bounded():
+    small, large = np.geomspace(1, 1.5, 1000), np.geomspace(100, 150, 1000)
+    low, high = QuantileSketch(max_buckets=10), QuantileSketch(max_buckets=10)
+    low.update(small)
+    high.update(large)
+    assert len(low.positive) == len(high.positive) == 10
+
+    low.merge(high)
+    assert len(low.positive) == 10
+    assert low.count == sum(low.positive.values()) == 2000
+
+    # Collapsing only touches the lowest buckets: the upper quantiles keep their accuracy
+    expected = np.quantile(np.r_[small, large], 0.99)
+    assert abs(low.quantile(0.99) - expected) <= 0.01 * expected
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from helper_functions.encode_record import encode_record
+from helper_functions.load_customers import load_customers
+from helper_functions.preprocess_data import preprocess_data
+
+# `create_feature_matrix` assigns to a filtered frame; harmless here
+pytestmark = pytest.mark.filterwarnings('ignore::pandas.errors.SettingWithCopyWarning')
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data',
+                         'telco_customer_churn.csv')
+
+INTERNET_ADD_ONS = ['OnlineSecurity', 'OnlineBackup', 'DeviceProtection', 'TechSupport', 'StreamingTV',
+                    'StreamingMovies']
+
+
+@pytest.fixture(scope='module')
+def telco():
+    return load_customers(DATA_PATH, categorical=False).drop(columns='Churn')
+
+
+def assert_same_as_preprocess(data):
+    """
+    `encode_record` on every row keeps the rows `preprocess_data` keeps, with bit-identical features.
+    """
+    expected = preprocess_data(data.copy())
+    vectors = [encode_record(record) for record in data.to_dict('records')]
+
+    assert [index for index, vector in zip(data.index, vectors) if vector is not None] == list(expected.index)
+    actual = np.array([vector for vector in vectors if vector is not None]).reshape(expected.shape)
+    np.testing.assert_array_equal(actual, expected.to_numpy())
+
+
+def test_matches_preprocess_data_on_the_telco_sample(telco):
+    assert_same_as_preprocess(telco)
+
+
+def edge_record(telco, **fields):
+    record = telco.iloc[0].to_dict()
+    record.update(fields)
+    return record
+
+
+@pytest.mark.parametrize('fields', [
+    {'tenure': 0, 'TotalCharges': np.nan},
+    {'tenure': 0, 'TotalCharges': 0.0},
+    {'tenure': 0, 'TotalCharges': 29.85},
+    {'tenure': 5, 'TotalCharges': np.nan},
+    {'tenure': 72, 'TotalCharges': 2000.0},
+    {'tenure': 73, 'TotalCharges': 2000.0},
+    {'tenure': 100, 'TotalCharges': 3000.0},
+    {'InternetService': 'No', **dict.fromkeys(INTERNET_ADD_ONS, 'No internet service')},
+    {'PhoneService': 'No', 'MultipleLines': 'No phone service'},
+    {'PhoneService': 'No', 'MultipleLines': 'No phone service', 'InternetService': 'No',
+     **dict.fromkeys(INTERNET_ADD_ONS, 'No internet service')},
+], ids=['tenure_0_blank_total', 'tenure_0_zero_total', 'tenure_0', 'blank_total', 'tenure_72', 'tenure_73',
+        'tenure_100', 'no_internet', 'no_phone', 'no_services'])
+def test_matches_preprocess_data_on_edge_records(telco, fields):
+    # One record at a time, as the app scores them
+    assert_same_as_preprocess(pd.DataFrame([edge_record(telco, **fields)]))
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from helper_functions.feature_engineering import (billing_flag, billing_issue, charge_diff, contract_length,
+                                                  contract_lengths, contract_progress, determine_plans,
+                                                  monthly_plans)
+
+CONTRACTS = ['Month-to-month', 'One year', 'Two year']
+
+
+def make_customers(rows=5000, seed=0, contracts=CONTRACTS + ['Weekly', None]):
+    """
+    Random customers with charges on and around every tier/flag boundary, missing charges and unknown contracts.
+    """
+    rng = np.random.default_rng(seed)
+    monthly = rng.choice(np.r_[rng.uniform(0, 130, rows), [0.0, 39.99, 40.0, 69.99, 70.0, 94.99, 95.0, np.nan]],
+                         rows)
+    tenure = rng.integers(0, 73, rows)
+    total = monthly * tenure + rng.choice([0.0, 0.25, -0.5, -0.75, 1.0, 2.0, -3.0], rows) * np.nan_to_num(monthly)
+    total[rng.random(rows) < 0.02] = np.nan
+    return pd.DataFrame({'MonthlyCharges': monthly, 'TotalCharges': total, 'tenure': tenure,
+                         'Contract': rng.choice(np.array(contracts, dtype=object), rows)})
+
+
+def test_monthly_plans_matches_apply():
+    data = make_customers()
+    expected = data['MonthlyCharges'].apply(determine_plans)
+    pdt.assert_series_equal(monthly_plans(data.copy())['monthly_pricing_tiers'], expected,
+                            check_names=False)
+
+
+def test_billing_flag_matches_apply():
+    data = charge_diff(make_customers())
+    expected = data.apply(billing_issue, axis=1)
+    pdt.assert_series_equal(billing_flag(data.copy())['billing_flag'], expected, check_names=False)
+
+
+@pytest.mark.parametrize('contracts', [CONTRACTS, CONTRACTS + ['Weekly', None]], ids=['known', 'with_unknown'])
+def test_contract_progress_matches_apply(contracts):
+    data = make_customers(contracts=contracts)
+    expected = data.copy()
+    expected['contract_length'] = expected['Contract'].apply(contract_length)
+    expected['contract_progress'] = (expected['tenure'] / expected['contract_length']).round(2)
+
+    result = contract_progress(data.copy())
+    pdt.assert_series_equal(result['contract_length'], expected['contract_length'])
+    pdt.assert_series_equal(result['contract_progress'], expected['contract_progress'])
+
+
+def test_all_unknown_contracts_give_nan():
+    # `apply` returns an object column of None here, and dividing tenure by it raised a TypeError; the vectorised
+    # version deliberately returns NaN lengths and progress instead
+    data = pd.DataFrame({'Contract': ['Weekly', None], 'tenure': [3, 4]})
+    assert data['Contract'].apply(contract_length).isna().all()
+
+    pdt.assert_series_equal(contract_lengths(data['Contract']), pd.Series([np.nan, np.nan]))
+    result = contract_progress(data.copy())
+    assert result['contract_progress'].dtype == np.float64 and result['contract_progress'].isna().all()
@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from helper_functions.encode_record import encode_record
+from helper_functions.load_customers import load_customers
+from helper_functions.preprocess_data import preprocess_data
+
+# `create_feature_matrix` assigns to a filtered frame; harmless here
+pytestmark = pytest.mark.filterwarnings('ignore::pandas.errors.SettingWithCopyWarning')
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data',
+                         'telco_customer_churn.csv')
+
+
+@pytest.fixture(scope='module')
+def customers():
+    """
+    The Telco sample plus rows on and past every edge the full feature matrix drops or keeps.
+    """
+    data = load_customers(DATA_PATH, categorical=False).drop(columns='Churn')
+    edges = data.iloc[:9].copy()
+    edges['tenure'] = [0, 0, 72, 73, 100, -1, 12, 12, 12]
+    edges['TotalCharges'] = [np.nan, 0.0, 5000.0, 5100.0, 9000.0, 50.0, 800.0, 800.0, 800.0]
+    edges['Contract'] = ['Month-to-month'] * 6 + ['Weekly', 'One year', 'Two year']
+    edges.iloc[8, edges.columns.get_loc('gender')] = np.nan
+    edges.index = range(len(data), len(data) + len(edges))
+    return pd.concat([data, edges])
+
+
+@pytest.mark.parametrize('option', ['feature_plan', 'low_memory'])
+def test_optimised_paths_score_the_same_rows(customers, option):
+    expected = preprocess_data(customers.copy())
+    result = preprocess_data(customers.copy(), **{option: True})
+    pdt.assert_frame_equal(result, expected)
+
+
+def test_single_record_path_drops_the_same_rows(customers):
+    kept = preprocess_data(customers.copy()).index
+    edges = customers.iloc[-9:]
+    scored = [index for index, record in zip(edges.index, edges.to_dict('records'))
+              if encode_record(record) is not None]
+    assert scored == [index for index in edges.index if index in kept]
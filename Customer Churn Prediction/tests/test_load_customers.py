@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from helper_functions.load_customers import load_customers
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data',
+                         'telco_customer_churn.csv')
+
+
+@pytest.fixture
+def malformed_csv(tmp_path):
+    data = pd.read_csv(DATA_PATH, nrows=6, dtype=str, keep_default_na=False)
+    data.loc[1, 'TotalCharges'] = 'N/A'
+    data.loc[3, 'TotalCharges'] = ' '
+    data.loc[4, 'tenure'] = ''
+    path = tmp_path / 'customers.csv'
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+def test_strict_read_raises_on_junk(malformed_csv, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    with pytest.raises(ValueError):
+        load_customers(malformed_csv, engine=engine)
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+def test_lenient_read_coerces_junk(malformed_csv, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    data = load_customers(malformed_csv, engine=engine, strict=False)
+    assert data['TotalCharges'].dtype == np.float64
+    assert data['TotalCharges'].isna().tolist() == [False, True, False, True, False, False]
+    assert data['tenure'].isna().tolist() == [False, False, False, False, True, False]
+
+
+def test_lenient_chunks_match_whole_read(malformed_csv):
+    whole = load_customers(malformed_csv, categorical=False, engine='c', strict=False)
+    chunks = pd.concat(load_customers(malformed_csv, categorical=False, chunksize=4, strict=False))
+    pdt.assert_frame_equal(chunks, whole)
+
+
+def test_matches_default_read_csv():
+    expected = pd.read_csv(DATA_PATH)
+    expected['TotalCharges'] = pd.to_numeric(expected['TotalCharges'], errors='coerce')
+    for strict in (True, False):
+        pdt.assert_frame_equal(load_customers(DATA_PATH, categorical=False, strict=strict), expected)
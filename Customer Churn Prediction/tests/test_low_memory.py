@@ -0,0 +1,37 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from helper_functions.load_customers import load_customers
+from helper_functions.low_memory import categorise
+from helper_functions.preprocess_data import preprocess_data
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data',
+                         'telco_customer_churn.csv')
+
+
+@pytest.fixture(scope='module')
+def customers():
+    """
+    The Telco sample plus edge rows: tenure 0, the last tenure in the bins, tenures past them up to the int8 limit
+    and a blank TotalCharges.
+    """
+    data = load_customers(DATA_PATH, categorical=False).drop(columns='Churn')
+    edges = data.iloc[:5].copy()
+    edges['tenure'] = [0, 72, 73, 100, 127]
+    edges['TotalCharges'] = [np.nan, 5000.0, 5100.0, 9000.0, 9500.0]
+    edges.index = range(len(data), len(data) + len(edges))
+    return pd.concat([data, edges])
+
+
+def test_tenure_is_not_downcast():
+    data = load_customers(DATA_PATH, categorical=False).head(10)
+    assert categorise(data)['tenure'].dtype == np.int64
+
+
+def test_low_memory_matches_feature_plan(customers):
+    expected = preprocess_data(customers.copy(), feature_plan=True)
+    pdt.assert_frame_equal(preprocess_data(customers.copy(), low_memory=True), expected)
@@ -0,0 +1,95 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import model_pipeline
+
+# Tiny grids: two cheap trees, and a booster with far more rounds than it needs so early stopping has to kick in
+TINY_GRIDS = {
+    'DecisionTreeClassifier': {'max_depth': [2, 3], 'random_state': [0]},
+    'LGBMClassifier': {'num_leaves': [4], 'learning_rate': [0.3], 'n_estimators': [500], 'n_jobs': [1],
+                       'verbose': [-1], 'random_state': [0]},
+}
+
+
+def synthetic_training_data(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 4))
+    y = (X[:, 0] + 0.5 * rng.normal(size=n) > 0).astype(int)
+    return {'tree': X, 'linear': X}, y
+
+
+@pytest.fixture
+def pipeline_dirs(tmp_path, monkeypatch):
+    models_dir = tmp_path / 'saved_models'
+    models_dir.mkdir()
+    monkeypatch.setattr(model_pipeline, 'PARAM_GRIDS', TINY_GRIDS)
+    monkeypatch.setattr(model_pipeline, 'FOLDS_DIR', str(tmp_path / 'cv_folds'))
+    monkeypatch.setattr(model_pipeline, 'SAVED_MODELS_DIR', str(models_dir))
+    monkeypatch.setattr(model_pipeline, 'MANIFEST_PATH', str(models_dir / 'manifest.json'))
+    monkeypatch.setattr(model_pipeline, 'load_training_data', lambda path: synthetic_training_data())
+    return tmp_path
+
+
+def test_folds_are_computed_once_then_read_back(tmp_path, monkeypatch):
+    _, y = synthetic_training_data()
+    folds = model_pipeline.cached_folds(y, n_splits=3, folds_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+    # A second call must come from the cache, not from a new split
+    import sklearn.model_selection
+
+    def fail(*args, **kwargs):
+        raise AssertionError("folds recomputed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(sklearn.model_selection, 'StratifiedKFold', fail)
+        cached = model_pipeline.cached_folds(y, n_splits=3, folds_dir=str(tmp_path))
+    for (train, val), (cached_train, cached_val) in zip(folds, cached):
+        np.testing.assert_array_equal(train, cached_train)
+        np.testing.assert_array_equal(val, cached_val)
+
+    # Other settings get their own folds
+    model_pipeline.cached_folds(y, n_splits=4, folds_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_boosters_are_early_stopped():
+    feature_sets, y = synthetic_training_data()
+    X = feature_sets['tree']
+    params = model_pipeline.param_combinations(TINY_GRIDS['LGBMClassifier'])[0]
+    model, rounds = model_pipeline.fit_model('LGBMClassifier', params, X[:300], y[:300], X[300:], y[300:])
+    assert 0 < rounds < params['n_estimators']
+    assert model.best_iteration_ == rounds
+
+
+def test_pipeline_saves_versions_and_promotes(pipeline_dirs):
+    entries = model_pipeline.run_pipeline(models=list(TINY_GRIDS), workers=1, n_splits=3, promote=True)
+    models_dir = pipeline_dirs / 'saved_models'
+
+    assert [entry['name'] for entry in entries] == list(TINY_GRIDS)
+    assert len(os.listdir(pipeline_dirs / 'cv_folds')) == 1
+    for entry in entries:
+        version_path = models_dir / f"{entry['name']}_{entry['version']}.pkl"
+        promoted_path = models_dir / f"{entry['name']}.pkl"
+        assert entry['promoted']
+        assert promoted_path.read_bytes() == version_path.read_bytes()
+
+    # The booster is refitted with the early-stopped round count, not the grid's ceiling
+    assert entries[0]['params']['max_depth'] in TINY_GRIDS['DecisionTreeClassifier']['max_depth']
+    assert entries[1]['params']['n_estimators'] < 500
+
+    manifest = json.loads((models_dir / 'manifest.json').read_text())
+    assert sorted(manifest) == sorted(TINY_GRIDS)
+
+
+def test_pipeline_without_promote_leaves_the_app_models(pipeline_dirs):
+    models_dir = pipeline_dirs / 'saved_models'
+    (models_dir / 'DecisionTreeClassifier.pkl').write_bytes(b'current')
+
+    entries = model_pipeline.run_pipeline(models=['DecisionTreeClassifier'], workers=1, n_splits=3)
+    assert not entries[0]['promoted']
+    assert (models_dir / 'DecisionTreeClassifier.pkl').read_bytes() == b'current'
+    assert (models_dir / f"DecisionTreeClassifier_{entries[0]['version']}.pkl").exists()
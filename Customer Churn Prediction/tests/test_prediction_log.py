@@ -0,0 +1,92 @@
+import os
+
+import pandas as pd
+import pytest
+
+from helper_functions.prediction_log import COMPACTION_MARKER, PredictionLog
+
+
+def write_segments(log, batches=3):
+    for batch in range(batches):
+        log.append(pd.DataFrame({'customerID': [f'{batch}-A', f'{batch}-B']}), [0.1, 0.9], [0, 1])
+        log.flush()
+
+
+def segment_files(log):
+    (partition,) = log.partitions()
+    return sorted(name for name in os.listdir(os.path.join(log.root, f'date={partition}'))
+                  if name.endswith('.parquet'))
+
+
+def test_compact_merges_segments(tmp_path):
+    log = PredictionLog(root=str(tmp_path))
+    write_segments(log)
+
+    assert log.compact() == 3
+    assert [name.split('-')[0] for name in segment_files(log)] == ['compacted']
+    assert sorted(log.scan(columns=['customerID'])['customerID']) == ['0-A', '0-B', '1-A', '1-B', '2-A', '2-B']
+
+
+def test_interrupted_compaction_is_finished_not_double_counted(tmp_path, monkeypatch):
+    log = PredictionLog(root=str(tmp_path))
+    write_segments(log)
+
+    # Die after the merged segment is published, before the originals are removed
+    finish = PredictionLog._finish_compaction
+
+    def crash(partition_dir):
+        if os.path.exists(os.path.join(partition_dir, COMPACTION_MARKER)):
+            raise RuntimeError("killed")
+        finish(partition_dir)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(PredictionLog, '_finish_compaction', staticmethod(crash))
+        with pytest.raises(RuntimeError):
+            log.compact()
+    assert len(segment_files(log)) == 4
+
+    # The next scan completes the removal instead of reading the rows twice
+    assert len(log.scan()) == 6
+    assert [name.split('-')[0] for name in segment_files(log)] == ['compacted']
+
+
+def test_compaction_interrupted_before_publishing_keeps_the_originals(tmp_path, monkeypatch):
+    log = PredictionLog(root=str(tmp_path))
+    write_segments(log)
+    originals = segment_files(log)
+
+    publish = PredictionLog._publish
+
+    def crash(table, partition_dir, name):
+        if name.startswith('compacted'):
+            raise RuntimeError("killed")
+        return publish(table, partition_dir, name)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(PredictionLog, '_publish', staticmethod(crash))
+        with pytest.raises(RuntimeError):
+            log.compact()
+
+    assert len(log.scan()) == 6
+    assert segment_files(log) == originals
+    assert log.compact() == 3
+    assert len(log.scan()) == 6
+
+
+def test_failed_write_keeps_the_rows_buffered(tmp_path, monkeypatch, caplog):
+    log = PredictionLog(root=str(tmp_path), flush_rows=2)
+
+    def disk_full(table, partition_dir, name):
+        raise OSError("No space left on device")
+
+    # The request that crosses flush_rows does not see the failure
+    with monkeypatch.context() as patch:
+        patch.setattr(PredictionLog, '_publish', staticmethod(disk_full))
+        log.append(pd.DataFrame({'customerID': ['A']}), [0.1], [0])
+        log.append(pd.DataFrame({'customerID': ['B']}), [0.9], [1])
+        assert not log.flush()
+    assert "keeping them buffered" in caplog.text
+
+    log.append(pd.DataFrame({'customerID': ['C']}), [0.5], [1])
+    assert log.flush()
+    assert log.scan(columns=['customerID'])['customerID'].tolist() == ['A', 'B', 'C']
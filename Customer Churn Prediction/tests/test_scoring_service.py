@@ -0,0 +1,53 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import scoring_service
+
+
+def test_shadow_work_runs_off_the_caller_thread_and_is_bounded(monkeypatch):
+    release = threading.Event()
+    threads = []
+
+    def slow_comparison(data, models=None):
+        threads.append(threading.current_thread().name)
+        release.wait(5)
+        future = Future()
+        future.set_result(None)
+        return data.index, {'model': future}
+
+    monkeypatch.setattr(scoring_service, 'submit_comparison', slow_comparison)
+    monkeypatch.setattr(scoring_service, '_shadow_slots', threading.BoundedSemaphore(2))
+    monkeypatch.setattr(scoring_service, '_shadow_stats', {'submitted': 0, 'dropped': 0})
+
+    start = time.perf_counter()
+    queued = [scoring_service.shadow_score([{'customerID': str(i)}]) for i in range(5)]
+    assert time.perf_counter() - start < 0.5
+    assert queued == [True, True, False, False, False]
+    assert scoring_service.shadow_stats() == {'submitted': 2, 'dropped': 3}
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while len(threads) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert threads and all(name.startswith('shadow') for name in threads)
+
+    # Slots are given back once the jobs finish
+    while not scoring_service._shadow_slots.acquire(blocking=False):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_bad_record_only_fails_its_own_request(monkeypatch):
+    def score(records):
+        if any(record.get('customerID') == 'bad' for record in records):
+            raise ValueError('cannot score')
+        return [{'customerID': record['customerID'], 'probability': 0.5, 'prediction': 1} for record in records]
+
+    monkeypatch.setattr(scoring_service, 'score_records', score)
+    batcher = scoring_service.MicroBatcher(max_batch_size=3, max_wait=0.5)
+    futures = [batcher.submit({'customerID': name}) for name in ('a', 'bad', 'c')]
+
+    assert futures[0].result(5)['customerID'] == 'a'
+    assert isinstance(futures[1].exception(5), ValueError)
+    assert futures[2].result(5)['customerID'] == 'c'
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from helper_functions.prediction_log import PredictionLog
+from helper_functions.threshold_calibration import ThresholdRecalibrator
+from recalibrate_threshold import labelled_scores
+
+
+def make_log(root, customer_ids, probabilities):
+    log = PredictionLog(root=str(root))
+    log.append(pd.DataFrame({'customerID': customer_ids}), probabilities, [int(p >= 0.5) for p in probabilities])
+    log.flush()
+    return log
+
+
+def test_rerun_does_not_count_outcomes_twice(tmp_path):
+    log = make_log(tmp_path / 'log', ['A', 'B', 'C'], [0.2, 0.6, 0.9])
+    outcomes = tmp_path / 'outcomes.csv'
+    pd.DataFrame({'customerID': ['A', 'B'], 'Churn': ['No', 'Yes']}).to_csv(outcomes, index=False)
+    state = tmp_path / 'state.npz'
+
+    recalibrator = ThresholdRecalibrator()
+    labelled = labelled_scores(str(outcomes), log)
+    assert recalibrator.update_many(labelled['probability'], labelled['churned'], keys=labelled['key']) == 2
+    recalibrator.save(str(state))
+
+    # Same file again, then a grown file: only the new outcome is counted
+    resumed = ThresholdRecalibrator.load(str(state))
+    labelled = labelled_scores(str(outcomes), log)
+    assert resumed.update_many(labelled['probability'], labelled['churned'], keys=labelled['key']) == 0
+
+    pd.DataFrame({'customerID': ['A', 'B', 'C'], 'Churn': ['No', 'Yes', 'Yes']}).to_csv(outcomes, index=False)
+    labelled = labelled_scores(str(outcomes), log)
+    assert resumed.update_many(labelled['probability'], labelled['churned'], keys=labelled['key']) == 1
+    assert resumed.seen == 3
+    np.testing.assert_array_equal(resumed.churned.nonzero()[0], [60, 90])
+
+    # The saved state is a single watermark, however many outcomes were counted
+    resumed.save(str(state))
+    with np.load(state) as saved:
+        assert saved['watermark'].shape == ()
+        assert str(saved['watermark']) == labelled['key'].iloc[-1]
+
+
+def test_rescored_customer_counts_again(tmp_path):
+    recalibrator = ThresholdRecalibrator()
+    keys = ['2026-01-01T00:00:00.000000|A', '2026-02-01T00:00:00.000000|A']
+    assert recalibrator.update_many([0.3, 0.3], [1, 1], keys=keys) == 2
+    assert recalibrator.update_many([0.3], [1], keys=keys[1:]) == 0
+    assert recalibrator.update_many([0.3], [1], keys=['2026-03-01T00:00:00.000000|A']) == 1
@@ -0,0 +1,106 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+
+from tree_export import CHECK_FEATURES_PATH, export_model
+
+
+def make_data(rows=400, features=6, seed=0):
+    """
+    Small binary problem with a few missing values, so the exported missing-value routing is exercised too.
+    """
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, features))
+    y = (X[:, 0] + 0.5 * X[:, 1] - X[:, 2] * X[:, 3] + rng.normal(scale=0.5, size=rows) > 0).astype(int)
+    X[rng.random(X.shape) < 0.05] = np.nan
+    return X, y
+
+
+def assert_parity(model, X, atol):
+    names = [f'f{i}' for i in range(X.shape[1])]
+    packed = export_model(model, feature_names=names)
+    expected = np.asarray(model.predict_proba(X))[:, 1]
+    np.testing.assert_allclose(packed.predict_proba(X)[:, 1], expected, rtol=0, atol=atol)
+
+
+def test_check_features_path_exists():
+    assert os.path.exists(CHECK_FEATURES_PATH)
+
+
+@pytest.mark.parametrize('name', ['DecisionTreeClassifier', 'RandomForestClassifier', 'ExtraTreesClassifier'])
+def test_sklearn_parity(name):
+    ensemble = pytest.importorskip('sklearn.ensemble')
+    tree = pytest.importorskip('sklearn.tree')
+    estimator = getattr(ensemble, name, None) or getattr(tree, name)
+    kwargs = {} if name == 'DecisionTreeClassifier' else {'n_estimators': 20}
+    X, y = make_data()
+    model = estimator(max_depth=5, random_state=0, **kwargs).fit(X, y)
+    assert_parity(model, X, atol=1e-12)
+
+
+def test_xgboost_parity():
+    xgboost = pytest.importorskip('xgboost')
+    X, y = make_data()
+    model = xgboost.XGBClassifier(n_estimators=30, max_depth=4, random_state=0).fit(X, y)
+    # XGBoost sums the leaves in float32
+    assert_parity(model, X, atol=1e-6)
+
+
+def test_xgboost_early_stopping_parity():
+    xgboost = pytest.importorskip('xgboost')
+    X, y = make_data()
+    model = xgboost.XGBClassifier(n_estimators=200, max_depth=4, random_state=0, early_stopping_rounds=5,
+                                  eval_metric='auc')
+    model.fit(X[:300], y[:300], eval_set=[(X[300:], y[300:])], verbose=False)
+    assert_parity(model, X, atol=1e-6)
+
+
+def test_lightgbm_parity():
+    lightgbm = pytest.importorskip('lightgbm')
+    X, y = make_data()
+    model = lightgbm.LGBMClassifier(n_estimators=30, num_leaves=8, random_state=0, verbose=-1).fit(X, y)
+    assert_parity(model, X, atol=1e-12)
+
+
+def test_catboost_parity():
+    catboost = pytest.importorskip('catboost')
+    X, y = make_data()
+    model = catboost.CatBoostClassifier(iterations=30, depth=4, random_seed=0, verbose=False,
+                                        allow_writing_files=False).fit(X, y)
+    assert_parity(model, X, atol=1e-12)
+
+
+def test_soft_voting_parity():
+    ensemble = pytest.importorskip('sklearn.ensemble')
+    xgboost = pytest.importorskip('xgboost')
+    lightgbm = pytest.importorskip('lightgbm')
+    X, y = make_data()
+    model = ensemble.VotingClassifier([
+        ('rf', ensemble.RandomForestClassifier(n_estimators=10, max_depth=4, random_state=0)),
+        ('xgb', xgboost.XGBClassifier(n_estimators=20, max_depth=3, random_state=0)),
+        ('lgbm', lightgbm.LGBMClassifier(n_estimators=20, num_leaves=8, random_state=0, verbose=-1)),
+    ], voting='soft', weights=[1, 2, 1]).fit(X, y)
+    assert_parity(model, X, atol=1e-6)
+
+
+def test_export_refuses_without_check_data(tmp_path, monkeypatch):
+    tree = pytest.importorskip('sklearn.tree')
+    import tree_export
+
+    X, y = make_data()
+    model_path = tmp_path / 'model.pkl'
+    joblib.dump(tree.DecisionTreeClassifier(max_depth=3, random_state=0).fit(X, y), model_path)
+    output = tmp_path / 'model.npz'
+
+    monkeypatch.setattr(tree_export, 'STORE_DIR', str(tmp_path / 'no_store'))
+    monkeypatch.setattr(tree_export, 'CHECK_DATA_PATH', str(tmp_path / 'missing.pkl'))
+    monkeypatch.setattr('sys.argv', ['tree_export.py', str(model_path), '--output', str(output)])
+    with pytest.raises(SystemExit, match='No data to verify'):
+        tree_export.main()
+    assert not output.exists()
+
+    monkeypatch.setattr('sys.argv', ['tree_export.py', str(model_path), '--output', str(output), '--no-check'])
+    tree_export.main()
+    assert output.exists()
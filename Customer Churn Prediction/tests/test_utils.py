@@ -0,0 +1,80 @@
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+import utils
+from utils import calculate_vif, permutation_importance
+
+
+def collinear_frame(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    a = rng.normal(5, 1, n)
+    b = rng.normal(2, 3, n)
+    return pd.DataFrame({'a': a, 'b': b, 'c': a + 0.5 * b + rng.normal(0, 0.5, n), 'd': rng.uniform(0, 10, n)})
+
+
+def statsmodels_vif(exog, standardize):
+    # statsmodels 0.15 added `standardize` (default True); earlier releases always used the raw columns
+    kwargs = {}
+    if 'standardize' in inspect.signature(variance_inflation_factor).parameters:
+        kwargs['standardize'] = standardize
+    elif standardize:
+        exog = (exog - exog.mean(axis=0)) / exog.std(axis=0)
+    return [variance_inflation_factor(exog, i, **kwargs) for i in range(exog.shape[1])]
+
+
+def test_vif_default_matches_statsmodels():
+    data = collinear_frame()
+    result = calculate_vif(data)
+    assert list(result['feature']) == list(data.columns)
+    np.testing.assert_allclose(result['VIF'], statsmodels_vif(data.values, standardize=False), rtol=1e-8)
+
+
+def test_centered_vif_matches_standardized_statsmodels():
+    data = collinear_frame()
+    np.testing.assert_allclose(calculate_vif(data, center=True)['VIF'], statsmodels_vif(data.values, standardize=True),
+                               rtol=1e-8)
+
+
+class ThresholdModel:
+    """Predicts churn from the first column only."""
+
+    def predict(self, X):
+        return (np.asarray(X)[:, 0] > 0).astype(int)
+
+    def predict_proba(self, X):
+        p = 1 / (1 + np.exp(-np.asarray(X)[:, 0]))
+        return np.column_stack([1 - p, p])
+
+
+def test_in_process_permutation_importance_releases_the_model():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(int)
+
+    result = permutation_importance(ThresholdModel(), X, y, n_repeats=3, n_jobs=1)
+    assert result.importances_mean[0] > 0
+    np.testing.assert_array_equal(result.importances_mean[1:], 0)
+    assert utils._permutation_state == {}
+
+    # Also when scoring fails part-way (here on the first shuffled copy, after the baseline)
+    calls = []
+
+    def failing_metric(y_true, scores):
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("metric failed")
+        return 1.0
+
+    with pytest.raises(RuntimeError):
+        permutation_importance(ThresholdModel(), X, y, n_repeats=3, scoring=failing_metric, n_jobs=1)
+    assert utils._permutation_state == {}
+
+
+def test_roc_auc_rejects_a_single_class():
+    assert utils._roc_auc(np.array([0, 1, 1, 0]), np.array([0.1, 0.8, 0.6, 0.3])) == 1.0
+    with pytest.raises(ValueError, match="single class"):
+        utils._roc_auc(np.zeros(4, dtype=int), np.array([0.1, 0.8, 0.6, 0.3]))
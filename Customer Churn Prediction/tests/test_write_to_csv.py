@@ -0,0 +1,62 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from helper_functions.write_to_csv import BackgroundCSVWriter
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    calls = []
+    sync = os.fsync
+    monkeypatch.setattr(os, 'fsync', lambda fd: calls.append(fd) or sync(fd))
+    return calls
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def row(customer_id):
+    return pd.DataFrame({'customerID': [customer_id], 'tenure': [1]})
+
+
+def test_interval_syncs_the_first_batch_and_on_close(tmp_path, fsyncs):
+    path = tmp_path / 'customers.csv'
+    writer = BackgroundCSVWriter(str(path), fsync='interval', fsync_interval=60)
+
+    writer.write(row('A'))
+    wait_for(lambda: len(fsyncs) == 1)
+
+    # Inside the interval: written but not synced until close
+    writer.write(row('B'))
+    wait_for(lambda: path.read_text().count('\n') == 3)
+    assert len(fsyncs) == 1
+
+    writer.close()
+    assert len(fsyncs) == 2
+    assert pd.read_csv(path)['customerID'].tolist() == ['A', 'B']
+
+
+def test_interval_syncs_a_quiet_batch_once_the_interval_passes(tmp_path, fsyncs):
+    writer = BackgroundCSVWriter(str(tmp_path / 'customers.csv'), fsync='interval', fsync_interval=0.2)
+    writer.write(row('A'))
+    wait_for(lambda: len(fsyncs) == 1)
+
+    # B lands inside the interval and nothing follows it, yet it is synced once the interval has passed
+    writer.write(row('B'))
+    wait_for(lambda: len(fsyncs) == 2)
+    writer.close()
+    assert len(fsyncs) == 2
+
+
+def test_never_does_not_sync(tmp_path, fsyncs):
+    writer = BackgroundCSVWriter(str(tmp_path / 'customers.csv'), fsync='never')
+    writer.write(row('A'))
+    writer.close()
+    assert fsyncs == []